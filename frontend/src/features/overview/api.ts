@@ -1,53 +1,23 @@
 import { parseISO } from 'date-fns'
 import { apiFetch } from '../../lib/api'
 import { formatDateLabel, parseApiDate } from '../../utils/format'
-import type {
-  DailyActivityResponse,
-  MetricsSummaryResponse,
-  NewCustomersResponse,
-  OverviewData,
-  OverviewFilters,
-  ReportsOverviewResponse,
-  TestsLabelDistributionResponse,
-  TestsTatDailyResponse,
-  TopCustomersResponse,
-} from './types'
+import type { MetricsDashboardResponse, OverviewData, OverviewFilters } from './types'
 
 export async function fetchOverviewData(filters: OverviewFilters): Promise<OverviewData> {
-  const baseParams = {
-    date_from: filters.dateFrom,
-    date_to: filters.dateTo,
-  }
-
-  const [
+  const {
     summary,
     reports,
     activity,
-    newCustomers,
-    topCustomers,
-    labelDistribution,
-    tatDaily,
-  ] = await Promise.all([
-    apiFetch<MetricsSummaryResponse>('/metrics/summary', baseParams),
-    apiFetch<ReportsOverviewResponse>('/metrics/reports/overview', baseParams),
-    apiFetch<DailyActivityResponse>('/metrics/activity/daily', {
-      ...baseParams,
-      compare_previous: 'false',
-    }),
-    apiFetch<NewCustomersResponse>('/metrics/customers/new', {
-      ...baseParams,
-      limit: 10,
-    }),
-    apiFetch<TopCustomersResponse>('/metrics/customers/top-tests', {
-      ...baseParams,
-      limit: 10,
-    }),
-    apiFetch<TestsLabelDistributionResponse>('/metrics/tests/label-distribution', baseParams),
-    apiFetch<TestsTatDailyResponse>('/metrics/tests/tat-daily', {
-      ...baseParams,
-      moving_average_window: filters.timeframe === 'weekly' ? 14 : 7,
-    }),
-  ])
+    new_customers: newCustomers,
+    top_customers: topCustomers,
+    label_distribution: labelDistribution,
+    tat_daily: tatDaily,
+  } = await apiFetch<MetricsDashboardResponse>('/metrics/dashboard', {
+    date_from: filters.dateFrom,
+    date_to: filters.dateTo,
+    limit: 10,
+    moving_average_window: filters.timeframe === 'weekly' ? 14 : 7,
+  })
 
   const movingAverageMap = new Map<string, number | null>()
   tatDaily.moving_average_hours?.forEach((item) => {
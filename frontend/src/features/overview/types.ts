@@ -79,6 +79,16 @@ export interface TestsTatDailyResponse {
   }>
 }
 
+export interface MetricsDashboardResponse {
+  summary: MetricsSummaryResponse
+  reports: ReportsOverviewResponse
+  activity: DailyActivityResponse
+  new_customers: NewCustomersResponse
+  top_customers: TopCustomersResponse
+  label_distribution: TestsLabelDistributionResponse
+  tat_daily: TestsTatDailyResponse
+}
+
 export interface OverviewData {
   summary: {
     samples: number
@@ -0,0 +1,44 @@
+"""Conexión compartida a PostgreSQL para los scripts de mantenimiento.
+
+``get_engine("azure")`` usa las variables ``POSTGRES_*`` y ``get_engine("local")``
+las ``LOCAL_POSTGRES_*``. El engine se cachea por proceso, así que los helpers
+que se importan entre sí reutilizan el mismo pool de conexiones.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+load_dotenv()
+
+_ENV_PREFIX = {"azure": "POSTGRES", "local": "LOCAL_POSTGRES"}
+
+
+@lru_cache(maxsize=None)
+def get_engine(flavor: Literal["azure", "local"] = "azure") -> Engine:
+    """Devuelve el engine (cacheado) para la base de datos indicada."""
+    prefix = _ENV_PREFIX[flavor]
+    host = os.getenv(f"{prefix}_HOST")
+    port = os.getenv(f"{prefix}_PORT")
+    db = os.getenv(f"{prefix}_DB")
+    user = os.getenv(f"{prefix}_USER")
+    pw = os.getenv(f"{prefix}_PASSWORD")
+
+    script_name = Path(sys.argv[0]).stem or "interactive"
+    return create_engine(
+        f"postgresql+psycopg2://{user}:{pw}@{host}:{port}/{db}",
+        pool_pre_ping=True,
+        pool_size=5,
+        # Azure cierra conexiones inactivas; reciclarlas evita bloqueos en el siguiente script
+        pool_recycle=300,
+        connect_args={
+            "application_name": f"scripts/{script_name}",
+            "options": "-c statement_timeout=60000",
+        },
+    )
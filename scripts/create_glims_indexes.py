@@ -0,0 +1,167 @@
+import os
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+# tabla de resultados -> (fecha principal, fecha alternativa); igual que ASSAY_TABLES en glims_overview
+ASSAY_DATE_COLUMNS = {
+    "glims_cn_results": ("prep_date", "start_date"),
+    "glims_tp_results": ("prep_date", "start_date"),
+    "glims_ps_results": ("prep_date", "start_date"),
+    "glims_hm_results": ("prep_date", "start_date"),
+    "glims_rs_results": ("prep_date", "start_date"),
+    "glims_my_results": ("prep_date", "start_date"),
+    "glims_mb_results": ("tempo_prep_date", "ac_cc_eb_read_date"),
+    "glims_wa_results": ("prep_date", "start_date"),
+    "glims_mc_results": ("prep_date", "start_date"),
+    "glims_pn_results": ("prep_date", "start_date"),
+    "glims_ffm_results": ("analysis_date", "analysis_date"),
+    "glims_lw_results": ("run_date", "run_date"),
+    "glims_ho_results": ("prep_date", "start_date"),
+}
+
+
+# tabla de resultados -> (fecha de prep, fecha de inicio); igual que ASSAY_TABLES en glims_tests
+TESTS_DATE_COLUMNS = {
+    "glims_cn_results": ("prep_date", "start_date"),
+    "glims_tp_results": ("prep_date", "start_date"),
+    "glims_ps_results": ("prep_date", "start_date"),
+    "glims_hm_results": ("prep_date", "start_date"),
+    "glims_rs_results": ("prep_date", "start_date"),
+    "glims_my_results": ("prep_date", "start_date"),
+    "glims_mb_results": (
+        "tempo_prep_date",
+        "GREATEST(ac_cc_eb_read_date, ym_read_date, sal_read_date, stec_read_date)",
+    ),
+    "glims_wa_results": ("prep_date", "start_date"),
+    "glims_mc_results": ("prep_date", "start_date"),
+    "glims_pn_results": ("prep_date", "start_date"),
+    "glims_ffm_results": ("analysis_date", "analysis_date"),
+    "glims_lw_results": ("run_date", "run_date"),
+    "glims_ho_results": ("prep_date", "start_date"),
+}
+
+
+def assay_index_sql() -> str:
+    """Índices de cada tabla de ensayos: sample_id, fecha efectiva y fechas de prep / inicio."""
+    statements = []
+    for table, (date_a, date_b) in ASSAY_DATE_COLUMNS.items():
+        # Ensayos de unas pocas muestras (priority most-overdue)
+        statements.append(f"CREATE INDEX IF NOT EXISTS idx_{table}_sample_id ON {table} (sample_id);")
+        statements.append(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_effdate ON {table} ((COALESCE({date_a}, {date_b})));"
+        )
+        # Resultados sin fecha propia: usan date_received de la muestra
+        statements.append(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_undated ON {table} (sample_id) "
+            f"WHERE {date_a} IS NULL AND {date_b} IS NULL;"
+        )
+    # Rangos de /api/v2/glims/tests: un índice por fecha de prep y por fecha de inicio
+    for table, (prep_col, start_col) in TESTS_DATE_COLUMNS.items():
+        statements.append(f"CREATE INDEX IF NOT EXISTS idx_{table}_prep ON {table} (({prep_col}));")
+        if start_col != prep_col:
+            statements.append(f"CREATE INDEX IF NOT EXISTS idx_{table}_start ON {table} (({start_col}));")
+    return "\n".join(statements)
+
+
+def test_events_view_sql() -> str:
+    """Vista materializada con un evento por resultado de ensayo (etiqueta, muestra y fecha efectiva).
+
+    El overview la lee con GLIMS_TEST_EVENTS_VIEW=1; run_sync_glims.py la refresca al final de cada sync.
+    """
+    branches = " UNION ALL ".join(
+        f"SELECT '{table.removeprefix('glims_').removesuffix('_results').upper()}'::text AS label, r.sample_id, "
+        f"COALESCE(r.{date_a}, r.{date_b}, s.date_received) AS d, s.adult_use_medical, s.dispensary_id "
+        f"FROM {table} r JOIN glims_samples s ON s.sample_id = r.sample_id"
+        for table, (date_a, date_b) in ASSAY_DATE_COLUMNS.items()
+    )
+    return f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS glims_test_events AS {branches};
+    CREATE INDEX IF NOT EXISTS idx_glims_test_events_d ON glims_test_events (d);
+    CREATE INDEX IF NOT EXISTS idx_glims_test_events_dispensary_d ON glims_test_events (dispensary_id, d);
+    """
+
+
+def tests_by_sample_view_sql() -> str:
+    """Vista materializada con el conteo de ensayos (total y completados) por muestra y etiqueta.
+
+    Priority y TAT la leen con GLIMS_TESTS_BY_SAMPLE_VIEW=1 en lugar de la unión de las tablas de
+    resultados; el índice único permite REFRESH ... CONCURRENTLY desde run_sync_glims.py.
+    """
+    branches = " UNION ALL ".join(
+        f"SELECT '{table.removeprefix('glims_').removesuffix('_results').upper()}'::text AS label, "
+        f"sample_id, status FROM {table}"
+        for table in ASSAY_DATE_COLUMNS
+    )
+    return f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS glims_tests_by_sample AS
+        SELECT sample_id, label,
+               COUNT(*) AS tests_total,
+               COUNT(*) FILTER (WHERE status = 'Completed') AS tests_complete
+        FROM ({branches}) t
+        WHERE sample_id IS NOT NULL
+        GROUP BY sample_id, label;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_glims_tests_by_sample_sample_label
+        ON glims_tests_by_sample (sample_id, label);
+    """
+
+
+def migrate():
+    load_dotenv()
+    host = os.environ.get("POSTGRES_HOST", "localhost")
+    port = os.environ.get("POSTGRES_PORT", "5432")
+    db = os.environ["POSTGRES_DB"]
+    user = os.environ["POSTGRES_USER"]
+    password = os.environ["POSTGRES_PASSWORD"]
+    url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db}"
+    engine = create_engine(url)
+
+    sql = r"""
+    -- Marca precalculada de muestras excluidas (sufijos HO1/HO2 y -1/-2/-3/-N);
+    -- evita evaluar la regex por fila en cada consulta
+    ALTER TABLE glims_samples
+        ADD COLUMN IF NOT EXISTS is_excluded boolean
+        GENERATED ALWAYS AS (sample_id ~ '(-HO[12](-\d+)?)$|(-(1|2|3|N))$') STORED;
+
+    -- Muestras abiertas (sin reporte): filtro de overdue / priority por fecha de recepción
+    CREATE INDEX IF NOT EXISTS idx_glims_samples_open_date_received
+        ON glims_samples(date_received)
+        WHERE report_date IS NULL;
+
+    -- Muestras activas (no excluidas) sin reporte
+    CREATE INDEX IF NOT EXISTS idx_glims_samples_active
+        ON glims_samples(date_received)
+        WHERE NOT is_excluded AND report_date IS NULL;
+
+    -- Rangos de fecha del overview (intake, reportes y filtro por dispensary).
+    -- Los índices de date_received / report_date incluyen las columnas que agrega el overview
+    -- (index-only scan); reemplazan a los índices simples de versiones anteriores de este script.
+    CREATE INDEX IF NOT EXISTS idx_glims_samples_date_received_covering
+        ON glims_samples(date_received)
+        INCLUDE (dispensary_id, report_date, adult_use_medical, status);
+    DROP INDEX IF EXISTS idx_glims_samples_date_received;
+    CREATE INDEX IF NOT EXISTS idx_glims_samples_report_date_covering
+        ON glims_samples(report_date)
+        INCLUDE (dispensary_id, date_received, adult_use_medical)
+        WHERE report_date IS NOT NULL;
+    DROP INDEX IF EXISTS idx_glims_samples_report_date;
+
+    -- Mismo rango filtrado por dispensary (intake y reportes), también cubrientes
+    CREATE INDEX IF NOT EXISTS idx_glims_samples_dispensary_date_received_covering
+        ON glims_samples(dispensary_id, date_received)
+        INCLUDE (report_date, adult_use_medical, status);
+    DROP INDEX IF EXISTS idx_glims_samples_dispensary_date_received;
+    CREATE INDEX IF NOT EXISTS idx_glims_samples_dispensary_report_date
+        ON glims_samples(dispensary_id, report_date)
+        INCLUDE (date_received, adult_use_medical)
+        WHERE report_date IS NOT NULL;
+
+    -- Conteo de nuevos clientes por rango de fecha
+    CREATE INDEX IF NOT EXISTS idx_glims_new_customers_date_created ON glims_new_customers(date_created);
+    """ + assay_index_sql() + test_events_view_sql() + tests_by_sample_view_sql()
+    
+    with engine.begin() as conn:
+        conn.execute(text(sql))
+        print("GLIMS indices created successfully.")
+
+if __name__ == "__main__":
+    migrate()
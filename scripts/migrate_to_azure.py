@@ -34,6 +34,8 @@ TABLES_RESULTS = [
     "glims_ho_results"
 ]
 
+GENERATED_COLUMNS = {"is_excluded"}
+
 def get_local_engine():
     """Conexión a la base de datos local (Origen)."""
     host = os.getenv("LOCAL_POSTGRES_HOST")
@@ -92,7 +94,8 @@ def migrate_table(src_engine, dst_engine, table_name, query, dry_run=True, batch
         return len(rows)
 
     # 2. Insertar en Azure
-    cols = list(rows[0].keys())
+    # Las columnas generadas (p.ej. glims_samples.is_excluded) las calcula Postgres
+    cols = [c for c in rows[0].keys() if c not in GENERATED_COLUMNS]
     
     # Determinar estrategia de ON CONFLICT
     pk_map = {
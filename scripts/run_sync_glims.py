@@ -151,6 +151,22 @@ def finish_sync_run(engine: Engine, run_id: int, status: str, message: str | Non
         conn.execute(text(sql), {"status": status, "message": message, "run_id": run_id})
 
 
+def refresh_test_events(engine: Engine) -> None:
+    """Rebuild the glims_test_events materialized view (if deployed) from the freshly synced tables."""
+    with engine.begin() as conn:
+        exists = conn.execute(text("SELECT to_regclass('glims_test_events') IS NOT NULL")).scalar_one()
+        if exists:
+            conn.execute(text("REFRESH MATERIALIZED VIEW glims_test_events"))
+
+
+def refresh_tests_by_sample(engine: Engine) -> None:
+    """Rebuild the glims_tests_by_sample view (if deployed) without blocking API readers."""
+    with engine.begin() as conn:
+        exists = conn.execute(text("SELECT to_regclass('glims_tests_by_sample') IS NOT NULL")).scalar_one()
+        if exists:
+            conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY glims_tests_by_sample"))
+
+
 def fetch_df(sh: gspread.Spreadsheet, tab: str) -> pd.DataFrame:
     """Return a DataFrame from the given tab, making headers unique if needed."""
 
@@ -1294,6 +1310,16 @@ def main() -> None:
         strip_numeric_suffix=True,
     )
 
+    # Before marking success: the success timestamp is what invalidates the API caches
+    try:
+        refresh_test_events(engine)
+    except SQLAlchemyError as exc:  # noqa: BLE001
+        LOGGER.warning("Could not refresh glims_test_events: %s", exc)
+    try:
+        refresh_tests_by_sample(engine)
+    except SQLAlchemyError as exc:  # noqa: BLE001
+        LOGGER.warning("Could not refresh glims_tests_by_sample: %s", exc)
+
     LOGGER.info("Completed GLIMS sync. Samples processed: %s", len(sample_ids))
     LOGGER.info("Summary per tab:")
     for entry in results:
@@ -2,7 +2,7 @@
 Script standalone para sincronizar datos del tab RS a glims_rs_results_raw.
 
 Uso:
-    python scripts/run_sync_rs_raw.py [--spreadsheet-id <ID>] [--dry-run]
+    python scripts/run_sync_rs_raw.py [--spreadsheet-id <ID>] [--dry-run] [--dedup]
 
 Este script es para testing. Una vez aprobado, la lógica se integrará
 en run_sync_glims.py
@@ -14,6 +14,7 @@ import argparse
 import os
 import re
 import logging
+from datetime import date
 from typing import Any
 
 import gspread
@@ -41,7 +42,8 @@ def build_engine() -> Engine:
     db = os.environ["POSTGRES_DB"]
     user = os.environ["POSTGRES_USER"]
     password = os.environ["POSTGRES_PASSWORD"]
-    url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db}"
+    # psycopg3: permite pipeline mode en la carga (ver sync_rs_raw)
+    url = f"postgresql+psycopg://{user}:{password}@{host}:{port}/{db}"
     return create_engine(url, future=True, pool_pre_ping=True)
 
 
@@ -154,7 +156,19 @@ def normalize_sample_id_clean(raw: str) -> str:
     return sid.upper()
 
 
-def sync_rs_raw(engine: Engine, df: pd.DataFrame, dry_run: bool = False) -> int:
+def dedupe_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Deja una sola fila por (sample_id_clean, prep_date): la de start_date más reciente."""
+    ordered = sorted(
+        rows,
+        key=lambda r: (r["start_date"] is not None, r["start_date"] or date.min),
+    )
+    latest: dict[tuple[str, Any], dict[str, Any]] = {}
+    for row in ordered:
+        latest[(row["sample_id_clean"], row["prep_date"])] = row
+    return list(latest.values())
+
+
+def sync_rs_raw(engine: Engine, df: pd.DataFrame, dry_run: bool = False, dedup: bool = False) -> int:
     """Inserta datos del tab RS en glims_rs_results_raw."""
     if df.empty or "Sample ID" not in df.columns:
         LOGGER.warning("DataFrame vacío o sin columna 'Sample ID'")
@@ -195,17 +209,25 @@ def sync_rs_raw(engine: Engine, df: pd.DataFrame, dry_run: bool = False) -> int:
         "batch_id": "Batch ID",
     }
     
+    # Filtrado vectorizado: primero filas con Sample ID, luego (solo sobre esas)
+    # se parsean una vez las fechas y se descartan las que no tienen ninguna
+    sids = df["Sample ID"].fillna("").astype(str).str.strip()
+    df = df.loc[sids.ne("")]
+    sids = sids.loc[df.index]
+    dates = {
+        db_col: (
+            df[col_mapping[db_col]].map(to_date_only)
+            if col_mapping[db_col] in df.columns
+            else pd.Series(None, index=df.index, dtype=object)
+        )
+        for db_col in ("prep_date", "start_date")
+    }
+    keep = dates["prep_date"].notna() | dates["start_date"].notna()
+    df = df.loc[keep]
+    
     rows = []
     for idx, row in df.iterrows():
-        raw_sid = str(row.get("Sample ID") or "").strip()
-        if not raw_sid:
-            continue
-        
-        prep = to_date_only(row.get("RS Analysis Prep Date"))
-        start = to_date_only(row.get("RS Analysis Start Date"))
-        if not prep and not start:
-            continue
-        
+        raw_sid = sids.at[idx]
         clean_sid = normalize_sample_id_clean(raw_sid)
         payload = {
             "sample_id": raw_sid,
@@ -216,8 +238,8 @@ def sync_rs_raw(engine: Engine, df: pd.DataFrame, dry_run: bool = False) -> int:
             if db_col == "sample_id":
                 continue
             val = row.get(sheet_col)
-            if db_col in ("prep_date", "start_date"):
-                payload[db_col] = to_date_only(val)
+            if db_col in dates:
+                payload[db_col] = dates[db_col].at[idx]
             elif db_col in ("sample_weight_mg", "dilution"):
                 payload[db_col] = to_num(val)
             else:
@@ -231,6 +253,11 @@ def sync_rs_raw(engine: Engine, df: pd.DataFrame, dry_run: bool = False) -> int:
     
     LOGGER.info("Total filas procesadas: %d", len(rows))
     
+    if dedup:
+        before = len(rows)
+        rows = dedupe_rows(rows)
+        LOGGER.info("Filas duplicadas descartadas: %d", before - len(rows))
+    
     if dry_run:
         LOGGER.info("[DRY RUN] No se insertarán datos en la base de datos")
         return len(rows)
@@ -249,7 +276,13 @@ def sync_rs_raw(engine: Engine, df: pd.DataFrame, dry_run: bool = False) -> int:
         VALUES ({", ".join(f":{c}" for c in cols)})
     """
     with engine.begin() as conn:
-        conn.execute(text(sql), rows)
+        # La tabla es una recarga completa del sheet y siempre puede re-sincronizarse,
+        # así que no esperamos el flush del WAL al hacer commit (se pierde como mucho
+        # la última carga si el servidor cae justo después; nunca queda inconsistente).
+        conn.execute(text("SET LOCAL synchronous_commit = off"))
+        # Pipeline mode: los INSERT se envían sin esperar la respuesta de cada uno
+        with conn.connection.driver_connection.pipeline():
+            conn.execute(text(sql), rows)
     
     return len(rows)
 
@@ -267,6 +300,11 @@ def main() -> None:
         action="store_true",
         help="Solo procesar datos sin escribir a la DB",
     )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Insertar solo la fila más reciente por (sample_id_clean, prep_date)",
+    )
     args = parser.parse_args()
 
     if not args.spreadsheet_id:
@@ -286,7 +324,7 @@ def main() -> None:
     else:
         engine = None
     
-    count = sync_rs_raw(engine, df, dry_run=args.dry_run)
+    count = sync_rs_raw(engine, df, dry_run=args.dry_run, dedup=args.dedup)
     LOGGER.info("Sincronización completada. Filas insertadas: %d", count)
 
 
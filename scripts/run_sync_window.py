@@ -69,16 +69,8 @@ def parse_args() -> argparse.Namespace:
 
 
 def dedupe_entity_ids(values: Iterable[object]) -> List[str]:
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for value in values:
-        if value is None:
-            continue
-        identifier = str(value)
-        if identifier not in seen:
-            seen.add(identifier)
-            ordered.append(identifier)
-    return ordered
+    # dict.fromkeys keeps first-seen order and dedupes in C
+    return list(dict.fromkeys(str(value) for value in values if value is not None))
 
 
 def collect_processed_counts(summary) -> Dict[str, Optional[int]]:
@@ -1,34 +1,35 @@
-import os
-from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
-load_dotenv()
+from _db import get_engine
+
+# Columns and PK flag in one round-trip, straight from pg_catalog
+# (information_schema.columns is a wrapper view over ~10 catalog tables).
+SCHEMA_SQL = text("""
+    WITH pk AS (
+        SELECT unnest(i.indkey) AS attnum
+        FROM   pg_index i
+        WHERE  i.indrelid = CAST(:table AS regclass)
+        AND    i.indisprimary
+    )
+    SELECT a.attname,
+           format_type(a.atttypid, a.atttypmod) AS data_type,
+           a.attnum IN (SELECT attnum FROM pk) AS is_pk
+    FROM   pg_attribute a
+    WHERE  a.attrelid = CAST(:table AS regclass)
+    AND    a.attnum > 0
+    AND    NOT a.attisdropped
+    ORDER BY a.attnum
+""")
 
 def show_schema(table):
-    host = os.getenv("LOCAL_POSTGRES_HOST")
-    port = os.getenv("LOCAL_POSTGRES_PORT")
-    db = os.getenv("LOCAL_POSTGRES_DB")
-    user = os.getenv("LOCAL_POSTGRES_USER")
-    pw = os.getenv("LOCAL_POSTGRES_PASSWORD")
-    
-    engine = create_engine(f"postgresql+psycopg2://{user}:{pw}@{host}:{port}/{db}")
+    engine = get_engine("local")
     
     with engine.connect() as conn:
         print(f"\n=== {table.upper()} ===")
-        q = text(f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{table}' ORDER BY ordinal_position")
-        for r in conn.execute(q):
+        rows = conn.execute(SCHEMA_SQL, {"table": table}).fetchall()
+        for r in rows:
             print(f"  {r[0]}: {r[1]}")
-            
-        # Check PK
-        q_pk = text("""
-            SELECT a.attname
-            FROM   pg_index i
-            JOIN   pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
-            WHERE  i.indrelid = :table::regclass
-            AND    i.indisprimary
-        """)
-        pk = conn.execute(q_pk, {"table": table}).fetchall()
-        print(f"PK: {[p[0] for p in pk]}")
+        print(f"PK: {[r[0] for r in rows if r[2]]}")
 
 if __name__ == "__main__":
     show_schema("glims_dispensaries")
@@ -1,32 +1,79 @@
 """
 Valida el CSV fuente antes de ejecutar la migración.
 Verifica columnas requeridas y genera reporte de cobertura.
+
+Si DuckDB está instalado, los conteos se calculan directamente sobre el CSV
+(escaneo columnar en paralelo); si no, se usa pandas leyendo por bloques.
 """
 import pandas as pd
 import json
 import os
 
+try:
+    import duckdb
+except ImportError:  # DuckDB es opcional
+    duckdb = None
+
+REQUIRED_COLUMNS = ['Full ID', 'Type']
+CHUNK_SIZE = 200_000
+
+def _counts_duckdb(csv_path):
+    """Devuelve (total, nulos de Full ID, distribución de Type) usando DuckDB."""
+    con = duckdb.connect()
+    try:
+        total_rows, full_id_non_null = con.execute(
+            'SELECT COUNT(*), COUNT("Full ID") FROM read_csv_auto(?, all_varchar = true)',
+            [csv_path],
+        ).fetchone()
+        distribution = con.execute(
+            'SELECT "Type", COUNT(*) AS n FROM read_csv_auto(?, all_varchar = true) '
+            'GROUP BY 1 ORDER BY n DESC',
+            [csv_path],
+        ).fetchall()
+    finally:
+        con.close()
+    return total_rows, total_rows - full_id_non_null, dict(distribution)
+
+def _counts_pandas(csv_path):
+    """Devuelve (total, nulos de Full ID, distribución de Type) leyendo por bloques."""
+    total_rows = 0
+    full_id_nulls = 0
+    type_counts = pd.Series(dtype='int64')
+    chunks = pd.read_csv(
+        csv_path,
+        usecols=REQUIRED_COLUMNS,
+        dtype={'Type': 'category', 'Full ID': 'string'},
+        engine='c',
+        chunksize=CHUNK_SIZE,
+    )
+    for chunk in chunks:
+        total_rows += len(chunk)
+        full_id_nulls += int(chunk['Full ID'].isna().sum())
+        type_counts = type_counts.add(chunk['Type'].value_counts(dropna=False), fill_value=0)
+    return total_rows, full_id_nulls, type_counts.astype(int).sort_values(ascending=False).to_dict()
+
 def validate():
     csv_path = 'qbench-backup.csv'
     if not os.path.exists(csv_path):
         print(f"Error: No se encuentra el archivo {csv_path}")
         return
         
-    df = pd.read_csv(csv_path, low_memory=False)
-    
-    required = ['Full ID', 'Type']
-    missing = [c for c in required if c not in df.columns]
+    header = pd.read_csv(csv_path, nrows=0).columns
+    missing = [c for c in REQUIRED_COLUMNS if c not in header]
     
     if missing:
         print(f"Error: Columnas faltantes en el CSV: {missing}")
         return
     
+    counter = _counts_duckdb if duckdb is not None else _counts_pandas
+    total_rows, full_id_nulls, type_distribution = counter(csv_path)
+    
     report = {
         "status": "OK",
-        "total_rows_csv": len(df),
-        "type_distribution": df['Type'].value_counts(dropna=False).to_dict(),
-        "full_id_nulls": int(df['Full ID'].isna().sum()),
-        "full_id_coverage_pct": float((df['Full ID'].notna().sum() / len(df)) * 100)
+        "total_rows_csv": total_rows,
+        "type_distribution": type_distribution,
+        "full_id_nulls": full_id_nulls,
+        "full_id_coverage_pct": float(((total_rows - full_id_nulls) / total_rows) * 100)
     }
     
     output_path = 'scripts/csv_validation_report.json'
@@ -1,17 +1,9 @@
-import os
-from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
-load_dotenv()
+from _db import get_engine
 
 def verify():
-    host = os.getenv("POSTGRES_HOST")
-    port = os.getenv("POSTGRES_PORT")
-    db = os.getenv("POSTGRES_DB")
-    user = os.getenv("POSTGRES_USER")
-    pw = os.getenv("POSTGRES_PASSWORD")
-    
-    engine = create_engine(f"postgresql+psycopg2://{user}:{pw}@{host}:{port}/{db}")
+    engine = get_engine("azure")
     
     with engine.connect() as conn:
         print("\n=== VERIFICACIÓN EN AZURE ===")
@@ -1,50 +1,44 @@
-import os
-from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
-from datetime import datetime
+from sqlalchemy import text
 
-load_dotenv()
+from _db import get_engine
 
 def verify_db_exclusion():
-    host = os.getenv("POSTGRES_HOST")
-    port = os.getenv("POSTGRES_PORT")
-    db = os.getenv("POSTGRES_DB")
-    user = os.getenv("POSTGRES_USER")
-    pw = os.getenv("POSTGRES_PASSWORD")
+    engine = get_engine("azure")
     
-    engine = create_engine(f"postgresql+psycopg2://{user}:{pw}@{host}:{port}/{db}")
-    
-    # Same logic as in the backend
-    exclude_pattern = r"(-HO[12](-\d+)?)$|(-(1|2|3|N))$"
+    # Same logic as in the backend; is_excluded is the generated column from
+    # scripts/create_glims_indexes.py (HO / -N suffix regex on sample_id)
     min_days = 3
     
+    # Both counts in a single round-trip: shared filters live in the CTE and
+    # each bucket is split out with an aggregate FILTER clause. The overdue
+    # check compares the bare column against a cutoff so it can use
+    # idx_glims_samples_active (scripts/create_glims_indexes.py).
     sql = """
-        SELECT COUNT(*)
-        FROM glims_samples s
-        WHERE s.date_received IS NOT NULL
-          AND s.sample_id !~ :exclude_pattern
-          AND s.date_received >= '2025-01-01'
-          AND s.status NOT IN ('Unknown', 'DISCONTINUED', 'NOT STARTED', 'NOT REPORTABLE', 'CLIENT CANCELLED')
-          AND s.report_date IS NULL
-          AND s.status NOT IN ('Reported', 'Cancelled', 'Destroyed')
-          AND EXTRACT(EPOCH FROM (timezone('America/New_York', now()) - s.date_received::timestamp))/3600.0 >= (:min_days * 24)
-    """
-    
-    sql_old = """
-        SELECT COUNT(*)
-        FROM glims_samples s
-        WHERE s.date_received IS NOT NULL
-          AND s.sample_id !~ :exclude_pattern
-          AND s.date_received < '2025-01-01'
-          AND s.status = 'Unknown'
-          AND s.report_date IS NULL
-          AND s.status NOT IN ('Reported', 'Cancelled', 'Destroyed')
-          AND EXTRACT(EPOCH FROM (timezone('America/New_York', now()) - s.date_received::timestamp))/3600.0 >= (:min_days * 24)
+        WITH base AS (
+            SELECT s.date_received, s.status
+            FROM glims_samples s
+            WHERE s.date_received IS NOT NULL
+              AND NOT s.is_excluded
+              AND s.report_date IS NULL
+              AND s.status NOT IN ('Reported', 'Cancelled', 'Destroyed')
+              AND s.date_received <= timezone('America/New_York', now()) - make_interval(days => :min_days)
+        )
+        SELECT
+            COUNT(*) FILTER (
+                WHERE date_received >= '2025-01-01'
+                  AND status NOT IN ('Unknown', 'DISCONTINUED', 'NOT STARTED', 'NOT REPORTABLE', 'CLIENT CANCELLED')
+            ) AS active,
+            COUNT(*) FILTER (
+                WHERE date_received < '2025-01-01'
+                  AND status = 'Unknown'
+            ) AS historical
+        FROM base
     """
 
     with engine.connect() as conn:
-        count_active = conn.execute(text(sql), {"exclude_pattern": exclude_pattern, "min_days": min_days}).scalar()
-        count_historical = conn.execute(text(sql_old), {"exclude_pattern": exclude_pattern, "min_days": min_days}).scalar()
+        count_active, count_historical = conn.execute(
+            text(sql), {"min_days": min_days}
+        ).one()
         
         print("\n=== VERIFICACIÓN DE EXCLUSIÓN EN DB ===")
         print(f"Samples Overdue (Recientes >= 2025): {count_active}")
@@ -1,27 +1,18 @@
 
 import sys
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
 # Ensure src is in path
 sys.path.append(os.path.join(os.getcwd(), "src"))
 
 from glims.sync import load_env
+from _db import get_engine
 
 def verify():
     load_env()
-    db_url = os.environ.get("DATABASE_URL")
-    if not db_url:
-        # construct from components if needed, similar to sync.py
-        user = os.getenv("POSTGRES_USER", "postgres")
-        password = os.getenv("POSTGRES_PASSWORD", "password")
-        host = os.getenv("POSTGRES_HOST", "localhost")
-        port = os.getenv("POSTGRES_PORT", "5432")
-        db = os.getenv("POSTGRES_DB", "mcrlabs_dashboard")
-        db_url = f"postgresql://{user}:{password}@{host}:{port}/{db}"
-
-    engine = create_engine(db_url)
+    engine = get_engine("azure")
     Session = sessionmaker(bind=engine)
     session = Session()
 
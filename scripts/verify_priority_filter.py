@@ -1,9 +1,16 @@
 import os
+import re
 import requests
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Historical (QBench) sample prefixes S20- .. S24-
+OLD_SAMPLE_RE = re.compile(r"S2[0-4]-")
+
+# Reuse the TCP connection across calls when imported by other checks
+SESSION = requests.Session()
+
 def verify_most_overdue():
     # Use localhost if running locally, or the API URL if configured
     base_url = "http://localhost:8000/api/v2/glims/priority/most-overdue"
@@ -12,7 +19,7 @@ def verify_most_overdue():
     # We might need an auth token if require_active_user is active
     # For local testing, we can check if it works without token or find a token
     try:
-        response = requests.get(base_url, params=params)
+        response = SESSION.get(base_url, params=params, timeout=10)
         if response.status_code == 401:
             print("Authentication required (401). Skipping HTTP test, will check DB directly.")
             return
@@ -26,7 +33,7 @@ def verify_most_overdue():
         count_old = 0
         for s in samples:
             sample_id = s["sample_id"]
-            if any(prefix in sample_id for prefix in ["S20-", "S21-", "S22-", "S23-", "S24-"]):
+            if OLD_SAMPLE_RE.search(sample_id):
                 print(f"FAILED: Found old sample {sample_id}")
                 count_old += 1
             else:
@@ -1,7 +1,8 @@
 import os
 from sqlalchemy import create_engine, text
 from dotenv import load_dotenv
-import pandas as pd
+
+COLUMNS = ("sample_id", "sample_id_clean", "client", "start_date", "acetone", "butane")
 
 def verify():
     load_dotenv()
@@ -13,20 +14,29 @@ def verify():
     url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db}"
     engine = create_engine(url)
 
-    sql = """
-    SELECT sample_id, sample_id_clean, client, start_date, acetone, butane 
+    # Top 10 y total de filas en un solo round-trip
+    sql = f"""
+    SELECT {", ".join(COLUMNS)}, COUNT(*) OVER () AS total
     FROM glims_rs_results_raw 
     ORDER BY start_date DESC NULLS LAST
     LIMIT 10;
     """
     
     with engine.connect() as conn:
-        df = pd.read_sql(text(sql), conn)
-        print("--- RESULTADOS SINCRONIZADOS (TOP 10) ---")
-        print(df.to_string(index=False))
-        
-        count = conn.execute(text("SELECT COUNT(*) FROM glims_rs_results_raw")).scalar()
-        print(f"\nTotal de filas en la tabla: {count}")
+        result = conn.execution_options(stream_results=True, yield_per=10).execute(text(sql))
+        rows = [tuple("" if v is None else str(v) for v in row) for row in result]
+
+    print("--- RESULTADOS SINCRONIZADOS (TOP 10) ---")
+    widths = [
+        max([len(name)] + [len(row[i]) for row in rows])
+        for i, name in enumerate(COLUMNS)
+    ]
+    print("  ".join(name.rjust(w) for name, w in zip(COLUMNS, widths)))
+    for row in rows:
+        print("  ".join(value.rjust(w) for value, w in zip(row, widths)))
+    
+    count = rows[0][-1] if rows else 0
+    print(f"\nTotal de filas en la tabla: {count}")
 
 if __name__ == "__main__":
     verify()
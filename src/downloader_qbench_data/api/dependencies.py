@@ -2,31 +2,103 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import Session
 
 from downloader_qbench_data.auth.tokens import TokenError, decode_access_token
 from downloader_qbench_data.config import AppSettings, get_settings
-from downloader_qbench_data.storage import UserAccount, get_session_factory
+from downloader_qbench_data.storage import (
+    UserAccount,
+    get_async_engine,
+    get_async_session_factory,
+    get_session_factory,
+)
+
+from .http_cache import apply_conditional_get, etag_for, request_cache_key
+from .response_cache import qbench_hourly_version, qbench_sync_state
 
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 
+@dataclass(frozen=True)
+class ActiveUser:
+    """Columns of the authenticated account needed by the request guards."""
+
+    id: int
+    username: str
+    is_active: bool
+    locked_until: Optional[datetime]
+
+
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_TOKEN_CACHE_MAXSIZE = 4096
+# blake2b(token) -> (user snapshot, monotonic deadline); entries never outlive the token's exp claim.
+_token_cache: dict[bytes, tuple[ActiveUser, float]] = {}
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _get_cached_user(key: bytes) -> Optional[ActiveUser]:
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+    user, deadline = entry
+    if deadline <= time.monotonic():
+        _token_cache.pop(key, None)
+        return None
+    return user
+
+
+def _cache_user(key: bytes, user: ActiveUser, token_exp: Optional[int]) -> None:
+    ttl = _TOKEN_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        ttl = min(ttl, token_exp - time.time())
+    if ttl <= 0:
+        return
+    if len(_token_cache) >= _TOKEN_CACHE_MAXSIZE:
+        now = time.monotonic()
+        for stale in [k for k, (_, deadline) in _token_cache.items() if deadline <= now]:
+            del _token_cache[stale]
+        if len(_token_cache) >= _TOKEN_CACHE_MAXSIZE:
+            del _token_cache[next(iter(_token_cache))]
+    _token_cache[key] = (user, time.monotonic() + ttl)
+
+
+def clear_token_cache() -> None:
+    """Drop every cached token validation in this process.
+
+    Accounts are edited out of process (scripts/manage_users.py), so nothing calls this on
+    a change: a deactivated or newly locked user's token keeps working for up to
+    ``_TOKEN_CACHE_TTL_SECONDS`` (60s) in each API worker.
+    """
+
+    _token_cache.clear()
+
+
 def get_app_settings() -> AppSettings:
     """Return cached application settings."""
 
     return get_settings()
 
 
-def get_db_session(settings: AppSettings = Depends(get_app_settings)) -> Generator[Session, None, None]:
+def get_db_session(
+    request: Request,
+    settings: AppSettings = Depends(get_app_settings),
+) -> Generator[Session, None, None]:
     """Provide a SQLAlchemy session scoped to the request lifecycle."""
 
-    session_factory = get_session_factory(settings)
+    session_factory = getattr(request.app.state, "session_factory", None) or get_session_factory(settings)
     session: Session = session_factory()
     try:
         yield session
@@ -34,32 +106,90 @@ def get_db_session(settings: AppSettings = Depends(get_app_settings)) -> Generat
         session.close()
 
 
-def require_active_user(
+async def get_async_db_session(
+    request: Request,
+    settings: AppSettings = Depends(get_app_settings),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Provide an asyncpg-backed SQLAlchemy session scoped to the request lifecycle.
+
+    FastAPI caches dependency results per request, so ``require_active_user`` and the
+    route handler share this single session (and pooled connection).
+    """
+
+    session_factory = getattr(request.app.state, "async_session_factory", None) or get_async_session_factory(
+        settings
+    )
+    async with session_factory() as session:
+        yield session
+
+
+def get_async_db_engine(settings: AppSettings = Depends(get_app_settings)) -> AsyncEngine:
+    """Return the pooled asyncpg engine for handlers that run independent queries concurrently."""
+
+    return get_async_engine(settings)
+
+
+async def require_active_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
     settings: AppSettings = Depends(get_app_settings),
-    session: Session = Depends(get_db_session),
-) -> UserAccount:
+    session: AsyncSession = Depends(get_async_db_session),
+) -> ActiveUser:
     """Ensure the requester has supplied a valid bearer token."""
 
     if credentials is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="not_authenticated")
 
     token = credentials.credentials
-    try:
-        payload = decode_access_token(settings.auth, token)
-    except TokenError as exc:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=exc.code) from exc
-
-    username = payload.get("sub")
-    if not username:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_token_payload")
-
-    user = session.scalar(select(UserAccount).where(UserAccount.username == username))
-    if not user or not user.is_active:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="user_not_found")
+    # A JWT always has three dot-separated segments; skip the crypto for anything else.
+    if token.count(".") != 2:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="token_invalid")
+
+    cache_key = _token_cache_key(token)
+    user = _get_cached_user(cache_key)
+    if user is None:
+        try:
+            payload = decode_access_token(settings.auth, token)
+        except TokenError as exc:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=exc.code) from exc
+
+        username = payload.get("sub")
+        if not username:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_token_payload")
+
+        result = await session.execute(
+            select(
+                UserAccount.id,
+                UserAccount.username,
+                UserAccount.is_active,
+                UserAccount.locked_until,
+            ).where(UserAccount.username == username)
+        )
+        row = result.first()
+        if not row or not row.is_active:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="user_not_found")
+
+        user = ActiveUser(*row)
+
+        _cache_user(cache_key, user, payload.get("exp"))
 
     now = datetime.now(timezone.utc)
     if user.locked_until and user.locked_until > now:
         raise HTTPException(status_code=status.HTTP_423_LOCKED, detail="account_locked")
 
+    request.state.user = user.username
     return user
+
+
+async def qbench_conditional_get(request: Request, response: Response) -> None:
+    """Answer 304 for QBench-derived GETs when no sync or ban change happened since the client's copy.
+
+    Uses the same data version as the cached /metrics routes. Age-based figures (overdue
+    days, open hours) drift with the clock, so the ETag also rolls over every hour.
+    """
+
+    if request.method != "GET":
+        return
+    synced_at, _, _ = await qbench_sync_state()
+    etag = etag_for(request_cache_key(request), await qbench_hourly_version())
+    apply_conditional_get(request, response, etag, last_modified=synced_at)
@@ -0,0 +1,58 @@
+"""Conditional GET helpers (ETag / Last-Modified) for read-only endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+CACHE_CONTROL = "private, max-age=15"
+
+
+def etag_for(*parts: Any) -> str:
+    """Return a weak ETag derived from the given parts."""
+
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def request_cache_key(request: Request) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Identify a GET request by path and (order-insensitive) query parameters."""
+
+    return request.url.path, tuple(sorted(request.query_params.multi_items()))
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_get_headers(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> dict[str, str]:
+    """Return the validator headers for a response, raising 304 when the client copy is current."""
+
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=last_modified.tzinfo is not None)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return headers
+
+
+def apply_conditional_get(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> None:
+    """Set validator headers, short-circuiting with 304 when the client copy is current."""
+
+    response.headers.update(conditional_get_headers(request, etag, last_modified))
@@ -2,20 +2,64 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import AsyncIterator, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse, FileResponse
+from fastapi.responses import RedirectResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from downloader_qbench_data.config import get_settings
-from .routers import analytics, entities, metrics, auth as auth_router
-from .routers import glims_overview, glims_priority, glims_tat, glims_status, glims_tests
+from downloader_qbench_data.storage import get_async_engine, get_async_session_factory, get_session_factory
+from .response_cache import close_redis_client
+from .routers import (
+    analytics,
+    auth as auth_router,
+    entities,
+    glims_overview,
+    glims_priority,
+    glims_status,
+    glims_tat,
+    glims_tests,
+    metrics,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+_FRONTEND_DIST = (Path(__file__).resolve().parents[3] / "frontend" / "dist").resolve()
+_INDEX_PATH = _FRONTEND_DIST / "index.html"
+
+# Dev tunnels plus the local Vite dev/preview ports
+_ALLOWED_ORIGINS = (
+    "https://615c98lc-8000.use.devtunnels.ms",
+    "https://615c98lc-5177.use.devtunnels.ms",
+    "http://localhost:5173",
+    "http://localhost:5177",
+    "http://127.0.0.1:5173",
+    "http://127.0.0.1:5177",
+    "http://localhost:4173",
+    "http://127.0.0.1:4173",
+)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the pooled session factories once per process and release them on shutdown."""
+
+    settings = get_settings()
+    app.state.session_factory = get_session_factory(settings)
+    app.state.async_session_factory = get_async_session_factory(settings)
+    try:
+        yield
+    finally:
+        await close_redis_client()
+        await get_async_engine(settings).dispose()
+
 
 def create_app() -> FastAPI:
     """Create and configure a FastAPI application instance."""
@@ -30,22 +74,12 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        lifespan=_lifespan,
     )
 
-    allowed_origins = {
-        "https://615c98lc-8000.use.devtunnels.ms",
-        "https://615c98lc-5177.use.devtunnels.ms",
-        "http://localhost:5173",
-        "http://localhost:5177",
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:5177",
-        "http://localhost:4173",
-        "http://127.0.0.1:4173",
-    }
-
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=sorted(allowed_origins),
+        allow_origins=_ALLOWED_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -65,7 +99,7 @@ def create_app() -> FastAPI:
     app.include_router(glims_status.router)
     app.include_router(glims_tests.router)
 
-    frontend_dist = Path(__file__).resolve().parents[3] / "frontend" / "dist"
+    frontend_dist = _FRONTEND_DIST
     if frontend_dist.exists():
         LOGGER.info("Serving dashboard static files from %s", frontend_dist)
         
@@ -83,21 +117,38 @@ def create_app() -> FastAPI:
         async def root_redirect() -> RedirectResponse:
             return RedirectResponse(url="/dashboard/", status_code=307)
 
+        # index.html only changes on deploy: keep its bytes and ETag in memory
+        app.state.spa_index = _INDEX_PATH.read_bytes()
+        app.state.spa_etag = f'"{hashlib.md5(app.state.spa_index, usedforsecurity=False).hexdigest()}"'
+
+        def spa_index_response(request: Request) -> Response:
+            headers = {"ETag": app.state.spa_etag, "Cache-Control": "no-cache"}
+            if request.headers.get("if-none-match") == app.state.spa_etag:
+                return Response(status_code=304, headers=headers)
+            return Response(content=app.state.spa_index, media_type="text/html", headers=headers)
+
+        @lru_cache(maxsize=512)
+        def static_file(full_path: str) -> Optional[Path]:
+            file_path = (frontend_dist / full_path).resolve()
+            if file_path.is_relative_to(frontend_dist) and file_path.is_file():
+                return file_path
+            return None
+
         # 3. Catch-all for /dashboard/* to serve index.html (SPA Fallback)
         @app.get("/dashboard/{full_path:path}", include_in_schema=False)
-        async def serve_spa(full_path: str) -> FileResponse:
+        async def serve_spa(full_path: str, request: Request) -> Response:
             # Check if a physical file exists (e.g. vite.svg, favicon.ico)
-            file_path = frontend_dist / full_path
-            if file_path.exists() and file_path.is_file():
+            file_path = static_file(full_path)
+            if file_path is not None:
                 return FileResponse(file_path)
             
             # Otherwise return index.html for client-side routing
-            return FileResponse(frontend_dist / "index.html")
+            return spa_index_response(request)
 
         # Handle exact /dashboard request too
         @app.get("/dashboard", include_in_schema=False)
-        async def serve_spa_root() -> FileResponse:
-             return FileResponse(frontend_dist / "index.html")
+        async def serve_spa_root(request: Request) -> Response:
+             return spa_index_response(request)
     else:
         LOGGER.warning("Frontend build not found at %s; dashboard route disabled", frontend_dist)
 
@@ -0,0 +1,215 @@
+"""Redis-backed response cache for read-heavy GLIMS and QBench metrics endpoints."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from sqlalchemy import func, select, text
+
+from downloader_qbench_data.config import AppSettings, get_settings
+from downloader_qbench_data.storage import BannedEntity, SyncCheckpoint, get_async_engine
+
+from .http_cache import conditional_get_headers, etag_for, request_cache_key
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # Redis is optional; without it responses are simply not cached
+    redis_asyncio = None
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_TTL_SECONDS = {"short": 10, "normal": 30, "long": 60}
+
+_redis_client = None
+
+_DATA_VERSION_TTL_SECONDS = 5.0
+# (monotonic deadline, version) of the last glims_sync_runs lookup
+_glims_version: Optional[tuple[float, str]] = None
+# (monotonic deadline, state) of the last sync_checkpoints / banned_entities lookup
+_qbench_state: Optional[tuple[float, tuple[Optional[datetime], int, Optional[datetime]]]] = None
+
+
+def get_redis_client(settings: AppSettings):
+    """Return the shared Redis client, or ``None`` when caching is not configured."""
+
+    global _redis_client
+    if _redis_client is None and settings.redis_url and redis_asyncio is not None:
+        _redis_client = redis_asyncio.from_url(settings.redis_url)
+    return _redis_client
+
+
+async def close_redis_client() -> None:
+    """Close the shared Redis client (called on application shutdown)."""
+
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+async def glims_data_version() -> str:
+    """Return the finish time of the latest successful GLIMS sync, memoised for a few seconds."""
+
+    global _glims_version
+    now = time.monotonic()
+    if _glims_version is not None and _glims_version[0] > now:
+        return _glims_version[1]
+    sql = "SELECT MAX(finished_at) FROM glims_sync_runs WHERE status = 'success'"
+    async with get_async_engine(get_settings()).connect() as conn:
+        finished_at = (await conn.execute(text(sql))).scalar()
+    version = finished_at.isoformat() if finished_at else "never"
+    _glims_version = (now + _DATA_VERSION_TTL_SECONDS, version)
+    return version
+
+
+async def qbench_sync_state() -> tuple[Optional[datetime], int, Optional[datetime]]:
+    """Return the latest sync checkpoint, ban count and latest ban time, memoised for a few seconds.
+
+    Bans filter every QBench figure, so adding or lifting one must change the version too.
+    """
+
+    global _qbench_state
+    now = time.monotonic()
+    if _qbench_state is not None and _qbench_state[0] > now:
+        return _qbench_state[1]
+    stmt = select(
+        select(func.max(SyncCheckpoint.updated_at)).scalar_subquery(),
+        select(func.count()).select_from(BannedEntity).scalar_subquery(),
+        select(func.max(BannedEntity.created_at)).scalar_subquery(),
+    )
+    async with get_async_engine(get_settings()).connect() as conn:
+        state = tuple((await conn.execute(stmt)).one())
+    _qbench_state = (now + _DATA_VERSION_TTL_SECONDS, state)
+    return state
+
+
+async def qbench_data_version() -> str:
+    """Return the QBench sync and ban state as a version string."""
+
+    synced_at, ban_count, ban_changed_at = await qbench_sync_state()
+    parts = [value.isoformat() if value else "never" for value in (synced_at, ban_changed_at)]
+    return f"{parts[0]}:{ban_count}:{parts[1]}"
+
+
+async def qbench_hourly_version() -> str:
+    """QBench data version plus the current UTC hour, for figures that age with the clock (overdue days)."""
+
+    return f"{await qbench_data_version()}:{datetime.now(timezone.utc):%Y-%m-%dT%H}"
+
+
+async def glims_hourly_version() -> str:
+    """GLIMS data version plus the current UTC hour, for figures that age with the clock (open hours)."""
+
+    return f"{await glims_data_version()}:{datetime.now(timezone.utc):%Y-%m-%dT%H}"
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """Serialise a response model once with pydantic-core and send the bytes as-is.
+
+    FastAPI passes ``Response`` objects through untouched, so the route's ``response_model``
+    is kept for the OpenAPI schema without re-validating the payload on the way out.
+    """
+
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _utc_today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def cache_key(namespace: str, request: Request, version: str) -> str:
+    """Build a key from the path, the data version, today's date and the order-insensitive query string.
+
+    Omitted date filters default to a window ending today, so the same query string means a
+    different range once the UTC date rolls over.
+    """
+
+    query = repr(sorted(request.query_params.multi_items())).encode("utf-8")
+    digest = hashlib.sha1(query, usedforsecurity=False).hexdigest()
+    return f"{namespace}:{request.url.path}:{version}:{_utc_today()}:{digest}"
+
+
+def cached_response(
+    namespace: str,
+    policy: str = "normal",
+    version: Callable[[], Awaitable[str]] = glims_data_version,
+) -> Callable:
+    """Cache a handler's JSON body in Redis under a key tied to the current data version.
+
+    Keys embed ``version()``, so a new sync makes every older entry unreachable and the
+    TTL only bounds how long a hot key lives. Redis failures fall back to the handler.
+    The same version drives a weak ETag, so polling clients get a 304 (without Redis too)
+    until the next sync.
+    """
+
+    ttl = CACHE_TTL_SECONDS[policy]
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        passes_request = "request" in signature.parameters
+
+        async def call(kwargs: dict[str, Any]) -> Any:
+            if inspect.iscoroutinefunction(func):
+                return await func(**kwargs)
+            return await run_in_threadpool(func, **kwargs)
+
+        @functools.wraps(func)
+        async def wrapper(**kwargs: Any) -> Any:
+            request: Request = kwargs["request"] if passes_request else kwargs.pop("request")
+            try:
+                data_version = await version()
+            except Exception:  # noqa: BLE001 - without a version the response is just not cached
+                LOGGER.warning("Data version lookup failed for %s", request.url.path, exc_info=True)
+                data_version = None
+
+            validators: dict[str, str] = {}
+            client = None
+            if data_version is not None:
+                etag = etag_for(request_cache_key(request), data_version, _utc_today())
+                validators = conditional_get_headers(request, etag)
+                client = get_redis_client(get_settings())
+
+            key = None
+            body = None
+            if client is not None:
+                key = cache_key(namespace, request, data_version)
+                try:
+                    body = await client.get(key)
+                except Exception:  # noqa: BLE001 - the cache must never take the endpoint down
+                    LOGGER.warning("Response cache lookup failed for %s", request.url.path, exc_info=True)
+            if body is not None:
+                return Response(content=body, media_type="application/json", headers=validators)
+
+            result = await call(kwargs)
+            if isinstance(result, BaseModel):
+                response = model_json_response(result)
+            elif isinstance(getattr(result, "body", None), bytes) and result.status_code == 200:
+                # Handlers may pre-encode their own JSON body; streamed responses have no body
+                response = result
+            else:
+                return result
+            response.headers.update(validators)
+            if key is not None:
+                try:
+                    await client.set(key, response.body, ex=ttl)
+                except Exception:  # noqa: BLE001
+                    LOGGER.warning("Response cache store failed for %s", request.url.path, exc_info=True)
+            return response
+
+        if not passes_request:
+            request_param = inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+            wrapper.__signature__ = signature.replace(
+                parameters=[*signature.parameters.values(), request_param]
+            )
+        return wrapper
+
+    return decorator
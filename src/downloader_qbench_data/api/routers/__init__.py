@@ -1,5 +1,25 @@
 """Router exports."""
 
-from . import analytics, entities, metrics, glims_overview, glims_priority, glims_tat
+from . import (
+    analytics,
+    auth,
+    entities,
+    glims_overview,
+    glims_priority,
+    glims_status,
+    glims_tat,
+    glims_tests,
+    metrics,
+)
 
-__all__ = ["analytics", "entities", "metrics", "glims_overview", "glims_priority", "glims_tat"]
+__all__ = [
+    "analytics",
+    "auth",
+    "entities",
+    "glims_overview",
+    "glims_priority",
+    "glims_status",
+    "glims_tat",
+    "glims_tests",
+    "metrics",
+]
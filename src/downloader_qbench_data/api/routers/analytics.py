@@ -6,10 +6,26 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..dependencies import get_db_session, require_active_user
+from ..dependencies import get_async_db_session, qbench_conditional_get, require_active_user
 from ..schemas.analytics import (
+    AnalyticsBatchRequest,
+    AnalyticsBatchResponse,
+    AnalyticsBatchResult,
+    CustomerAlertsParams,
+    Interval,
+    MatchStrategy,
+    OrdersFunnelParams,
+    OrdersSlowestParams,
+    OrdersThroughputParams,
+    OverdueOrdersParams,
+    QualityKpisParams,
+    SamplesCycleTimeParams,
+    TestsStateDistributionParams,
     CustomerAlertsResponse,
     OrdersFunnelResponse,
     OrdersSlowestResponse,
@@ -37,12 +53,24 @@ from ..services.analytics import (
 router = APIRouter(
     prefix="/analytics",
     tags=["analytics"],
-    dependencies=[Depends(require_active_user)],
+    dependencies=[Depends(require_active_user), Depends(qbench_conditional_get)],
 )
 
+# name -> (service, params model) for the /batch endpoint
+_BATCH_HANDLERS = {
+    "throughput": (get_orders_throughput, OrdersThroughputParams),
+    "cycle_time": (get_samples_cycle_time, SamplesCycleTimeParams),
+    "funnel": (get_orders_funnel, OrdersFunnelParams),
+    "slowest": (get_slowest_orders, OrdersSlowestParams),
+    "overdue": (get_overdue_orders, OverdueOrdersParams),
+    "customer_alerts": (get_customer_alerts, CustomerAlertsParams),
+    "state_distribution": (get_tests_state_distribution, TestsStateDistributionParams),
+    "quality_kpis": (get_quality_kpis, QualityKpisParams),
+}
+
 
 @router.get("/orders/throughput", response_model=OrdersThroughputResponse)
-def orders_throughput(
+async def orders_throughput(
     date_from: Optional[datetime] = Query(
         None, description="Filter orders created on/after this datetime"
     ),
@@ -50,17 +78,13 @@ def orders_throughput(
         None, description="Filter orders created on/before this datetime"
     ),
     customer_id: Optional[int] = Query(None),
-    interval: str = Query(
-        "day",
-        description="Aggregation interval (day or week)",
-        pattern="^(day|week)$",
-    ),
-    session: Session = Depends(get_db_session),
+    interval: Interval = Query(Interval.day, description="Aggregation interval (day or week)"),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> OrdersThroughputResponse:
     """Return counts of orders created/completed and completion times by interval."""
 
-    return get_orders_throughput(
-        session,
+    return await session.run_sync(
+        get_orders_throughput,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -69,7 +93,7 @@ def orders_throughput(
 
 
 @router.get("/samples/cycle-time", response_model=SamplesCycleTimeResponse)
-def samples_cycle_time(
+async def samples_cycle_time(
     date_from: Optional[datetime] = Query(
         None, description="Filter samples completed on/after this datetime"
     ),
@@ -80,17 +104,13 @@ def samples_cycle_time(
     order_id: Optional[int] = Query(None),
     matrix_type: Optional[str] = Query(None),
     state: Optional[str] = Query(None),
-    interval: str = Query(
-        "day",
-        description="Aggregation interval (day or week)",
-        pattern="^(day|week)$",
-    ),
-    session: Session = Depends(get_db_session),
+    interval: Interval = Query(Interval.day, description="Aggregation interval (day or week)"),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> SamplesCycleTimeResponse:
     """Return sample cycle-time statistics grouped by interval and matrix type."""
 
-    return get_samples_cycle_time(
-        session,
+    return await session.run_sync(
+        get_samples_cycle_time,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -102,7 +122,7 @@ def samples_cycle_time(
 
 
 @router.get("/orders/funnel", response_model=OrdersFunnelResponse)
-def orders_funnel(
+async def orders_funnel(
     date_from: Optional[datetime] = Query(
         None, description="Filter orders created on/after this datetime"
     ),
@@ -110,12 +130,12 @@ def orders_funnel(
         None, description="Filter orders created on/before this datetime"
     ),
     customer_id: Optional[int] = Query(None),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> OrdersFunnelResponse:
     """Return funnel counts for order lifecycle stages."""
 
-    return get_orders_funnel(
-        session,
+    return await session.run_sync(
+        get_orders_funnel,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -123,7 +143,7 @@ def orders_funnel(
 
 
 @router.get("/orders/slowest", response_model=OrdersSlowestResponse)
-def orders_slowest(
+async def orders_slowest(
     date_from: Optional[datetime] = Query(
         None, description="Filter orders created on/after this datetime"
     ),
@@ -138,12 +158,12 @@ def orders_slowest(
         le=100,
         description="Maximum number of slowest orders to return",
     ),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> OrdersSlowestResponse:
     """Return the slowest orders ranked by completion time or current age."""
 
-    return get_slowest_orders(
-        session,
+    return await session.run_sync(
+        get_slowest_orders,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -153,7 +173,7 @@ def orders_slowest(
 
 
 @router.get("/priority-orders/slowest", response_model=SlowReportedOrdersResponse)
-def priority_orders_slowest(
+async def priority_orders_slowest(
     date_from: Optional[datetime] = Query(
         None, description="Filter orders reported on/after this datetime"
     ),
@@ -185,12 +205,12 @@ def priority_orders_slowest(
         ge=0.0,
         description="Highlight rows whose open time exceeds this threshold",
     ),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> SlowReportedOrdersResponse:
     """Return reported orders ranked by how long they took to complete."""
 
-    return get_priority_slowest_reported_orders(
-        session,
+    return await session.run_sync(
+        get_priority_slowest_reported_orders,
         date_from=date_from,
         date_to=date_to,
         customer_query=customer_query,
@@ -202,14 +222,10 @@ def priority_orders_slowest(
 
 
 @router.get("/orders/overdue", response_model=OverdueOrdersResponse)
-def orders_overdue(
+async def orders_overdue(
     date_from: Optional[datetime] = Query(None, description="Filter orders created on/after this datetime"),
     date_to: Optional[datetime] = Query(None, description="Filter orders created on/before this datetime"),
-    interval: str = Query(
-        "week",
-        description="Aggregation interval for timeline and heatmap (day or week)",
-        pattern="^(day|week)$",
-    ),
+    interval: Interval = Query(Interval.week, description="Aggregation interval for timeline and heatmap (day or week)"),
     min_days_overdue: int = Query(30, ge=0, description="Minimum age in days for an order to be considered overdue"),
     warning_window_days: int = Query(
         5,
@@ -220,12 +236,12 @@ def orders_overdue(
     top_limit: int = Query(20, ge=1, le=200, description="Maximum overdue orders to return in the top list"),
     client_limit: int = Query(20, ge=1, le=200, description="Maximum customer aggregates to return"),
     warning_limit: int = Query(20, ge=1, le=200, description="Maximum warning orders to return"),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> OverdueOrdersResponse:
     """Return analytics for overdue orders."""
 
-    return get_overdue_orders(
-        session,
+    return await session.run_sync(
+        get_overdue_orders,
         date_from=date_from,
         date_to=date_to,
         min_days_overdue=min_days_overdue,
@@ -239,15 +255,11 @@ def orders_overdue(
 
 
 @router.get("/customers/alerts", response_model=CustomerAlertsResponse)
-def customers_alerts(
+async def customers_alerts(
     date_from: Optional[datetime] = Query(None, description="Filter tests created on/after this datetime"),
     date_to: Optional[datetime] = Query(None, description="Filter tests created on/before this datetime"),
     customer_id: Optional[int] = Query(None),
-    interval: str = Query(
-        "week",
-        description="Aggregation interval for heatmap (day or week)",
-        pattern="^(day|week)$",
-    ),
+    interval: Interval = Query(Interval.week, description="Aggregation interval for heatmap (day or week)"),
     sla_hours: float = Query(48.0, ge=0.0),
     min_alert_percentage: float = Query(
         0.1,
@@ -255,12 +267,12 @@ def customers_alerts(
         le=1.0,
         description="Minimum ratio required to include a customer in the alerts list",
     ),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> CustomerAlertsResponse:
     """Return customer alert list and state heatmap for quality monitoring."""
 
-    return get_customer_alerts(
-        session,
+    return await session.run_sync(
+        get_customer_alerts,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -271,16 +283,15 @@ def customers_alerts(
 
 
 @router.get("/customers/orders/summary", response_model=CustomerOrdersSummaryResponse)
-def customers_orders_summary(
+async def customers_orders_summary(
     customer_id: Optional[int] = Query(None, description="Customer identifier to summarise"),
     customer_name: Optional[str] = Query(
         None,
         min_length=3,
         description="Customer name or alias to resolve when customer_id is unknown",
     ),
-    match_strategy: str = Query(
-        "best",
-        pattern="^(best|all)$",
+    match_strategy: MatchStrategy = Query(
+        MatchStrategy.best,
         description="Use 'all' to retrieve matches without computing metrics",
     ),
     match_threshold: float = Query(
@@ -295,13 +306,13 @@ def customers_orders_summary(
     include_samples: bool = Query(False, description="Include aggregates for pending samples"),
     include_tests: bool = Query(False, description="Include aggregates for pending tests"),
     limit_orders: int = Query(20, ge=1, le=100, description="Maximum number of open orders to list"),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> CustomerOrdersSummaryResponse:
     """Return customer-focused order summary with optional alias lookup."""
 
     try:
-        return get_customer_orders_summary(
-            session,
+        return await session.run_sync(
+            get_customer_orders_summary,
             customer_id=customer_id,
             customer_name=customer_name,
             match_strategy=match_strategy,
@@ -320,22 +331,18 @@ def customers_orders_summary(
 
 
 @router.get("/tests/state-distribution", response_model=TestsStateDistributionResponse)
-def tests_state_distribution(
+async def tests_state_distribution(
     date_from: Optional[datetime] = Query(None, description="Filter tests created on/after this datetime"),
     date_to: Optional[datetime] = Query(None, description="Filter tests created on/before this datetime"),
     customer_id: Optional[int] = Query(None),
     order_id: Optional[int] = Query(None),
-    interval: str = Query(
-        "week",
-        description="Aggregation interval for stacked series (day or week)",
-        pattern="^(day|week)$",
-    ),
-    session: Session = Depends(get_db_session),
+    interval: Interval = Query(Interval.week, description="Aggregation interval for stacked series (day or week)"),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TestsStateDistributionResponse:
     """Return stacked distribution of test states over time."""
 
-    return get_tests_state_distribution(
-        session,
+    return await session.run_sync(
+        get_tests_state_distribution,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -345,21 +352,48 @@ def tests_state_distribution(
 
 
 @router.get("/kpis/quality", response_model=QualityKpisResponse)
-def quality_kpis(
+async def quality_kpis(
     date_from: Optional[datetime] = Query(None, description="Filter entities created on/after this datetime"),
     date_to: Optional[datetime] = Query(None, description="Filter entities created on/before this datetime"),
     customer_id: Optional[int] = Query(None),
     order_id: Optional[int] = Query(None),
     sla_hours: float = Query(48.0, ge=0.0),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> QualityKpisResponse:
     """Return aggregate quality KPIs for tests and orders."""
 
-    return get_quality_kpis(
-        session,
+    return await session.run_sync(
+        get_quality_kpis,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
         order_id=order_id,
         sla_hours=sla_hours,
     )
+
+
+def _run_batch(session: Session, calls: list[tuple[str, BaseModel]]) -> AnalyticsBatchResponse:
+    results = []
+    for name, params in calls:
+        service, _ = _BATCH_HANDLERS[name]
+        results.append(AnalyticsBatchResult(name=name, data=service(session, **params.model_dump())))
+    return AnalyticsBatchResponse(results=results)
+
+
+@router.post("/batch", response_model=AnalyticsBatchResponse)
+async def analytics_batch(
+    payload: AnalyticsBatchRequest,
+    session: AsyncSession = Depends(get_async_db_session),
+) -> AnalyticsBatchResponse:
+    """Run several analytics queries behind one auth check and one pooled connection."""
+
+    calls: list[tuple[str, BaseModel]] = []
+    for index, item in enumerate(payload.requests):
+        _, params_model = _BATCH_HANDLERS[item.name]
+        try:
+            calls.append((item.name, params_model.model_validate(item.params)))
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", "requests", index, "params", *error["loc"])} for error in exc.errors()]
+            ) from exc
+    return await session.run_sync(_run_batch, calls)
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
-from typing import Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-
-from downloader_qbench_data.api.dependencies import get_db_session, get_app_settings, require_active_user
-from downloader_qbench_data.config import AppSettings
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic_core import to_json
+from sqlalchemy import Row, TextClause, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from downloader_qbench_data.api.dependencies import (
+    get_async_db_engine,
+    require_active_user,
+)
+from downloader_qbench_data.api.response_cache import cached_response
+from downloader_qbench_data.config import get_settings
 from downloader_qbench_data.api.schemas.glims_overview import (
     ActivityPoint,
     ActivityResponse,
     NewCustomerItem,
     NewCustomersResponse,
+    OverviewDashboardResponse,
     OverviewSummary,
     TatDailyPoint,
     TatDailyResponse,
@@ -52,163 +60,282 @@ ASSAY_TABLES = {
 }
 
 
+def _assay_union_sql() -> str:
+    """One row per assay result dated within :start..:end, with label, effective date and sample attributes.
+
+    Each table contributes two branches so both are index range scans (see
+    scripts/create_glims_indexes.py): results dated on the row itself, matched on
+    COALESCE(date_a, date_b), and undated results that fall back to the sample's date_received.
+    """
+
+    parts = []
+    for label, (table, date_a, date_b) in ASSAY_TABLES.items():
+        parts.append(
+            f"SELECT '{label}' AS label, r.sample_id, COALESCE(r.{date_a}, r.{date_b}) AS d, "
+            f"s.adult_use_medical, s.dispensary_id "
+            f"FROM {table} r JOIN glims_samples s ON s.sample_id = r.sample_id "
+            f"WHERE COALESCE(r.{date_a}, r.{date_b}) BETWEEN :start AND :end"
+        )
+        parts.append(
+            f"SELECT '{label}' AS label, r.sample_id, s.date_received AS d, "
+            f"s.adult_use_medical, s.dispensary_id "
+            f"FROM {table} r JOIN glims_samples s ON s.sample_id = r.sample_id "
+            f"WHERE r.{date_a} IS NULL AND r.{date_b} IS NULL AND s.date_received BETWEEN :start AND :end"
+        )
+    return " UNION ALL ".join(parts)
+
+
+# ASSAY_TABLES is static, so the union text is built once per process
+_ASSAY_UNION_SQL = _assay_union_sql()
+
+# The same rows precomputed by scripts/create_glims_indexes.py and refreshed after every GLIMS sync
+_TEST_EVENTS_VIEW_SQL = (
+    "SELECT label, sample_id, d, adult_use_medical, dispensary_id "
+    "FROM glims_test_events WHERE d BETWEEN :start AND :end"
+)
+
+
+def _test_events_sql() -> str:
+    """Test event rows: the glims_test_events view when GLIMS_TEST_EVENTS_VIEW is set, else the live union."""
+
+    return _TEST_EVENTS_VIEW_SQL if get_settings().glims_test_events_view else _ASSAY_UNION_SQL
+
+
+async def _fetch_all(engine: AsyncEngine, stmt: TextClause, params: dict) -> list[Row]:
+    """Run a single query on its own pooled connection."""
+
+    async with engine.connect() as conn:
+        return (await conn.execute(stmt, params)).all()
+
+
+def _period_starts(start: date, end: date, timeframe: str) -> list[date]:
+    """Every day/week/month bucket start from the bucket containing ``start`` through ``end``."""
+
+    if timeframe == "daily":
+        return [date.fromordinal(ordinal) for ordinal in range(start.toordinal(), end.toordinal() + 1)]
+    if timeframe == "weekly":
+        first = start.toordinal() - start.weekday()
+        return [date.fromordinal(ordinal) for ordinal in range(first, end.toordinal() + 1, 7)]
+    months = (end.year - start.year) * 12 + end.month - start.month
+    return [
+        date(start.year + (start.month - 1 + offset) // 12, (start.month - 1 + offset) % 12 + 1, 1)
+        for offset in range(months + 1)
+    ]
+
+
 def _parse_dates(
     date_from: Optional[date],
     date_to: Optional[date],
     default_days: int = 7,
 ) -> tuple[date, date]:
-    today = datetime.utcnow().date()
+    span = timedelta(days=default_days - 1)
     if date_from is None and date_to is None:
-        date_to = today
-        date_from = today - timedelta(days=default_days - 1)
+        date_to = datetime.now(timezone.utc).date()
+        date_from = date_to - span
     elif date_from is None:
-        date_from = date_to - timedelta(days=default_days - 1)
+        date_from = date_to - span
     elif date_to is None:
-        date_to = date_from + timedelta(days=default_days - 1)
+        date_to = date_from + span
 
     if date_from > date_to:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="date_from_must_be_before_date_to")
     return date_from, date_to
 
 
-@router.get("/summary", response_model=OverviewSummary)
-def get_summary(
+def parsed_range(
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
-    dispensary_id: Optional[int] = Query(None),
-    sample_type: Optional[str] = Query(None),
-    settings: AppSettings = Depends(get_app_settings),
-    session: Session = Depends(get_db_session),
-) -> OverviewSummary:
-    start, end = _parse_dates(date_from, date_to)
+) -> tuple[date, date]:
+    """Resolve the shared ``date_from``/``date_to`` query pair into an inclusive range."""
 
-    filters = ["s.date_received BETWEEN :start AND :end"]
-    params = {"start": start, "end": end}
-    if dispensary_id:
-        filters.append("s.dispensary_id = :dispensary_id")
-        params["dispensary_id"] = dispensary_id
-    if sample_type and sample_type != 'All':
-        filters.append("s.adult_use_medical = :sample_type")
-        params["sample_type"] = sample_type
-    
-    filters.append("s.status NOT IN ('Cancelled', 'Destroyed')")
-    # Query 1: Intake Metrics (based on date_received)
-    intake_where = " AND ".join(filters) # Already defined as date_received filter
-    
-    # Query 1: Intake Metrics (based on date_received)
-    intake_sql = f"""
+    return _parse_dates(date_from, date_to)
+
+
+def _normalise_timeframe(timeframe: str) -> tuple[str, str]:
+    """Return the validated timeframe and its ``date_trunc`` unit (unknown values fall back to daily)."""
+
+    if timeframe not in ["daily", "weekly", "monthly"]:
+        timeframe = "daily"
+    return timeframe, {"daily": "day", "weekly": "week", "monthly": "month"}[timeframe]
+
+
+@lru_cache(maxsize=None)
+def _overview_statements(
+    trunc_unit: str,
+    by_dispensary: bool,
+    by_type: bool,
+) -> tuple[TextClause, TextClause, TextClause]:
+    """Compiled samples/reported/tests statements for one filter combination.
+
+    Only 3 units x 4 filter combinations exist, so each SQL text (and its ``text()``
+    parse) is built once and reused, and the driver always sees the same statement.
+    """
+
+    disp_clause = "AND s.dispensary_id = :dispensary_id" if by_dispensary else ""
+    type_clause = "AND s.adult_use_medical = :sample_type" if by_type else ""
+
+    # Intake (summary counts only active samples, the activity timeline counts all of them)
+    samples_sql = f"""
         SELECT
-            COUNT(*) AS samples,
-            adult_use_medical,
-            MAX(GREATEST(s.date_received, s.report_date)) AS last_updated_at
+            date_trunc('{trunc_unit}', s.date_received)::date AS d,
+            s.adult_use_medical,
+            COUNT(*) AS c,
+            COUNT(*) FILTER (WHERE s.status NOT IN ('Cancelled', 'Destroyed')) AS c_active,
+            MAX(GREATEST(s.date_received, s.report_date))
+                FILTER (WHERE s.status NOT IN ('Cancelled', 'Destroyed')) AS last_updated_at
         FROM glims_samples s
-        WHERE {intake_where}
-        GROUP BY adult_use_medical
-    """
-    samples_total = 0
-    samples_by_type = {}
-    last_updated_at = None
-    for row in session.execute(text(intake_sql), params):
-        samples_total += row.samples
-        samples_by_type[row.adult_use_medical or "Unknown"] = row.samples
-        if row.last_updated_at:
-            if last_updated_at is None or row.last_updated_at > last_updated_at:
-                last_updated_at = row.last_updated_at
-
-    # Query New Customers from the dedicated table
-    new_customers_sql = """
-        SELECT COUNT(*)
-        FROM glims_new_customers
-        WHERE date_created BETWEEN :start AND :end
+        WHERE s.date_received BETWEEN :start AND :end {disp_clause} {type_clause}
+        GROUP BY 1, 2
     """
-    new_customers_params = {"start": start, "end": end}
-    
-    if dispensary_id:
-        disp_name = session.execute(
-            text("SELECT name FROM glims_dispensaries WHERE id = :id"),
-            {"id": dispensary_id}
-        ).scalar()
-        if disp_name:
-            new_customers_sql += " AND client_name = :name"
-            new_customers_params["name"] = disp_name
-        else:
-            new_customers_sql += " AND 1=0"
-
-    new_customers_count = session.execute(text(new_customers_sql), new_customers_params).scalar() or 0
-
-    # Query 2: Output Metrics (based on report_date)
-    output_filters = ["s.report_date BETWEEN :start AND :end"]
-    if dispensary_id:
-        output_filters.append("s.dispensary_id = :dispensary_id")
-    if sample_type and sample_type != 'All':
-        output_filters.append("s.adult_use_medical = :sample_type")
-    output_where = " AND ".join(output_filters)
 
-    output_sql = f"""
+    # Output (based on report_date); TAT kept as sum + count so periods can be re-aggregated.
+    # Both columns are dates, so their difference is whole days: hours = days * 24
+    reported_sql = f"""
         SELECT
-            COUNT(*) AS reports,
-            adult_use_medical,
-            AVG(EXTRACT(EPOCH FROM (s.report_date::timestamp - s.date_received::timestamp))/3600.0) AS avg_tat_hours
+            date_trunc('{trunc_unit}', s.report_date)::date AS d,
+            s.adult_use_medical,
+            COUNT(*) AS c,
+            SUM((s.report_date - s.date_received) * 24.0) AS tat_hours,
+            COUNT(s.date_received) AS tat_count
         FROM glims_samples s
-        WHERE {output_where}
-        GROUP BY adult_use_medical
-    """
-    reports_total = 0
-    reports_by_type = {}
-    tat_by_type = {}
-    total_tat_hours = 0.0
-    tat_count = 0
-    for row in session.execute(text(output_sql), params):
-        reports_total += row.reports
-        type_key = row.adult_use_medical or "Unknown"
-        reports_by_type[type_key] = row.reports
-        if row.avg_tat_hours is not None:
-            tat_by_type[type_key] = float(row.avg_tat_hours)
-            total_tat_hours += float(row.avg_tat_hours) * row.reports
-            tat_count += row.reports
-
-    sync_sql = """
-        SELECT finished_at
-        FROM glims_sync_runs
-        WHERE status = 'success'
-        ORDER BY finished_at DESC
-        LIMIT 1
+        WHERE s.report_date BETWEEN :start AND :end {disp_clause} {type_clause}
+        GROUP BY 1, 2
     """
-    last_sync_at = session.execute(text(sync_sql)).scalar_one_or_none()
 
-    tests_total = 0
-    tests_by_type = {}
-    for label, (table, date_a, date_b) in ASSAY_TABLES.items():
-        test_sql = f"""
-            SELECT COUNT(*) AS c, s.adult_use_medical
-            FROM {table} r
-            JOIN glims_samples s ON s.sample_id = r.sample_id
-            WHERE COALESCE(r.{date_a}, r.{date_b}, s.date_received) BETWEEN :start AND :end
-            {"AND s.dispensary_id = :dispensary_id" if dispensary_id else ""}
-            {"AND s.adult_use_medical = :sample_type" if sample_type and sample_type != 'All' else ""}
-            GROUP BY s.adult_use_medical
-        """
-        for row in session.execute(text(test_sql), params):
-            tests_total += row.c
-            cat = row.adult_use_medical or "Unknown"
-            tests_by_type[cat] = tests_by_type.get(cat, 0) + row.c
-
-    # Add legacy tests count from requested_testing for 'Unknown' type
-    legacy_tests_sql = f"""
-        SELECT SUM(array_length(string_to_array(s.requested_testing, ', '), 1)) AS c
+    # Assay results, plus tests of legacy Qbench samples counted from requested_testing;
+    # both yield (period, type, count) so they travel as one statement
+    tests_sql = f"""
+        SELECT date_trunc('{trunc_unit}', t.d)::date AS d, t.adult_use_medical, COUNT(*) AS c
+        FROM ({_test_events_sql()}) t
+        WHERE t.d BETWEEN :start AND :end
+        {"AND t.dispensary_id = :dispensary_id" if by_dispensary else ""}
+        {"AND t.adult_use_medical = :sample_type" if by_type else ""}
+        GROUP BY 1, 2
+
+        UNION ALL
+
+        SELECT
+            date_trunc('{trunc_unit}', s.date_received)::date AS d,
+            s.adult_use_medical,
+            SUM(array_length(string_to_array(s.requested_testing, ', '), 1)) AS c
         FROM glims_samples s
         WHERE s.date_received BETWEEN :start AND :end
           AND s.adult_use_medical = 'Unknown'
           AND s.requested_testing IS NOT NULL
           AND s.requested_testing != ''
-          {"AND s.dispensary_id = :dispensary_id" if dispensary_id else ""}
-          {"AND s.adult_use_medical = :sample_type" if sample_type and sample_type != 'All' else ""}
+          {disp_clause} {type_clause}
+        GROUP BY 1, 2
     """
-    legacy_row = session.execute(text(legacy_tests_sql), params).fetchone()
-    if legacy_row and legacy_row.c:
-        legacy_count = int(legacy_row.c)
-        tests_total += legacy_count
-        tests_by_type["Unknown"] = tests_by_type.get("Unknown", 0) + legacy_count
+    return text(samples_sql), text(reported_sql), text(tests_sql)
+
+
+async def _fetch_overview_rows(
+    conn: AsyncConnection,
+    start: date,
+    end: date,
+    dispensary_id: Optional[int],
+    sample_type: Optional[str],
+    trunc_unit: str,
+) -> tuple[list[Row], list[Row], list[Row]]:
+    """Per-(period, type) samples, reports and tests shared by /summary and /activity."""
+
+    by_dispensary = bool(dispensary_id)
+    by_type = bool(sample_type and sample_type != 'All')
+    params = {"start": start, "end": end}
+    if by_dispensary:
+        params["dispensary_id"] = dispensary_id
+    if by_type:
+        params["sample_type"] = sample_type
+
+    # One connection per request, so a page load holds a single pooled connection
+    return tuple(
+        [(await conn.execute(stmt, params)).all() for stmt in _overview_statements(trunc_unit, by_dispensary, by_type)]
+    )
+
+
+_NEW_CUSTOMERS_COUNT_SQL = text("""
+    SELECT COUNT(*) AS c
+    FROM glims_new_customers
+    WHERE date_created BETWEEN :start AND :end
+""")
+
+# New customers of the selected dispensary are matched by name through a join on its id
+_NEW_CUSTOMERS_COUNT_BY_DISPENSARY_SQL = text("""
+    SELECT COUNT(*) AS c
+    FROM glims_new_customers nc
+    JOIN glims_dispensaries d ON d.name = nc.client_name AND d.id = :dispensary_id
+    WHERE nc.date_created BETWEEN :start AND :end
+""")
+
+_LAST_SYNC_SQL = text("""
+    SELECT finished_at
+    FROM glims_sync_runs
+    WHERE status = 'success'
+    ORDER BY finished_at DESC
+    LIMIT 1
+""")
+
+
+async def _fetch_summary_extras(conn: AsyncConnection, start: date, end: date, dispensary_id: Optional[int]):
+    """New-customer count and last successful sync time for the summary cards."""
+
+    if dispensary_id:
+        new_customers_stmt = _NEW_CUSTOMERS_COUNT_BY_DISPENSARY_SQL
+        new_customers_params = {"start": start, "end": end, "dispensary_id": dispensary_id}
+    else:
+        new_customers_stmt = _NEW_CUSTOMERS_COUNT_SQL
+        new_customers_params = {"start": start, "end": end}
+    new_customers_rows = (await conn.execute(new_customers_stmt, new_customers_params)).all()
+    sync_rows = (await conn.execute(_LAST_SYNC_SQL)).all()
+    return new_customers_rows[0].c or 0, sync_rows[0].finished_at if sync_rows else None
+
+
+def _build_summary(
+    rows: tuple[list[Row], list[Row], list[Row]],
+    new_customers_count: int,
+    last_sync_at: Optional[datetime],
+) -> OverviewSummary:
+    samples_rows, reported_rows, test_rows = rows
+
+    samples_total = 0
+    samples_by_type = defaultdict(int)
+    last_updated_at = None
+    # Rows are unpacked positionally, in the SELECT order of _overview_statements
+    for _, sample_type, _, active, row_updated_at in samples_rows:
+        if not active:
+            continue
+        samples_total += active
+        samples_by_type[sample_type or "Unknown"] += active
+        if row_updated_at:
+            if last_updated_at is None or row_updated_at > last_updated_at:
+                last_updated_at = row_updated_at
+
+    reports_total = 0
+    reports_by_type = defaultdict(int)
+    tat_sum_by_type = defaultdict(float)
+    tat_count_by_type = defaultdict(int)
+    for _, sample_type, count, tat_hours, row_tat_count in reported_rows:
+        type_key = sample_type or "Unknown"
+        reports_total += count
+        reports_by_type[type_key] += count
+        if row_tat_count:
+            tat_sum_by_type[type_key] += float(tat_hours)
+            tat_count_by_type[type_key] += row_tat_count
+
+    tat_by_type = {}
+    total_tat_hours = 0.0
+    tat_count = 0
+    for type_key, type_tat_count in tat_count_by_type.items():
+        tat_by_type[type_key] = tat_sum_by_type[type_key] / type_tat_count
+        total_tat_hours += tat_by_type[type_key] * reports_by_type[type_key]
+        tat_count += reports_by_type[type_key]
+
+    tests_total = 0
+    tests_by_type = defaultdict(int)
+    for _, sample_type, count in test_rows:
+        count = int(count or 0)
+        tests_total += count
+        tests_by_type[sample_type or "Unknown"] += count
 
     return OverviewSummary(
         samples=samples_total,
@@ -217,7 +344,7 @@ def get_summary(
         reports=reports_total,
         avg_tat_hours=total_tat_hours / tat_count if tat_count > 0 else None,
         samples_by_type=samples_by_type,
-        tests_by_type=tests_by_type,
+        tests_by_type={key: value for key, value in tests_by_type.items() if value},
         reports_by_type=reports_by_type,
         tat_by_type=tat_by_type,
         last_sync_at=last_sync_at,
@@ -225,210 +352,180 @@ def get_summary(
     )
 
 
-@router.get("/activity", response_model=ActivityResponse)
-def get_activity(
-    date_from: Optional[date] = Query(None),
-    date_to: Optional[date] = Query(None),
-    dispensary_id: Optional[int] = Query(None),
-    sample_type: Optional[str] = Query(None),
-    timeframe: str = Query("daily"),
-    session: Session = Depends(get_db_session),
+def _iter_activity_points(
+    rows: tuple[list[Row], list[Row], list[Row]],
+    start: date,
+    end: date,
+    timeframe: str,
+) -> Iterator[dict]:
+    """Yield one ``ActivityPoint``-shaped dict per period, in date order."""
+
+    samples_rows, reported_rows, test_rows = rows
+
+    samples_map: defaultdict[date, int] = defaultdict(int)
+    breakdown_map: defaultdict[date, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for d_val, sample_type, count, _, _ in samples_rows:
+        samples_map[d_val] += count
+        breakdown_map[d_val][sample_type or "Unknown"] += count
+
+    reported_map: defaultdict[date, int] = defaultdict(int)
+    reported_breakdown: defaultdict[date, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for d_val, sample_type, count, _, _ in reported_rows:
+        reported_map[d_val] += count
+        reported_breakdown[d_val][sample_type or "Unknown"] += count
+
+    tests_map: defaultdict[date, int] = defaultdict(int)
+    tests_breakdown: defaultdict[date, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for d_val, sample_type, count in test_rows:
+        count = count or 0
+        tests_map[d_val] += count
+        tests_breakdown[d_val][sample_type or "Unknown"] += count
+
+    # .get never inserts into the defaultdicts, so empty periods stay 0 / {}
+    samples_get = samples_map.get
+    tests_get = tests_map.get
+    reported_get = reported_map.get
+    breakdown_get = breakdown_map.get
+    tests_breakdown_get = tests_breakdown.get
+    reported_breakdown_get = reported_breakdown.get
+    for current in _period_starts(start, end, timeframe):
+        yield {
+            "date": current,
+            "samples": samples_get(current, 0),
+            "tests": tests_get(current, 0),
+            "samples_reported": reported_get(current, 0),
+            "samples_breakdown": breakdown_get(current, {}),
+            "tests_breakdown": tests_breakdown_get(current, {}),
+            "reported_breakdown": reported_breakdown_get(current, {}),
+        }
+
+
+def _build_activity(
+    rows: tuple[list[Row], list[Row], list[Row]],
+    start: date,
+    end: date,
+    timeframe: str,
 ) -> ActivityResponse:
-    start, end = _parse_dates(date_from, date_to)
-    params = {"start": start, "end": end}
-    
-    # Valida timeframe
-    if timeframe not in ["daily", "weekly", "monthly"]:
-        timeframe = "daily"
+    # Every value is already an int/date/dict of ints, so model_construct skips validation
+    points = [ActivityPoint.model_construct(**point) for point in _iter_activity_points(rows, start, end, timeframe)]
+    return ActivityResponse(points=points)
 
-    # SQL mapping for date grouping
-    trunc_unit = {
-        "daily": "day",
-        "weekly": "week",
-        "monthly": "month"
-    }[timeframe]
 
-    samples_where = ["s.date_received BETWEEN :start AND :end"]
-    if dispensary_id:
-        samples_where.append("s.dispensary_id = :dispensary_id")
-        params["dispensary_id"] = dispensary_id
-    if sample_type and sample_type != 'All':
-        samples_where.append("s.adult_use_medical = :sample_type")
-        params["sample_type"] = sample_type
+@router.get("/summary", response_model=OverviewSummary)
+@cached_response("glims:overview", policy="normal")
+async def get_summary(
+    date_range: tuple[date, date] = Depends(parsed_range),
+    dispensary_id: Optional[int] = Query(None),
+    sample_type: Optional[str] = Query(None),
+    engine: AsyncEngine = Depends(get_async_db_engine),
+) -> OverviewSummary:
+    start, end = date_range
+    # Totals do not depend on the period size; monthly buckets keep the row count lowest
+    async with engine.connect() as conn:
+        rows = await _fetch_overview_rows(conn, start, end, dispensary_id, sample_type, "month")
+        new_customers_count, last_sync_at = await _fetch_summary_extras(conn, start, end, dispensary_id)
+    return _build_summary(rows, new_customers_count, last_sync_at)
 
-    samples_sql = f"""
-        SELECT date_trunc('{trunc_unit}', s.date_received)::date AS d, s.adult_use_medical, COUNT(*) AS c
-        FROM glims_samples s
-        WHERE {" AND ".join(samples_where)}
-        GROUP BY 1, 2
-    """
-    
-    samples_map: dict[date, int] = {}
-    breakdown_map: dict[date, dict[str, int]] = {}
 
-    for row in session.execute(text(samples_sql), params):
-        d_val = row.d
-        category = row.adult_use_medical or "Unknown"
-        count = row.c
-        
-        samples_map[d_val] = samples_map.get(d_val, 0) + count
-        
-        if d_val not in breakdown_map:
-            breakdown_map[d_val] = {}
-        breakdown_map[d_val][category] = breakdown_map[d_val].get(category, 0) + count
+@router.get("/activity", response_model=ActivityResponse)
+@cached_response("glims:overview", policy="normal")
+async def get_activity(
+    date_range: tuple[date, date] = Depends(parsed_range),
+    dispensary_id: Optional[int] = Query(None),
+    sample_type: Optional[str] = Query(None),
+    timeframe: str = Query("daily"),
+    engine: AsyncEngine = Depends(get_async_db_engine),
+) -> ActivityResponse:
+    start, end = date_range
+    timeframe, trunc_unit = _normalise_timeframe(timeframe)
+    async with engine.connect() as conn:
+        rows = await _fetch_overview_rows(conn, start, end, dispensary_id, sample_type, trunc_unit)
+    # pydantic-core consumes the generator while encoding, so no point list or models are built
+    body = to_json({"points": _iter_activity_points(rows, start, end, timeframe)})
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/dashboard", response_model=OverviewDashboardResponse)
+@cached_response("glims:overview", policy="normal")
+async def get_dashboard(
+    date_range: tuple[date, date] = Depends(parsed_range),
+    dispensary_id: Optional[int] = Query(None),
+    sample_type: Optional[str] = Query(None),
+    timeframe: str = Query("daily"),
+    engine: AsyncEngine = Depends(get_async_db_engine),
+) -> OverviewDashboardResponse:
+    """Summary cards and activity timeline for the same filters from a single set of queries."""
+
+    start, end = date_range
+    timeframe, trunc_unit = _normalise_timeframe(timeframe)
+    async with engine.connect() as conn:
+        rows = await _fetch_overview_rows(conn, start, end, dispensary_id, sample_type, trunc_unit)
+        new_customers_count, last_sync_at = await _fetch_summary_extras(conn, start, end, dispensary_id)
+    return OverviewDashboardResponse(
+        summary=_build_summary(rows, new_customers_count, last_sync_at),
+        activity=_build_activity(rows, start, end, timeframe),
+    )
 
-    disp_clause = "AND s.dispensary_id = :dispensary_id" if dispensary_id else ""
-    type_clause = "AND s.adult_use_medical = :sample_type" if sample_type and sample_type != 'All' else ""
 
-    reported_sql = f"""
-        SELECT date_trunc('{trunc_unit}', s.report_date)::date AS d, s.adult_use_medical, COUNT(*) AS c
-        FROM glims_samples s
-        WHERE s.report_date BETWEEN :start AND :end {disp_clause} {type_clause}
-        GROUP BY 1, 2
-    """
-    reported_map: dict[date, int] = {}
-    reported_breakdown: dict[date, dict[str, int]] = {}
-    for row in session.execute(text(reported_sql), params):
-        d_val = row.d
-        cat = row.adult_use_medical or "Unknown"
-        reported_map[d_val] = reported_map.get(d_val, 0) + row.c
-        if d_val not in reported_breakdown:
-            reported_breakdown[d_val] = {}
-        reported_breakdown[d_val][cat] = row.c
-
-    tests_map: dict[date, int] = {}
-    tests_breakdown: dict[date, dict[str, int]] = {}
-    for label, (table, date_a, date_b) in ASSAY_TABLES.items():
-        test_sql = f"""
-            SELECT date_trunc('{trunc_unit}', COALESCE(r.{date_a}, r.{date_b}, s.date_received))::date AS d, s.adult_use_medical, COUNT(*) AS c
-            FROM {table} r
-            JOIN glims_samples s ON s.sample_id = r.sample_id
-            WHERE COALESCE(r.{date_a}, r.{date_b}, s.date_received) BETWEEN :start AND :end 
-            {disp_clause} {type_clause}
-            GROUP BY 1, 2
-        """
-        for row in session.execute(text(test_sql), params):
-            d_val = row.d
-            cat = row.adult_use_medical or "Unknown"
-            tests_map[d_val] = tests_map.get(d_val, 0) + row.c
-            if d_val not in tests_breakdown:
-                tests_breakdown[d_val] = {}
-            tests_breakdown[d_val][cat] = tests_breakdown[d_val].get(cat, 0) + row.c
-
-    # Count tests from legacy Qbench samples using requested_testing field
-    legacy_tests_sql = f"""
-        SELECT 
-            date_trunc('{trunc_unit}', s.date_received)::date AS d,
-            s.adult_use_medical,
-            SUM(array_length(string_to_array(s.requested_testing, ', '), 1)) AS c
+# First sample of each dispensary in the range: one probe per dispensary on the
+# (dispensary_id, date_received) index instead of aggregating every sample in the range
+_NEW_CUSTOMERS_SQL = text("""
+    SELECT d.id, d.name, first_sample.created_at
+    FROM glims_dispensaries d
+    CROSS JOIN LATERAL (
+        SELECT s.date_received AS created_at
         FROM glims_samples s
-        WHERE s.date_received BETWEEN :start AND :end
-          AND s.adult_use_medical = 'Unknown'
-          AND s.requested_testing IS NOT NULL
-          AND s.requested_testing != ''
-          {disp_clause} {type_clause}
-        GROUP BY 1, 2
-    """
-    for row in session.execute(text(legacy_tests_sql), params):
-        d_val = row.d
-        cat = row.adult_use_medical or "Unknown"
-        tests_map[d_val] = tests_map.get(d_val, 0) + (row.c or 0)
-        if d_val not in tests_breakdown:
-            tests_breakdown[d_val] = {}
-        tests_breakdown[d_val][cat] = tests_breakdown[d_val].get(cat, 0) + (row.c or 0)
-
-    points: list[ActivityPoint] = []
-    
-    # Logic to fill gaps based on timeframe
-    current = start
-    if timeframe == "weekly":
-        # Start at beginning of week
-        current = current - timedelta(days=current.weekday())
-    elif timeframe == "monthly":
-        # Start at beginning of month
-        current = date(current.year, current.month, 1)
-
-    while current <= end:
-        points.append(
-            ActivityPoint(
-                date=current,
-                samples=samples_map.get(current, 0),
-                tests=tests_map.get(current, 0),
-                samples_reported=reported_map.get(current, 0),
-                samples_breakdown=breakdown_map.get(current, {}),
-                tests_breakdown=tests_breakdown.get(current, {}),
-                reported_breakdown=reported_breakdown.get(current, {}),
-            )
-        )
-        if timeframe == "daily":
-            current += timedelta(days=1)
-        elif timeframe == "weekly":
-            current += timedelta(weeks=1)
-        elif timeframe == "monthly":
-            # Add one month
-            month = current.month + 1
-            year = current.year
-            if month > 12:
-                month = 1
-                year += 1
-            current = date(year, month, 1)
-
-    return ActivityResponse(points=points)
-    return ActivityResponse(points=points)
+        WHERE s.dispensary_id = d.id
+          AND s.date_received BETWEEN :start AND :end
+        ORDER BY s.date_received
+        LIMIT 1
+    ) first_sample
+    ORDER BY first_sample.created_at DESC
+    LIMIT :limit
+""")
 
 
 @router.get("/customers/new", response_model=NewCustomersResponse)
-def get_new_customers(
-    date_from: Optional[date] = Query(None),
-    date_to: Optional[date] = Query(None),
+@cached_response("glims:overview", policy="long")
+async def get_new_customers(
+    date_range: tuple[date, date] = Depends(parsed_range),
     limit: int = Query(10, ge=1, le=50),
-    session: Session = Depends(get_db_session),
+    engine: AsyncEngine = Depends(get_async_db_engine),
 ) -> NewCustomersResponse:
-    start, end = _parse_dates(date_from, date_to)
-    sql = """
-        SELECT d.id, d.name, MIN(s.date_received) AS created_at
-        FROM glims_samples s
-        JOIN glims_dispensaries d ON d.id = s.dispensary_id
-        WHERE s.date_received BETWEEN :start AND :end
-        GROUP BY d.id, d.name
-        ORDER BY created_at DESC
-        LIMIT :limit
-    """
-    rows = session.execute(text(sql), {"start": start, "end": end, "limit": limit}).all()
-    customers = [NewCustomerItem(id=row.id, name=row.name, created_at=row.created_at) for row in rows]
+    start, end = date_range
+    rows = await _fetch_all(engine, _NEW_CUSTOMERS_SQL, {"start": start, "end": end, "limit": limit})
+    customers = [NewCustomerItem.model_construct(id=row.id, name=row.name, created_at=row.created_at) for row in rows]
     return NewCustomersResponse(customers=customers)
 
 
+_NEW_CUSTOMERS_FROM_SHEET_SQL = text("""
+    SELECT client_id, client_name, date_created
+    FROM glims_new_customers
+    WHERE date_created BETWEEN :start AND :end
+    ORDER BY client_id DESC
+    LIMIT :limit
+""")
+
+
 @router.get("/customers/new-from-sheet", response_model=NewCustomersFromSheetResponse)
-def get_new_customers_from_sheet(
-    date_from: Optional[date] = Query(None),
-    date_to: Optional[date] = Query(None),
+@cached_response("glims:overview", policy="long")
+async def get_new_customers_from_sheet(
+    date_range: tuple[date, date] = Depends(parsed_range),
     limit: int = Query(10, ge=1, le=50),
-    session: Session = Depends(get_db_session),
+    engine: AsyncEngine = Depends(get_async_db_engine),
 ) -> NewCustomersFromSheetResponse:
     """
     Retorna los nuevos customers detectados desde el tab Dispensaries del Google Sheet.
     Usa la tabla glims_new_customers.
     """
-    start, end = _parse_dates(date_from, date_to)
-
-    sql = """
-        SELECT client_id, client_name, date_created
-        FROM glims_new_customers
-        WHERE date_created BETWEEN :start AND :end
-        ORDER BY client_id DESC
-        LIMIT :limit
-    """
-    rows = session.execute(text(sql), {"start": start, "end": end, "limit": limit}).all()
-
-    count_sql = """
-        SELECT COUNT(*) FROM glims_new_customers
-        WHERE date_created BETWEEN :start AND :end
-    """
-    total = session.execute(text(count_sql), {"start": start, "end": end}).scalar_one()
+    start, end = date_range
+    async with engine.connect() as conn:
+        rows = (await conn.execute(_NEW_CUSTOMERS_FROM_SHEET_SQL, {"start": start, "end": end, "limit": limit})).all()
+        count_rows = (await conn.execute(_NEW_CUSTOMERS_COUNT_SQL, {"start": start, "end": end})).all()
+    total = count_rows[0][0]
 
     customers = [
-        NewCustomerFromSheetItem(
+        NewCustomerFromSheetItem.model_construct(
             client_id=row.client_id,
             client_name=row.client_name,
             date_created=row.date_created,
@@ -438,53 +535,84 @@ def get_new_customers_from_sheet(
     return NewCustomersFromSheetResponse(customers=customers, total=total)
 
 
-@router.get("/customers/top-tests", response_model=TopCustomersResponse)
-def get_top_customers(
-    date_from: Optional[date] = Query(None),
-    date_to: Optional[date] = Query(None),
-    dispensary_id: Optional[int] = Query(None),
-    sample_type: Optional[str] = Query(None),
-    limit: int = Query(10, ge=1, le=50),
-    session: Session = Depends(get_db_session),
-) -> TopCustomersResponse:
-    start, end = _parse_dates(date_from, date_to)
-    params = {"start": start, "end": end, "limit": limit}
+# glims_samples is joined once in the outer query, not once per assay table. Each branch keeps
+# only results dated within the range (r_d set) or undated ones (r_d NULL), matching the
+# per-table effective-date and undated indexes; undated results are then range-checked on the
+# sample's date_received.
+_TOP_CUSTOMERS_UNION_SQL = " UNION ALL ".join(
+    f"SELECT r.sample_id, COALESCE(r.{date_a}, r.{date_b}) AS r_d FROM {table} r "
+    f"WHERE COALESCE(r.{date_a}, r.{date_b}) BETWEEN :start AND :end "
+    f"OR (r.{date_a} IS NULL AND r.{date_b} IS NULL)"
+    for table, date_a, date_b in ASSAY_TABLES.values()
+)
 
-    filters = ["t.d BETWEEN :start AND :end"]
-    if dispensary_id:
+
+@lru_cache(maxsize=None)
+def _top_customers_statement(by_dispensary: bool, by_type: bool) -> TextClause:
+    """Top dispensaries by tests, collapsing events to per-sample counts before the joins.
+
+    Dated events were already range-checked inside the union; undated ones only count when
+    their sample was received within the range.
+    """
+
+    filters = ["x.tests > 0"]
+    if by_dispensary:
         filters.append("s.dispensary_id = :dispensary_id")
-        params["dispensary_id"] = dispensary_id
-    if sample_type and sample_type != 'All':
+    if by_type:
         filters.append("s.adult_use_medical = :sample_type")
-        params["sample_type"] = sample_type
-
-    test_union_parts = []
-    for label, (table, date_a, date_b) in ASSAY_TABLES.items():
-        test_union_parts.append(
-            f"SELECT r.sample_id, COALESCE(r.{date_a}, r.{date_b}, s.date_received) AS d FROM {table} r JOIN glims_samples s ON s.sample_id = r.sample_id"
-        )
-    test_union = " UNION ALL ".join(test_union_parts)
-    
     where_clause = " AND ".join(filters)
-    
-    sql = f"""
+    if get_settings().glims_test_events_view:
+        events_sql = "SELECT sample_id, d AS r_d FROM glims_test_events WHERE d BETWEEN :start AND :end"
+    else:
+        events_sql = _TOP_CUSTOMERS_UNION_SQL
+
+    return text(f"""
         WITH test_events AS (
-            {test_union}
+            {events_sql}
+        ),
+        per_sample AS (
+            SELECT sample_id, COUNT(r_d) AS dated, COUNT(*) - COUNT(r_d) AS undated
+            FROM test_events
+            GROUP BY sample_id
         )
         SELECT d.id, d.name,
-               COUNT(*) AS tests,
-               COUNT(*) FILTER (WHERE s.report_date BETWEEN :start AND :end) AS tests_reported
-        FROM test_events t
-        JOIN glims_samples s ON s.sample_id = t.sample_id
+               SUM(x.tests)::bigint AS tests,
+               COALESCE(SUM(x.tests) FILTER (WHERE s.report_date BETWEEN :start AND :end), 0)::bigint
+                   AS tests_reported
+        FROM per_sample p
+        JOIN glims_samples s ON s.sample_id = p.sample_id
         JOIN glims_dispensaries d ON d.id = s.dispensary_id
+        CROSS JOIN LATERAL (
+            SELECT p.dated + CASE WHEN s.date_received BETWEEN :start AND :end THEN p.undated ELSE 0 END AS tests
+        ) x
         WHERE {where_clause}
         GROUP BY d.id, d.name
         ORDER BY tests DESC
         LIMIT :limit
-    """
-    rows = session.execute(text(sql), params).all()
+    """)
+
+
+@router.get("/customers/top-tests", response_model=TopCustomersResponse)
+@cached_response("glims:overview", policy="long")
+async def get_top_customers(
+    date_range: tuple[date, date] = Depends(parsed_range),
+    dispensary_id: Optional[int] = Query(None),
+    sample_type: Optional[str] = Query(None),
+    limit: int = Query(10, ge=1, le=50),
+    engine: AsyncEngine = Depends(get_async_db_engine),
+) -> TopCustomersResponse:
+    start, end = date_range
+    params = {"start": start, "end": end, "limit": limit}
+    by_dispensary = bool(dispensary_id)
+    by_type = bool(sample_type and sample_type != 'All')
+    if by_dispensary:
+        params["dispensary_id"] = dispensary_id
+    if by_type:
+        params["sample_type"] = sample_type
+
+    rows = await _fetch_all(engine, _top_customers_statement(by_dispensary, by_type), params)
     customers = [
-        TopCustomerItem(
+        TopCustomerItem.model_construct(
             id=row.id,
             name=row.name,
             tests=row.tests,
@@ -495,203 +623,202 @@ def get_top_customers(
     return TopCustomersResponse(customers=customers)
 
 
+@lru_cache(maxsize=None)
+def _tests_by_label_statement(by_dispensary: bool, by_type: bool) -> TextClause:
+    """Per (label, type) assay counts plus legacy ``requested_testing`` counts in one round trip."""
+
+    disp_clause = "AND s.dispensary_id = :dispensary_id" if by_dispensary else ""
+    type_clause = "AND s.adult_use_medical = :sample_type" if by_type else ""
+    return text(f"""
+        SELECT t.label, t.adult_use_medical, COUNT(*) AS c
+        FROM ({_test_events_sql()}) t
+        WHERE t.d BETWEEN :start AND :end
+        {"AND t.dispensary_id = :dispensary_id" if by_dispensary else ""}
+        {"AND t.adult_use_medical = :sample_type" if by_type else ""}
+        GROUP BY t.label, t.adult_use_medical
+
+        UNION ALL
+
+        -- Legacy counts from requested_testing (each label counted once per sample)
+        SELECT lbl.label, 'Unknown', COUNT(*)
+        FROM glims_samples s
+        CROSS JOIN LATERAL (
+            SELECT DISTINCT unnest(string_to_array(s.requested_testing, ', ')) AS label
+        ) lbl
+        WHERE s.date_received BETWEEN :start AND :end
+          AND s.adult_use_medical = 'Unknown'
+          AND s.requested_testing IS NOT NULL
+          AND lbl.label = ANY(:labels)
+          {disp_clause} {type_clause}
+        GROUP BY lbl.label
+    """)
+
+
 @router.get("/tests/by-label", response_model=TestsByLabelResponse)
-def get_tests_by_label(
-    date_from: Optional[date] = Query(None),
-    date_to: Optional[date] = Query(None),
+@cached_response("glims:overview", policy="long")
+async def get_tests_by_label(
+    date_range: tuple[date, date] = Depends(parsed_range),
     dispensary_id: Optional[int] = Query(None),
     sample_type: Optional[str] = Query(None),
-    session: Session = Depends(get_db_session),
+    engine: AsyncEngine = Depends(get_async_db_engine),
 ) -> TestsByLabelResponse:
-    start, end = _parse_dates(date_from, date_to)
-    params = {"start": start, "end": end}
-    if dispensary_id:
+    start, end = date_range
+    by_dispensary = bool(dispensary_id)
+    by_type = bool(sample_type and sample_type != 'All')
+    params = {"start": start, "end": end, "labels": list(ASSAY_TABLES)}
+    if by_dispensary:
         params["dispensary_id"] = dispensary_id
-    if sample_type and sample_type != 'All':
+    if by_type:
         params["sample_type"] = sample_type
-    labels: list[TestsByLabelItem] = []
-    for label, (table, date_a, date_b) in ASSAY_TABLES.items():
-        sql = f"""
-            SELECT COUNT(*) AS c, s.adult_use_medical
-            FROM {table} r
-            JOIN glims_samples s ON s.sample_id = r.sample_id
-            WHERE COALESCE(r.{date_a}, r.{date_b}, s.date_received) BETWEEN :start AND :end
-            {"AND s.dispensary_id = :dispensary_id" if dispensary_id else ""}
-            {"AND s.adult_use_medical = :sample_type" if sample_type and sample_type != 'All' else ""}
-            GROUP BY s.adult_use_medical
-        """
-        
-        total_for_label = 0
-        breakdown = {}
-        for row in session.execute(text(sql), params):
-            total_for_label += row.c
-            breakdown[row.adult_use_medical or "Unknown"] = row.c
-        
-        # Add legacy counts from requested_testing for this specific label
-        legacy_label_sql = f"""
-            SELECT COUNT(*)
-            FROM glims_samples s
-            WHERE s.date_received BETWEEN :start AND :end
-              AND s.adult_use_medical = 'Unknown'
-              AND s.requested_testing IS NOT NULL
-              AND :label = ANY(string_to_array(s.requested_testing, ', '))
-              {"AND s.dispensary_id = :dispensary_id" if dispensary_id else ""}
-              {"AND s.adult_use_medical = :sample_type" if sample_type and sample_type != 'All' else ""}
-        """
-        legacy_label_params = {**params, "label": label}
-        legacy_count = session.execute(text(legacy_label_sql), legacy_label_params).scalar() or 0
-        if legacy_count > 0:
-            total_for_label += legacy_count
-            breakdown["Unknown"] = breakdown.get("Unknown", 0) + legacy_count
-        
-        labels.append(TestsByLabelItem(key=label, count=total_for_label, breakdown=breakdown))
+
+    breakdowns: dict[str, dict[str, int]] = {label: {} for label in ASSAY_TABLES}
+    rows = await _fetch_all(engine, _tests_by_label_statement(by_dispensary, by_type), params)
+    for label, row_type, count in rows:
+        breakdown = breakdowns[label]
+        type_key = row_type or "Unknown"
+        breakdown[type_key] = breakdown.get(type_key, 0) + count
+
+    labels: list[TestsByLabelItem] = [
+        TestsByLabelItem.model_construct(key=label, count=sum(breakdown.values()), breakdown=breakdown)
+        for label, breakdown in breakdowns.items()
+    ]
     labels.sort(key=lambda x: x.count, reverse=True)
     return TestsByLabelResponse(labels=labels)
 
 
+@lru_cache(maxsize=None)
+def _tat_daily_statement(trunc_unit: str, by_dispensary: bool, by_type: bool) -> TextClause:
+    # We ignore sample_type parameter in the query to return full breakdown for client-side multi-select
+    # per_date holds the report-weighted average of each date and its moving average, so
+    # Python only has to lay out the per-type breakdowns
+    return text(f"""
+        WITH per_sample AS (
+            -- TAT hours evaluated once per sample and shared by the average and both counts
+            -- (date - date is whole days, so no timestamp casts are needed)
+            SELECT
+                date_trunc('{trunc_unit}', s.report_date)::date AS d,
+                s.adult_use_medical,
+                (s.report_date - s.date_received) * 24.0 AS h
+            FROM glims_samples s
+            WHERE s.report_date BETWEEN :start AND :end
+              AND s.date_received IS NOT NULL
+              {"AND s.dispensary_id = :dispensary_id" if by_dispensary else ""}
+              {"AND s.adult_use_medical = :sample_type" if by_type else ""}
+        ),
+        per_type AS (
+            SELECT
+                d,
+                adult_use_medical,
+                AVG(h) AS avg_hours,
+                COUNT(*) FILTER (WHERE h <= :tat_target_hours) AS within_tat,
+                COUNT(*) FILTER (WHERE h > :tat_target_hours) AS beyond_tat,
+                COUNT(*) AS total_for_type
+            FROM per_sample
+            GROUP BY 1, 2
+        ),
+        per_day AS (
+            SELECT
+                d,
+                SUM(avg_hours * (within_tat + beyond_tat)) / NULLIF(SUM(within_tat + beyond_tat), 0) AS day_hours
+            FROM per_type
+            GROUP BY d
+        ),
+        per_date AS (
+            SELECT
+                d,
+                day_hours,
+                AVG(day_hours) OVER (
+                    ORDER BY d ROWS BETWEEN CAST(:ma_window AS integer) PRECEDING AND CURRENT ROW
+                ) AS ma_hours
+            FROM per_day
+        )
+        SELECT t.*, m.day_hours, m.ma_hours
+        FROM per_type t
+        JOIN per_date m ON m.d = t.d
+        ORDER BY 1
+    """)
+
+
 @router.get("/tat-daily", response_model=TatDailyResponse)
-def get_tat_daily(
-    date_from: Optional[date] = Query(None),
-    date_to: Optional[date] = Query(None),
+@cached_response("glims:overview", policy="normal")
+async def get_tat_daily(
+    date_range: tuple[date, date] = Depends(parsed_range),
     dispensary_id: Optional[int] = Query(None),
     sample_type: Optional[str] = Query(None),
     timeframe: str = Query("daily"),
     tat_target_hours: float = Query(72.0, ge=1.0),
     moving_average_window: int = Query(7, ge=1, le=30),
-    session: Session = Depends(get_db_session),
+    engine: AsyncEngine = Depends(get_async_db_engine),
 ) -> TatDailyResponse:
-    start, end = _parse_dates(date_from, date_to)
-    params = {"start": start, "end": end, "tat_target_hours": tat_target_hours}
-    if dispensary_id:
+    start, end = date_range
+    by_dispensary = bool(dispensary_id)
+    by_type = bool(sample_type and sample_type != 'All')
+    params = {
+        "start": start,
+        "end": end,
+        "tat_target_hours": tat_target_hours,
+        "ma_window": moving_average_window - 1,
+    }
+    if by_dispensary:
         params["dispensary_id"] = dispensary_id
-    if sample_type and sample_type != 'All':
+    if by_type:
         params["sample_type"] = sample_type
+    _, trunc_unit = _normalise_timeframe(timeframe)
 
-    # Valida timeframe
-    if timeframe not in ["daily", "weekly", "monthly"]:
-        timeframe = "daily"
-
-    trunc_unit = {
-        "daily": "day",
-        "weekly": "week",
-        "monthly": "month"
-    }[timeframe]
-    
-    # We ignore sample_type parameter in the query to return full breakdown for client-side multi-select
-    sql = f"""
-        SELECT
-            date_trunc('{trunc_unit}', s.report_date)::date AS d,
-            s.adult_use_medical,
-            AVG(EXTRACT(EPOCH FROM (s.report_date::timestamp - s.date_received::timestamp))/3600.0) AS avg_hours,
-            COUNT(*) FILTER (WHERE EXTRACT(EPOCH FROM (s.report_date::timestamp - s.date_received::timestamp))/3600.0 <= :tat_target_hours) AS within_tat,
-            COUNT(*) FILTER (WHERE EXTRACT(EPOCH FROM (s.report_date::timestamp - s.date_received::timestamp))/3600.0 > :tat_target_hours) AS beyond_tat,
-            COUNT(*) AS total_for_type
-        FROM glims_samples s
-        WHERE s.report_date BETWEEN :start AND :end
-          AND s.date_received IS NOT NULL
-          {"AND s.dispensary_id = :dispensary_id" if dispensary_id else ""}
-          {"AND s.adult_use_medical = :sample_type" if sample_type and sample_type != 'All' else ""}
-        GROUP BY 1, 2
-        ORDER BY 1
-    """
-    rows = session.execute(text(sql), params).all()
+    rows = await _fetch_all(engine, _tat_daily_statement(trunc_unit, by_dispensary, by_type), params)
     
-    # Group by date in Python
+    # Group by date in Python (rows arrive in date order)
     points_by_date: dict[date, TatDailyPoint] = {}
-    for row in rows:
-        d = row.d
-        if d not in points_by_date:
-            points_by_date[d] = TatDailyPoint(
+    # Positional unpack follows per_type's column order plus the joined per-date averages
+    for d, row_type, avg_hours, within_tat, beyond_tat, _, day_hours, ma_hours in rows:
+        p = points_by_date.get(d)
+        if p is None:
+            p = points_by_date[d] = TatDailyPoint.model_construct(
                 date=d,
-                average_hours=0,
+                average_hours=float(day_hours) if day_hours is not None else None,
                 within_tat=0,
                 beyond_tat=0,
                 within_breakdown={},
                 beyond_breakdown={},
-                hours_breakdown={}
+                hours_breakdown={},
+                moving_average_hours=float(ma_hours) if ma_hours is not None else None,
             )
         
-        p = points_by_date[d]
-        type_key = row.adult_use_medical or "Unknown"
+        type_key = row_type or "Unknown"
         
         # Breakdown population
-        p.within_breakdown[type_key] = row.within_tat or 0
-        p.beyond_breakdown[type_key] = row.beyond_tat or 0
-        p.hours_breakdown[type_key] = float(row.avg_hours) if row.avg_hours is not None else 0
+        p.within_breakdown[type_key] = within_tat or 0
+        p.beyond_breakdown[type_key] = beyond_tat or 0
+        p.hours_breakdown[type_key] = float(avg_hours) if avg_hours is not None else 0
         
-        # Aggregation (for default/full view if needed, but primarily for sorting/MA)
-        p.within_tat += row.within_tat or 0
-        p.beyond_tat += row.beyond_tat or 0
-    
-    # Group by date in Python
-    points_by_date: dict[date, TatDailyPoint] = {}
-    for row in rows:
-        d = row.d
-        if d not in points_by_date:
-            points_by_date[d] = TatDailyPoint(
-                date=d,
-                average_hours=0,
-                within_tat=0,
-                beyond_tat=0,
-                within_breakdown={},
-                beyond_breakdown={},
-                hours_breakdown={}
-            )
-        
-        p = points_by_date[d]
-        type_key = row.adult_use_medical or "Unknown"
-        
-        # Breakdown population
-        p.within_breakdown[type_key] = row.within_tat or 0
-        p.beyond_breakdown[type_key] = row.beyond_tat or 0
-        p.hours_breakdown[type_key] = float(row.avg_hours) if row.avg_hours is not None else 0
-        
-        # Aggregation (for default/full view if needed, but primarily for sorting/MA)
-        p.within_tat += row.within_tat or 0
-        p.beyond_tat += row.beyond_tat or 0
-        
-    # Sort and calculate daily average for the combined point (weighted average)
-    sorted_dates = sorted(points_by_date.keys())
-    points: list[TatDailyPoint] = []
-    for d in sorted_dates:
-        p = points_by_date[d]
-        total_reports = p.within_tat + p.beyond_tat
-        if total_reports > 0:
-            total_hours = sum(p.hours_breakdown[t] * (p.within_breakdown[t] + p.beyond_breakdown[t]) for t in p.hours_breakdown)
-            p.average_hours = total_hours / total_reports
-        else:
-            p.average_hours = None
-        points.append(p)
-
-    # moving average
-    for idx, point in enumerate(points):
-        window_start = max(0, idx - moving_average_window + 1)
-        window = points[window_start : idx + 1]
-        values = [p.average_hours for p in window if p.average_hours is not None]
-        point.moving_average_hours = float(sum(values) / len(values)) if values else None
-
-    return TatDailyResponse(points=points)
+        # Aggregation (for default/full view if needed)
+        p.within_tat += within_tat or 0
+        p.beyond_tat += beyond_tat or 0
+
+    return TatDailyResponse(points=list(points_by_date.values()))
+
+
+_CUSTOMERS_LIST_SQL = text("""
+    SELECT DISTINCT d.id, d.name
+    FROM glims_dispensaries d
+    JOIN glims_samples s ON s.dispensary_id = d.id
+    WHERE s.date_received BETWEEN :start AND :end
+    AND s.status NOT IN ('Cancelled', 'Destroyed')
+    ORDER BY d.name ASC
+""")
 
 
 @router.get("/customers/list", response_model=CustomerListResponse)
-def get_customers_list(
-    date_from: Optional[date] = Query(None),
-    date_to: Optional[date] = Query(None),
-    session: Session = Depends(get_db_session),
+@cached_response("glims:overview", policy="long")
+async def get_customers_list(
+    date_range: tuple[date, date] = Depends(parsed_range),
+    engine: AsyncEngine = Depends(get_async_db_engine),
 ) -> CustomerListResponse:
     """
     Retorna la lista de dispensaries que tienen actividad (muestras) en el rango,
     ordenados alfabéticamente por nombre.
     """
-    start, end = _parse_dates(date_from, date_to)
-    sql = """
-        SELECT DISTINCT d.id, d.name
-        FROM glims_dispensaries d
-        JOIN glims_samples s ON s.dispensary_id = d.id
-        WHERE s.date_received BETWEEN :start AND :end
-        AND s.status NOT IN ('Cancelled', 'Destroyed')
-        ORDER BY d.name ASC
-    """
-    rows = session.execute(text(sql), {"start": start, "end": end}).all()
-    customers = [CustomerListItem(id=row.id, name=row.name) for row in rows]
+    start, end = date_range
+    rows = await _fetch_all(engine, _CUSTOMERS_LIST_SQL, {"start": start, "end": end})
+    customers = [CustomerListItem.model_construct(id=row.id, name=row.name) for row in rows]
     return CustomerListResponse(customers=customers)
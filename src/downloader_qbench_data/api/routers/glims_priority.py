@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import TextClause
 
-from downloader_qbench_data.api.dependencies import get_db_session, require_active_user
+from downloader_qbench_data.api.dependencies import get_async_db_session, require_active_user
+from downloader_qbench_data.api.response_cache import cached_response, glims_hourly_version
 from downloader_qbench_data.api.schemas.glims_priority import (
     PriorityHeatmapItem,
     PriorityHeatmapResponse,
@@ -17,6 +20,7 @@ from downloader_qbench_data.api.schemas.glims_priority import (
     PrioritySampleResponse,
     PriorityTestItem,
 )
+from downloader_qbench_data.config import get_settings
 
 router = APIRouter(
     prefix="/api/v2/glims/priority",
@@ -44,111 +48,166 @@ ASSAY_START_MAP = {
 
 EXCLUDE_PATTERN = r"(-HO[12](-\d+)?)$|(-(1|2|3|N))$"
 
+# Received at least :min_days before now (New York time); same as open_hours >= :min_days * 24
+# for a date column, but a plain range on date_received that the open-sample indexes can serve
+_OVERDUE_CUTOFF_SQL = "(timezone('America/New_York', now()) - make_interval(days => :min_days))::date"
 
-def _min_days(min_days_overdue: Optional[int]) -> int:
-    if min_days_overdue is None:
-        return 3
-    return max(0, min_days_overdue)
-
+_TESTS_STATUS_UNION_SQL = " UNION ALL ".join(
+    f"SELECT sample_id, status FROM {table}" for table, _ in ASSAY_START_MAP.values()
+)
 
-@router.get("/most-overdue", response_model=PrioritySampleResponse, status_code=status.HTTP_200_OK)
-def get_most_overdue_samples(
-    min_days_overdue: Optional[int] = Query(3, ge=0),
-    limit: int = Query(50, ge=1, le=200),
-    session: Session = Depends(get_db_session),
-) -> PrioritySampleResponse:
+# The sample filter sits inside every branch so each table is probed by its sample_id index;
+# each sample's tests come back as one JSON array, ordered by label
+_TESTS_BY_SAMPLE_SQL = text(f"""
+    SELECT sample_id,
+           jsonb_agg(
+               jsonb_build_object(
+                   'label', label,
+                   'start_date', start_date,
+                   'complete', COALESCE(status = 'Completed', false),
+                   'status', status
+               )
+               ORDER BY label
+           ) AS tests
+    FROM ({" UNION ALL ".join(
+        f"SELECT sample_id, '{label}' AS label, {start_col}::date AS start_date, status "
+        f"FROM {table} WHERE sample_id = ANY(:sample_ids)"
+        for label, (table, start_col) in ASSAY_START_MAP.items()
+    )}) t
+    GROUP BY sample_id
+""").columns(tests=JSONB)
+
+
+def _tests_count_sql() -> str:
+    """Test counts of the overdue row ``o``: the glims_tests_by_sample view when enabled, else the live union."""
+
+    if get_settings().glims_tests_by_sample_view:
+        return """
+            SELECT COALESCE(SUM(tests_total), 0)::bigint AS tests_total,
+                   COALESCE(SUM(tests_complete), 0)::bigint AS tests_complete
+            FROM glims_tests_by_sample
+            WHERE sample_id = o.sample_id
+        """
+    return f"""
+        SELECT COUNT(*) AS tests_total,
+               COUNT(*) FILTER (WHERE status = 'Completed') AS tests_complete
+        FROM ({_TESTS_STATUS_UNION_SQL}) t
+        WHERE t.sample_id = o.sample_id
     """
-    Return samples with longest open time (date_received until now), excluding HO / -N suffixes.
-    A sample is considered open/overdue if:
-    - date_received is set AND open_days >= min_days_overdue, AND
-    - (report_date is NULL OR tests_complete < tests_total).
-    Tests are complete when analytes IS NOT NULL.
+
+
+def _excluded_sample_sql() -> str:
+    """HO / -N suffix filter on sample ``s``: the is_excluded column when enabled, else the regex."""
+
+    if get_settings().glims_samples_is_excluded_column:
+        return "NOT s.is_excluded"
+    return "s.sample_id !~ :exclude_pattern"
+
+
+@lru_cache(maxsize=None)
+def _most_overdue_statement() -> TextClause:
+    """Overdue samples ranked by open time; test counts are only looked up for the rows that make the cut.
+
+    Built on first use rather than at import, so the GLIMS view and column settings are read lazily.
     """
-    min_days = _min_days(min_days_overdue)
-    now = datetime.utcnow()
-
-    # Build union of tests
-    union_parts = []
-    for label, (table, start_col) in ASSAY_START_MAP.items():
-        union_parts.append(
-            f"""
-            SELECT '{label}' AS label,
-                   sample_id,
-                   {start_col}::date AS start_date,
-                   analytes,
-                   status
-            FROM {table}
-            """
-        )
-    tests_union_sql = " UNION ALL ".join(union_parts)
 
-    sql = f"""
-        WITH tests_union AS (
-            {tests_union_sql}
-        ),
-        tests_agg AS (
-            SELECT sample_id,
-                   COUNT(*) AS tests_total,
-                   COUNT(*) FILTER (WHERE status = 'Completed') AS tests_complete
-            FROM tests_union
-            GROUP BY sample_id
-        ),
-        candidates AS (
+    return text(f"""
+        WITH candidates AS (
             SELECT
                 s.sample_id,
                 s.client_name,
                 s.dispensary_id,
-                d.name AS dispensary_name,
                 s.status,
                 s.date_received,
                 s.report_date,
-                COALESCE(ta.tests_total, 0) AS tests_total,
-                COALESCE(ta.tests_complete, 0) AS tests_complete,
                 EXTRACT(EPOCH FROM (timezone('America/New_York', now()) - s.date_received::timestamp))/3600.0 AS open_hours
             FROM glims_samples s
-            LEFT JOIN tests_agg ta ON ta.sample_id = s.sample_id
-            LEFT JOIN glims_dispensaries d ON d.id = s.dispensary_id
-            WHERE s.date_received IS NOT NULL
-              AND s.sample_id !~ :exclude_pattern
+            WHERE s.date_received <= {_OVERDUE_CUTOFF_SQL}
+              AND {_excluded_sample_sql()}
               AND s.date_received >= '2025-01-01'
               AND s.status NOT IN ('Unknown', 'DISCONTINUED', 'NOT STARTED', 'NOT REPORTABLE', 'CLIENT CANCELLED')
+        ),
+        overdue AS (
+            SELECT *
+            FROM candidates
+            WHERE report_date IS NULL
+              AND status NOT IN ('Reported', 'Cancelled', 'Destroyed')
+            ORDER BY open_hours DESC
+            LIMIT :limit
         )
-        SELECT *
-        FROM candidates
-        WHERE report_date IS NULL
-          AND status NOT IN ('Reported', 'Cancelled', 'Destroyed')
-          AND open_hours >= (:min_days * 24)
-        ORDER BY open_hours DESC
-        LIMIT :limit
+        SELECT o.*, d.name AS dispensary_name, ta.tests_total, ta.tests_complete
+        FROM overdue o
+        LEFT JOIN glims_dispensaries d ON d.id = o.dispensary_id
+        CROSS JOIN LATERAL ({_tests_count_sql()}) ta
+        ORDER BY o.open_hours DESC
+    """)
+
+
+@lru_cache(maxsize=None)
+def _heatmap_statement(bucket: str) -> TextClause:
+    """Overdue sample counts per dispensary and ``bucket`` period, built on first use like the list query."""
+
+    return text(f"""
+        SELECT
+            s.dispensary_id,
+            d.name AS dispensary_name,
+            date_trunc('{bucket}', s.date_received)::date AS period_start,
+            COUNT(*) AS count
+        FROM glims_samples s
+        LEFT JOIN glims_dispensaries d ON d.id = s.dispensary_id
+        WHERE s.date_received <= {_OVERDUE_CUTOFF_SQL}
+          AND {_excluded_sample_sql()}
+          AND s.date_received >= '2025-01-01'
+          AND s.status NOT IN ('Unknown', 'DISCONTINUED', 'NOT STARTED', 'NOT REPORTABLE', 'CLIENT CANCELLED')
+          AND s.report_date IS NULL
+          AND s.status NOT IN ('Reported', 'Cancelled', 'Destroyed')
+        GROUP BY s.dispensary_id, d.name, period_start
+        ORDER BY period_start, dispensary_name
+    """)
+
+
+def _min_days(min_days_overdue: Optional[int]) -> int:
+    if min_days_overdue is None:
+        return 3
+    return max(0, min_days_overdue)
+
+
+@router.get("/most-overdue", response_model=PrioritySampleResponse, status_code=status.HTTP_200_OK)
+@cached_response("glims:priority", policy="normal", version=glims_hourly_version)
+async def get_most_overdue_samples(
+    min_days_overdue: Optional[int] = Query(3, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    session: AsyncSession = Depends(get_async_db_session),
+) -> PrioritySampleResponse:
+    """
+    Return samples with longest open time (date_received until now), excluding HO / -N suffixes.
+    A sample is considered open/overdue if:
+    - date_received is set AND open_days >= min_days_overdue, AND
+    - (report_date is NULL OR tests_complete < tests_total).
+    Tests are complete when analytes IS NOT NULL.
     """
     params = {
-        "now": now,
-        "min_days": min_days,
+        "min_days": _min_days(min_days_overdue),
         "limit": limit,
         "exclude_pattern": EXCLUDE_PATTERN,
     }
-    rows = session.execute(text(sql), params).all()
+    rows = (await session.execute(_most_overdue_statement(), params)).all()
     sample_ids = [row.sample_id for row in rows]
     if not sample_ids:
         return PrioritySampleResponse(samples=[])
 
     # Fetch tests for these samples
-    tests_sql = f"""
-        SELECT t.sample_id, t.label, t.start_date, (t.status = 'Completed') AS complete, t.status
-        FROM ({tests_union_sql}) t
-        WHERE t.sample_id = ANY(:sample_ids)
-    """
-    tests_rows = session.execute(text(tests_sql), {"sample_ids": sample_ids}).all()
-    tests_by_sample: dict[str, list[PriorityTestItem]] = {}
-    for t in tests_rows:
-        tests_by_sample.setdefault(t.sample_id, []).append(
-            PriorityTestItem(label=t.label, start_date=t.start_date, complete=bool(t.complete), status=t.status)
-        )
+    tests_rows = (await session.execute(_TESTS_BY_SAMPLE_SQL, {"sample_ids": sample_ids})).all()
+    # Validated: dates inside the jsonb tests array arrive as ISO strings
+    tests_by_sample = {
+        sample_id: [PriorityTestItem(**test) for test in tests] for sample_id, tests in tests_rows
+    }
 
+    # Sample and heatmap columns come typed from Postgres, so model_construct skips validation
     samples: list[PrioritySampleItem] = []
     for row in rows:
         samples.append(
-            PrioritySampleItem(
+            PrioritySampleItem.model_construct(
                 sample_id=row.sample_id,
                 client_name=row.client_name,
                 dispensary_id=row.dispensary_id,
@@ -166,57 +225,20 @@ def get_most_overdue_samples(
 
 
 @router.get("/overdue-heatmap", response_model=PriorityHeatmapResponse, status_code=status.HTTP_200_OK)
-def get_overdue_heatmap(
+@cached_response("glims:priority", policy="normal", version=glims_hourly_version)
+async def get_overdue_heatmap(
     min_days_overdue: Optional[int] = Query(3, ge=0),
     bucket: str = Query("week", regex="^(day|week)$"),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> PriorityHeatmapResponse:
     """
     Heatmap-like aggregation: counts of overdue samples by dispensary and period (day/week).
     Overdue definition matches most-overdue endpoint.
     """
-    min_days = _min_days(min_days_overdue)
-    bucket_expr = "date_trunc('week', s.date_received)" if bucket == "week" else "date_trunc('day', s.date_received)"
-    now = datetime.utcnow()
-    sql = f"""
-        WITH tests_union AS (
-            { " UNION ALL ".join(
-                f"SELECT sample_id, analytes, status FROM {table}" for table, _ in ASSAY_START_MAP.values()
-            ) }
-        ),
-        tests_agg AS (
-            SELECT sample_id,
-                   COUNT(*) AS tests_total,
-                   COUNT(*) FILTER (WHERE status = 'Completed') AS tests_complete
-            FROM tests_union
-            GROUP BY sample_id
-        )
-        SELECT
-            s.dispensary_id,
-            d.name AS dispensary_name,
-            {bucket_expr}::date AS period_start,
-            COUNT(*) AS count
-        FROM glims_samples s
-        LEFT JOIN tests_agg ta ON ta.sample_id = s.sample_id
-        LEFT JOIN glims_dispensaries d ON d.id = s.dispensary_id
-        WHERE s.date_received IS NOT NULL
-          AND s.sample_id !~ :exclude_pattern
-          AND s.date_received >= '2025-01-01'
-          AND s.status NOT IN ('Unknown', 'DISCONTINUED', 'NOT STARTED', 'NOT REPORTABLE', 'CLIENT CANCELLED')
-          AND s.report_date IS NULL
-          AND s.status NOT IN ('Reported', 'Cancelled', 'Destroyed')
-          AND EXTRACT(EPOCH FROM (timezone('America/New_York', now()) - s.date_received::timestamp))/3600.0 >= (:min_days * 24)
-        GROUP BY s.dispensary_id, d.name, period_start
-        ORDER BY period_start, dispensary_name
-    """
-    params = {
-        "now": now,
-        "min_days": min_days,
-        "exclude_pattern": EXCLUDE_PATTERN,
-    }
-    rows = session.execute(text(sql), params).all()
+    params = {"min_days": _min_days(min_days_overdue), "exclude_pattern": EXCLUDE_PATTERN}
+    rows = (await session.execute(_heatmap_statement(bucket), params)).all()
     buckets = [
-        PriorityHeatmapItem(
+        PriorityHeatmapItem.model_construct(
             dispensary_id=row.dispensary_id,
             dispensary_name=row.dispensary_name,
             period_start=row.period_start,
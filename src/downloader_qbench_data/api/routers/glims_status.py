@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import json
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, status
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from downloader_qbench_data.api.dependencies import get_db_session, require_active_user
+from downloader_qbench_data.api.dependencies import get_async_db_session, require_active_user
 from downloader_qbench_data.api.schemas.glims_status import (
-    ALLOWED_STATUSES,
+    ALLOWED_STATUSES_MESSAGE,
     DispensarySuggestRequest,
     DispensarySuggestResponse,
+    StatusEventBatchResponse,
     StatusEventCreate,
     StatusEventResponse,
+    normalize_status,
 )
 
 router = APIRouter(
@@ -24,28 +27,27 @@ router = APIRouter(
 )
 
 
-def _normalize_status(value: str) -> str:
-    return " ".join(part.capitalize() for part in value.strip().split())
-
-
 @router.post(
     "/status-events",
     response_model=StatusEventResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_status_event(
+async def create_status_event(
     payload: StatusEventCreate,
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> StatusEventResponse:
     sample_id = payload.sample_id.strip()
-    status_norm = _normalize_status(payload.status)
-    if status_norm not in ALLOWED_STATUSES:
-        allowed = ", ".join(sorted(ALLOWED_STATUSES))
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid status. Allowed: {allowed}")
-
-    exists = session.execute(
-        text("SELECT 1 FROM glims_samples WHERE sample_id = :sid LIMIT 1"),
-        {"sid": sample_id},
+    status_norm = normalize_status(payload.status)
+    if status_norm is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid status. Allowed: {ALLOWED_STATUSES_MESSAGE}"
+        )
+
+    exists = (
+        await session.execute(
+            text("SELECT 1 FROM glims_samples WHERE sample_id = :sid LIMIT 1"),
+            {"sid": sample_id},
+        )
     ).scalar_one_or_none()
     if not exists:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="sample_not_found")
@@ -53,21 +55,27 @@ def create_status_event(
     params = {
         "sample_id": sample_id,
         "status": status_norm,
-        "changed_at": payload.changed_at or datetime.utcnow(),
+        "changed_at": payload.changed_at,
         "source": payload.source.strip() or "apps_script",
-        "metadata": payload.metadata,
+        "metadata": json.dumps(payload.metadata) if payload.metadata is not None else None,
     }
 
-    row = session.execute(
-        text(
-            """
-            INSERT INTO glims_samples_status_events (sample_id, status, changed_at, source, metadata)
-            VALUES (:sample_id, :status, :changed_at, :source, :metadata)
-            RETURNING id, sample_id, status, changed_at, created_at, source, metadata
-            """
-        ),
-        params,
+    row = (
+        await session.execute(
+            text(
+                """
+                INSERT INTO glims_samples_status_events (sample_id, status, changed_at, source, metadata)
+                VALUES (
+                    :sample_id, :status, COALESCE(CAST(:changed_at AS timestamptz), now()), :source,
+                    CAST(:metadata AS jsonb)
+                )
+                RETURNING id, sample_id, status, changed_at, created_at, source, metadata
+                """
+            ).columns(metadata=JSONB),
+            params,
+        )
     ).one()
+    await session.commit()
 
     return StatusEventResponse(
         id=row.id,
@@ -80,48 +88,115 @@ def create_status_event(
     )
 
 
+MAX_STATUS_EVENTS_PER_BATCH = 500
+
+# Existence check and insert in one statement: events for unknown samples are simply not inserted
+_INSERT_STATUS_EVENTS_SQL = text(
+    """
+    INSERT INTO glims_samples_status_events (sample_id, status, changed_at, source, metadata)
+    SELECT e.sample_id, e.status, COALESCE(e.changed_at, now()), e.source, e.metadata::jsonb
+    FROM unnest(
+        CAST(:sample_ids AS text[]),
+        CAST(:statuses AS text[]),
+        CAST(:changed_ats AS timestamptz[]),
+        CAST(:sources AS text[]),
+        CAST(:metadata AS text[])
+    ) AS e(sample_id, status, changed_at, source, metadata)
+    WHERE EXISTS (SELECT 1 FROM glims_samples s WHERE s.sample_id = e.sample_id)
+    RETURNING id, sample_id, status, changed_at, created_at, source, metadata
+    """
+).columns(metadata=JSONB)
+
+
+@router.post(
+    "/status-events/batch",
+    response_model=StatusEventBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_status_events_batch(
+    payload: list[StatusEventCreate] = Body(..., min_length=1, max_length=MAX_STATUS_EVENTS_PER_BATCH),
+    session: AsyncSession = Depends(get_async_db_session),
+) -> StatusEventBatchResponse:
+    """Insert many status events in a single round trip; events for unknown samples are reported back."""
+
+    params = {
+        "sample_ids": [event.sample_id for event in payload],
+        "statuses": [event.status for event in payload],
+        "changed_ats": [event.changed_at for event in payload],
+        "sources": [event.source or "apps_script" for event in payload],
+        "metadata": [json.dumps(event.metadata) if event.metadata is not None else None for event in payload],
+    }
+    rows = (await session.execute(_INSERT_STATUS_EVENTS_SQL, params)).all()
+    await session.commit()
+
+    inserted = {row.sample_id for row in rows}
+    unknown = sorted({sample_id for sample_id in params["sample_ids"] if sample_id not in inserted})
+    return StatusEventBatchResponse(
+        events=[
+            StatusEventResponse(
+                id=row.id,
+                sample_id=row.sample_id,
+                status=row.status,
+                changed_at=row.changed_at,
+                created_at=row.created_at,
+                source=row.source,
+                metadata=row.metadata,
+            )
+            for row in rows
+        ],
+        unknown_sample_ids=unknown,
+    )
+
+
 @router.post(
     "/dispensaries/suggest",
     response_model=DispensarySuggestResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def suggest_dispensary(
+async def suggest_dispensary(
     payload: DispensarySuggestRequest,
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> DispensarySuggestResponse:
     name_trimmed = payload.name.strip()
     name_norm = name_trimmed.lower()
 
-    existing = session.execute(
-        text("SELECT 1 FROM glims_dispensaries WHERE lower(trim(name)) = :name LIMIT 1"),
-        {"name": name_norm},
+    existing = (
+        await session.execute(
+            text("SELECT 1 FROM glims_dispensaries WHERE lower(trim(name)) = :name LIMIT 1"),
+            {"name": name_norm},
+        )
     ).scalar_one_or_none()
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="dispensary_already_exists")
 
-    ingest_existing = session.execute(
-        text(
-            """
-            SELECT id FROM glims_dispensaries_ingest
-            WHERE name_normalized = :name_norm OR sheet_line_number = :line
-            LIMIT 1
-            """
-        ),
-        {"name_norm": name_norm, "line": payload.sheet_line_number},
+    ingest_existing = (
+        await session.execute(
+            text(
+                """
+                SELECT id FROM glims_dispensaries_ingest
+                WHERE name_normalized = :name_norm OR sheet_line_number = :line
+                LIMIT 1
+                """
+            ),
+            {"name_norm": name_norm, "line": payload.sheet_line_number},
+        )
     ).scalar_one_or_none()
     if ingest_existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="ingest_entry_already_exists")
 
-    row = session.execute(
-        text(
-            """
-            INSERT INTO glims_dispensaries_ingest (sheet_line_number, name, source)
-            VALUES (:line, :name, 'apps_script')
-            RETURNING id, name, sheet_line_number, created_at, processed, approved
-            """
-        ),
-        {"line": payload.sheet_line_number, "name": name_trimmed},
+    row = (
+        await session.execute(
+            text(
+                """
+                INSERT INTO glims_dispensaries_ingest (sheet_line_number, name, source)
+                VALUES (:line, :name, 'apps_script')
+                RETURNING id, name, sheet_line_number, created_at, processed, approved
+                """
+            ),
+            {"line": payload.sheet_line_number, "name": name_trimmed},
+        )
     ).one()
+    await session.commit()
 
     return DispensarySuggestResponse(
         id=row.id,
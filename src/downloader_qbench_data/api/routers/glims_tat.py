@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import TextClause
 
-from downloader_qbench_data.api.dependencies import get_db_session, require_active_user
+from downloader_qbench_data.api.dependencies import get_async_db_session, require_active_user
+from downloader_qbench_data.api.response_cache import cached_response
 from downloader_qbench_data.api.schemas.glims_tat import GlimsTatItem, GlimsTatResponse, GlimsTatStats
+from downloader_qbench_data.config import get_settings
 
 router = APIRouter(
     prefix="/api/v2/glims/tat",
@@ -34,17 +38,89 @@ ASSAY_TABLES = (
     "glims_lw_results",
 )
 
+# Labels of ASSAY_TABLES in the glims_tests_by_sample view (CN, MB, ...)
+_ASSAY_LABELS_SQL = ", ".join(
+    f"'{table.removeprefix('glims_').removesuffix('_results').upper()}'" for table in ASSAY_TABLES
+)
+_TESTS_UNION_SQL = " UNION ALL ".join(f"SELECT sample_id FROM {table}" for table in ASSAY_TABLES)
+
+
+def _tests_count_sql() -> str:
+    """Test count of the ranked row ``r``: the glims_tests_by_sample view when enabled, else the live union."""
+
+    if get_settings().glims_tests_by_sample_view:
+        return f"""
+            SELECT COALESCE(SUM(tests_total), 0)::bigint AS tests_count
+            FROM glims_tests_by_sample
+            WHERE sample_id = r.sample_id AND label IN ({_ASSAY_LABELS_SQL})
+        """
+    return f"SELECT COUNT(*) AS tests_count FROM ({_TESTS_UNION_SQL}) t WHERE t.sample_id = r.sample_id"
+
+
+_DISPENSARY_FILTERS = {
+    None: "",
+    "id": "AND s.dispensary_id = :dispensary_id",
+    "name": "AND (d.name ILIKE :disp_name OR s.client_name ILIKE :disp_name)",
+}
+
+
+@lru_cache(maxsize=None)
+def _slowest_statement(dispensary_filter: Optional[str]) -> TextClause:
+    """Ranked reported samples plus stats of the whole filtered set, for one dispensary filter kind.
+
+    One round trip: every row carries the stats, and the stats row survives (with NULL sample
+    columns) when nothing matches. Test counts are only looked up for the rows that make the cut.
+    """
+
+    open_hours_expr = "EXTRACT(EPOCH FROM (s.report_date::timestamp - s.date_received::timestamp))/3600.0"
+    return text(f"""
+        WITH filtered AS (
+            SELECT
+                s.sample_id,
+                s.dispensary_id,
+                d.name AS dispensary_name,
+                s.date_received,
+                s.report_date,
+                {open_hours_expr} AS open_hours
+            FROM glims_samples s
+            LEFT JOIN glims_dispensaries d ON d.id = s.dispensary_id
+            WHERE s.report_date IS NOT NULL
+              AND s.date_received IS NOT NULL
+              AND s.report_date BETWEEN :start_date AND :end_date
+              {_DISPENSARY_FILTERS[dispensary_filter]}
+              AND {open_hours_expr} >= :min_open
+        ),
+        stats AS (
+            SELECT
+                COUNT(*) AS total,
+                AVG(open_hours) AS avg_open,
+                PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY open_hours) AS p95_open
+            FROM filtered
+        ),
+        ranked AS (
+            SELECT *
+            FROM filtered
+            ORDER BY open_hours DESC, report_date DESC
+            LIMIT :limit
+        )
+        SELECT st.total, st.avg_open, st.p95_open, r.*, t.tests_count
+        FROM stats st
+        LEFT JOIN (ranked r CROSS JOIN LATERAL ({_tests_count_sql()}) t) ON true
+        ORDER BY r.open_hours DESC, r.report_date DESC
+    """)
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_hours(total_hours: int) -> str:
+    # Open times cluster on a few hundred whole-hour values, so labels are reused across rows
+    days, remaining_hours = divmod(total_hours, 24)
+    return f"{days}d {remaining_hours}h" if days else f"{remaining_hours}h"
+
 
 def _format_open_time_label(hours: Optional[float]) -> str:
     if hours is None:
         return "--"
-    total_hours = int(round(max(0.0, float(hours))))
-    days, remaining_hours = divmod(total_hours, 24)
-    parts = []
-    if days:
-        parts.append(f"{days}d")
-    parts.append(f"{remaining_hours}h")
-    return " ".join(parts)
+    return _format_whole_hours(int(round(max(0.0, float(hours)))))
 
 
 def _resolve_dates(date_from: Optional[date], date_to: Optional[date], lookback_days: Optional[int]) -> tuple[date, date]:
@@ -59,7 +135,8 @@ def _resolve_dates(date_from: Optional[date], date_to: Optional[date], lookback_
 
 
 @router.get("/slowest", response_model=GlimsTatResponse, status_code=status.HTTP_200_OK)
-def get_slowest_tat_samples(
+@cached_response("glims:tat", policy="normal")
+async def get_slowest_tat_samples(
     date_from: Optional[date] = Query(None, description="Include samples reported on/after this date (UTC)"),
     date_to: Optional[date] = Query(None, description="Include samples reported on/before this date (UTC)"),
     dispensary_query: Optional[str] = Query(None, description="Filter by dispensary id or name fragment"),
@@ -67,7 +144,7 @@ def get_slowest_tat_samples(
     outlier_threshold_hours: Optional[float] = Query(72.0, ge=0.0, description="Threshold to flag outliers"),
     lookback_days: Optional[int] = Query(None, ge=1, le=180, description="Lookback days when date_from is omitted"),
     limit: int = Query(50, ge=1, le=200, description="Maximum samples to return"),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> GlimsTatResponse:
     """
     Return reported samples with the longest turnaround time (date_received -> report_date) in GLIMS.
@@ -78,80 +155,37 @@ def get_slowest_tat_samples(
     threshold = max(0.0, float(outlier_threshold_hours)) if outlier_threshold_hours is not None else None
     effective_limit = max(1, min(limit, 200))
 
-    filters = [
-        "s.report_date IS NOT NULL",
-        "s.date_received IS NOT NULL",
-        "s.report_date BETWEEN :start_date AND :end_date",
-    ]
     params: dict[str, object] = {
         "start_date": start_date,
         "end_date": end_date,
         "min_open": min_open,
+        "limit": effective_limit,
     }
-
+    dispensary_filter = None
     if dispensary_query:
         q = dispensary_query.strip()
         if q:
             try:
-                disp_id = int(q)
-                filters.append("s.dispensary_id = :dispensary_id")
-                params["dispensary_id"] = disp_id
+                params["dispensary_id"] = int(q)
+                dispensary_filter = "id"
             except ValueError:
-                filters.append("(d.name ILIKE :disp_name OR s.client_name ILIKE :disp_name)")
                 params["disp_name"] = f"%{q}%"
+                dispensary_filter = "name"
 
-    open_hours_expr = "EXTRACT(EPOCH FROM (s.report_date::timestamp - s.date_received::timestamp))/3600.0"
-    filters_clause = " AND ".join(filters)
-
-    stats_sql = f"""
-        SELECT
-            COUNT(*) AS total,
-            AVG({open_hours_expr}) AS avg_open,
-            PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY {open_hours_expr}) AS p95_open
-        FROM glims_samples s
-        LEFT JOIN glims_dispensaries d ON d.id = s.dispensary_id
-        WHERE {filters_clause}
-          AND {open_hours_expr} >= :min_open
-    """
-    stats_row = session.execute(text(stats_sql), params).one()
+    rows = (await session.execute(_slowest_statement(dispensary_filter), params)).all()
+    stats_row = rows[0]
     total_samples = int(stats_row.total or 0)
     avg_hours = float(stats_row.avg_open) if stats_row.avg_open is not None else None
     p95_hours = float(stats_row.p95_open) if stats_row.p95_open is not None else None
+    if stats_row.sample_id is None:
+        rows = []
 
-    tests_union_sql = " UNION ALL ".join(f"SELECT sample_id FROM {table}" for table in ASSAY_TABLES)
-    query_sql = f"""
-        WITH tests_union AS (
-            {tests_union_sql}
-        ),
-        tests_agg AS (
-            SELECT sample_id, COUNT(*) AS tests_count
-            FROM tests_union
-            GROUP BY sample_id
-        )
-        SELECT
-            s.sample_id,
-            s.dispensary_id,
-            d.name AS dispensary_name,
-            s.date_received,
-            s.report_date,
-            COALESCE(t.tests_count, 0) AS tests_count,
-            {open_hours_expr} AS open_hours
-        FROM glims_samples s
-        LEFT JOIN tests_agg t ON t.sample_id = s.sample_id
-        LEFT JOIN glims_dispensaries d ON d.id = s.dispensary_id
-        WHERE {filters_clause}
-          AND {open_hours_expr} >= :min_open
-        ORDER BY open_hours DESC, s.report_date DESC
-        LIMIT :limit
-    """
-    params["limit"] = effective_limit
-    rows = session.execute(text(query_sql), params).all()
-
+    # Columns come typed from Postgres, so model_construct skips validation
     items: list[GlimsTatItem] = []
     for row in rows:
         open_hours_val = float(row.open_hours) if row.open_hours is not None else 0.0
         items.append(
-            GlimsTatItem(
+            GlimsTatItem.model_construct(
                 sample_id=row.sample_id,
                 dispensary_id=row.dispensary_id,
                 dispensary_name=row.dispensary_name,
@@ -3,8 +3,10 @@ from datetime import date, datetime, timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import text
-from sqlalchemy.orm import Session
-from downloader_qbench_data.api.dependencies import get_db_session, require_active_user
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from downloader_qbench_data.api.dependencies import get_async_db_session, require_active_user
+from downloader_qbench_data.api.response_cache import cached_response
 from downloader_qbench_data.api.schemas.glims_tests import (
     TestsSummary,
     TestsActivityPoint,
@@ -43,25 +45,24 @@ def _parse_dates(date_from: Optional[date], date_to: Optional[date]) -> tuple[da
         date_from = date_to - timedelta(days=7)
     return date_from, date_to
 
-@router.get("/summary", response_model=TestsSummary)
-def get_summary(
-    date_from: Optional[date] = Query(None),
-    date_to: Optional[date] = Query(None),
-    session: Session = Depends(get_db_session),
-) -> TestsSummary:
-    start, end = _parse_dates(date_from, date_to)
-    
+def _summary_sql() -> str:
     unions = []
     for label, (table, p_date, s_date) in ASSAY_TABLES.items():
-        unions.append(f"""
+        select = f"""
             SELECT 
                 '{label}' as type,
                 EXTRACT(EPOCH FROM ({s_date}::timestamp - {p_date}::timestamp))/3600.0 as diff_hours
             FROM {table}
-            WHERE {p_date} BETWEEN :start AND :end OR {s_date} BETWEEN :start AND :end
-        """)
-    
-    sql = f"""
+        """
+        # One range per arm (instead of an OR) so each can use its own date index;
+        # the start arm skips rows the prep arm already counted
+        unions.append(f"{select} WHERE {p_date} BETWEEN :start AND :end")
+        if s_date != p_date:
+            unions.append(
+                f"{select} WHERE {s_date} BETWEEN :start AND :end"
+                f" AND NOT COALESCE({p_date} BETWEEN :start AND :end, false)"
+            )
+    return f"""
         WITH all_tests AS (
             {" UNION ALL ".join(unions)}
         )
@@ -72,8 +73,78 @@ def get_summary(
         FROM all_tests
         GROUP BY type
     """
+
+def _activity_sql() -> str:
+    prep_unions = []
+    start_unions = []
+    for label, (table, p_date, s_date) in ASSAY_TABLES.items():
+        prep_unions.append(f"SELECT '{label}' as type, 'prep' as category, {p_date}::date as d FROM {table} WHERE {p_date} BETWEEN :start AND :end")
+        start_unions.append(f"SELECT '{label}' as type, 'start' as category, {s_date}::date as d FROM {table} WHERE {s_date} BETWEEN :start AND :end")
+    return f"""
+        WITH all_activity AS (
+            {" UNION ALL ".join(prep_unions)}
+            UNION ALL
+            {" UNION ALL ".join(start_unions)}
+        )
+        SELECT 
+            d,
+            jsonb_object_agg(type, count) FILTER (WHERE category = 'prep') as prep_breakdown,
+            jsonb_object_agg(type, count) FILTER (WHERE category = 'start') as start_breakdown,
+            COALESCE(SUM(count) FILTER (WHERE category = 'prep'), 0)::bigint as total_prep,
+            COALESCE(SUM(count) FILTER (WHERE category = 'start'), 0)::bigint as total_start
+        FROM (
+            SELECT d, category, type, COUNT(*) as count
+            FROM all_activity
+            GROUP BY d, category, type
+        ) counts
+        GROUP BY d
+        ORDER BY d
+    """
+
+def _trend_sql() -> str:
+    unions = []
+    for label, (table, p_date, s_date) in ASSAY_TABLES.items():
+        unions.append(f"""
+            SELECT 
+                {s_date}::date as d,
+                EXTRACT(EPOCH FROM ({s_date}::timestamp - {p_date}::timestamp))/3600.0 as diff_hours
+            FROM {table}
+            WHERE {s_date} BETWEEN :start AND :end
+        """)
+    return f"""
+        WITH daily_diffs AS (
+            {" UNION ALL ".join(unions)}
+        )
+        SELECT 
+            d,
+            AVG(diff_hours) FILTER (WHERE diff_hours >= 0) as avg_hours,
+            -- Moving average over this point and the :ma_window before it (AVG skips NULL points)
+            AVG(AVG(diff_hours) FILTER (WHERE diff_hours >= 0)) OVER (
+                ORDER BY d ROWS BETWEEN CAST(:ma_window AS integer) PRECEDING AND CURRENT ROW
+            ) as moving_avg_hours
+        FROM daily_diffs
+        GROUP BY d
+        ORDER BY d
+    """
+
+# The assay tables are fixed, so every statement is built once at import
+_SUMMARY_SQL = text(_summary_sql())
+_ACTIVITY_SQL = text(_activity_sql()).columns(prep_breakdown=JSONB, start_breakdown=JSONB)
+_TREND_SQL = text(_trend_sql())
+
+# Per-day series grow with the requested range, so they are read through a server-side cursor
+_STREAM_BATCH_ROWS = 500
+
+@router.get("/summary", response_model=TestsSummary)
+@cached_response("glims:tests", policy="normal")
+async def get_summary(
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    session: AsyncSession = Depends(get_async_db_session),
+) -> TestsSummary:
+    start, end = _parse_dates(date_from, date_to)
     
-    rows = session.execute(text(sql), {"start": start, "end": end}).all()
+    rows = (await session.execute(_SUMMARY_SQL, {"start": start, "end": end})).all()
     
     tests_by_type = {}
     avg_by_type = {}
@@ -103,94 +174,48 @@ def get_summary(
     )
 
 @router.get("/activity", response_model=TestsActivityResponse)
-def get_activity(
+@cached_response("glims:tests", policy="normal")
+async def get_activity(
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TestsActivityResponse:
     start, end = _parse_dates(date_from, date_to)
     
-    prep_unions = []
-    start_unions = []
-    
-    for label, (table, p_date, s_date) in ASSAY_TABLES.items():
-        prep_unions.append(f"SELECT '{label}' as type, 'prep' as category, {p_date}::date as d FROM {table} WHERE {p_date} BETWEEN :start AND :end")
-        start_unions.append(f"SELECT '{label}' as type, 'start' as category, {s_date}::date as d FROM {table} WHERE {s_date} BETWEEN :start AND :end")
-        
-    sql = f"""
-        WITH all_activity AS (
-            {" UNION ALL ".join(prep_unions)}
-            UNION ALL
-            {" UNION ALL ".join(start_unions)}
+    # One row per day with the breakdowns already pivoted, in date order
+    result = await session.stream(_ACTIVITY_SQL, {"start": start, "end": end})
+    # Columns come typed from Postgres (jsonb decoded), so model_construct skips validation
+    points = [
+        TestsActivityPoint.model_construct(
+            date=row.d,
+            prep_breakdown=row.prep_breakdown or {},
+            start_breakdown=row.start_breakdown or {},
+            total_prep=row.total_prep,
+            total_start=row.total_start,
         )
-        SELECT 
-            d,
-            category,
-            type,
-            COUNT(*) as count
-        FROM all_activity
-        GROUP BY d, category, type
-        ORDER BY d
-    """
-    
-    rows = session.execute(text(sql), {"start": start, "end": end}).all()
-    
-    points_map: dict[date, TestsActivityPoint] = {}
-    for row in rows:
-        if row.d not in points_map:
-            points_map[row.d] = TestsActivityPoint(date=row.d)
-        
-        p = points_map[row.d]
-        count = row.count or 0
-        if row.category == 'prep':
-            p.prep_breakdown[row.type] = p.prep_breakdown.get(row.type, 0) + count
-            p.total_prep += count
-        else:
-            p.start_breakdown[row.type] = p.start_breakdown.get(row.type, 0) + count
-            p.total_start += count
-            
-    return TestsActivityResponse(points=sorted(points_map.values(), key=lambda x: x.date))
+        async for row in result.yield_per(_STREAM_BATCH_ROWS)
+    ]
+    return TestsActivityResponse(points=points)
 
 @router.get("/trend", response_model=TestsTrendResponse)
-def get_trend(
+@cached_response("glims:tests", policy="normal")
+async def get_trend(
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
     moving_avg_window: int = Query(7, ge=1, le=30),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TestsTrendResponse:
     start, end = _parse_dates(date_from, date_to)
     
-    unions = []
-    for label, (table, p_date, s_date) in ASSAY_TABLES.items():
-        unions.append(f"""
-            SELECT 
-                {s_date}::date as d,
-                EXTRACT(EPOCH FROM ({s_date}::timestamp - {p_date}::timestamp))/3600.0 as diff_hours
-            FROM {table}
-            WHERE {s_date} BETWEEN :start AND :end
-        """)
-        
-    sql = f"""
-        WITH daily_diffs AS (
-            {" UNION ALL ".join(unions)}
+    params = {"start": start, "end": end, "ma_window": moving_avg_window - 1}
+    result = await session.stream(_TREND_SQL, params)
+    points = [
+        TestsTrendPoint.model_construct(
+            date=row.d,
+            avg_hours=float(row.avg_hours) if row.avg_hours is not None else None,
+            moving_avg_hours=float(row.moving_avg_hours) if row.moving_avg_hours is not None else None,
         )
-        SELECT 
-            d,
-            AVG(diff_hours) FILTER (WHERE diff_hours >= 0) as avg_hours
-        FROM daily_diffs
-        GROUP BY d
-        ORDER BY d
-    """
-    
-    rows = session.execute(text(sql), {"start": start, "end": end}).all()
-    points = [TestsTrendPoint(date=row.d, avg_hours=float(row.avg_hours) if row.avg_hours is not None else None) for row in rows]
-    
-    # Calculate moving average
-    for idx, point in enumerate(points):
-        window_start = max(0, idx - moving_avg_window + 1)
-        window = points[window_start : idx + 1]
-        values = [p.avg_hours for p in window if p.avg_hours is not None]
-        if values:
-            point.moving_avg_hours = sum(values) / len(values)
+        async for row in result.yield_per(_STREAM_BATCH_ROWS)
+    ]
             
     return TestsTrendResponse(points=points)
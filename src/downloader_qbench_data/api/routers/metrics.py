@@ -6,14 +6,19 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import Session
 
-from ..dependencies import get_db_session, require_active_user
+from ..dependencies import get_async_db_engine, get_async_db_session, require_active_user
+from ..response_cache import cached_response, qbench_data_version
+from ..schemas.analytics import Interval
 from ..schemas.metrics import (
     DailyActivityResponse,
+    MetricsDashboardResponse,
     MetricsFiltersResponse,
     MetricsSummaryResponse,
     NewCustomersResponse,
+    PoolStatusResponse,
     ReportsOverviewResponse,
     SamplesOverviewResponse,
     TestsLabelDistributionResponse,
@@ -48,19 +53,20 @@ router = APIRouter(
 
 
 @router.get("/summary", response_model=MetricsSummaryResponse)
-def metrics_summary(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def metrics_summary(
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
     customer_id: Optional[int] = Query(None),
     order_id: Optional[int] = Query(None),
     state: Optional[str] = Query(None),
     sla_hours: float = Query(48.0, ge=0),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> MetricsSummaryResponse:
     """Return KPI summary for the selected range."""
 
-    return get_metrics_summary(
-        session,
+    return await session.run_sync(
+        get_metrics_summary,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -70,8 +76,68 @@ def metrics_summary(
     )
 
 
+def _build_dashboard(
+    session: Session,
+    *,
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+    customer_id: Optional[int],
+    order_id: Optional[int],
+    state: Optional[str],
+    sla_hours: float,
+    limit: int,
+    moving_average_window: int,
+) -> MetricsDashboardResponse:
+    dates = {"date_from": date_from, "date_to": date_to}
+    filters = {**dates, "customer_id": customer_id, "order_id": order_id}
+    return MetricsDashboardResponse(
+        summary=get_metrics_summary(session, **filters, state=state, sla_hours=sla_hours),
+        reports=get_reports_overview(session, **filters, state=state, sla_hours=sla_hours),
+        activity=get_daily_activity(session, **filters),
+        new_customers=get_new_customers(session, **dates, limit=limit),
+        top_customers=get_top_customers_by_tests(session, **dates, limit=limit),
+        label_distribution=get_tests_label_distribution(session, **filters, state=state),
+        tat_daily=get_tests_tat_daily(
+            session,
+            **filters,
+            state=state,
+            sla_hours=sla_hours,
+            moving_average_window=moving_average_window,
+        ),
+    )
+
+
+@router.get("/dashboard", response_model=MetricsDashboardResponse)
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def metrics_dashboard(
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    customer_id: Optional[int] = Query(None),
+    order_id: Optional[int] = Query(None),
+    state: Optional[str] = Query(None),
+    sla_hours: float = Query(48.0, ge=0),
+    limit: int = Query(10, ge=1, description="Size of the new and top customer lists"),
+    moving_average_window: int = Query(7, ge=1),
+    session: AsyncSession = Depends(get_async_db_session),
+) -> MetricsDashboardResponse:
+    """Return every overview panel for the same filters behind one auth check and one pooled connection."""
+
+    return await session.run_sync(
+        _build_dashboard,
+        date_from=date_from,
+        date_to=date_to,
+        customer_id=customer_id,
+        order_id=order_id,
+        state=state,
+        sla_hours=sla_hours,
+        limit=limit,
+        moving_average_window=moving_average_window,
+    )
+
+
 @router.get("/activity/daily", response_model=DailyActivityResponse)
-def daily_activity(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def daily_activity(
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
     customer_id: Optional[int] = Query(None),
@@ -79,12 +145,12 @@ def daily_activity(
     compare_previous: bool = Query(
         False, description="Include data for the matching previous period"
     ),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> DailyActivityResponse:
     """Return daily counts for samples and tests."""
 
-    return get_daily_activity(
-        session,
+    return await session.run_sync(
+        get_daily_activity,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -94,16 +160,17 @@ def daily_activity(
 
 
 @router.get("/customers/new", response_model=NewCustomersResponse)
-def new_customers(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def new_customers(
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
     limit: int = Query(10, ge=1),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> NewCustomersResponse:
     """Return customers created within the selected range."""
 
-    return get_new_customers(
-        session,
+    return await session.run_sync(
+        get_new_customers,
         date_from=date_from,
         date_to=date_to,
         limit=limit,
@@ -111,16 +178,17 @@ def new_customers(
 
 
 @router.get("/customers/top-tests", response_model=TopCustomersResponse)
-def top_customers_by_tests(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def top_customers_by_tests(
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
     limit: int = Query(10, ge=1),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TopCustomersResponse:
     """Return top customers ranked by tests in the range."""
 
-    return get_top_customers_by_tests(
-        session,
+    return await session.run_sync(
+        get_top_customers_by_tests,
         date_from=date_from,
         date_to=date_to,
         limit=limit,
@@ -128,19 +196,20 @@ def top_customers_by_tests(
 
 
 @router.get("/reports/overview", response_model=ReportsOverviewResponse)
-def reports_overview(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def reports_overview(
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
     customer_id: Optional[int] = Query(None),
     order_id: Optional[int] = Query(None),
     state: Optional[str] = Query(None),
     sla_hours: float = Query(48.0, ge=0),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> ReportsOverviewResponse:
     """Return report counts inside/outside SLA."""
 
-    return get_reports_overview(
-        session,
+    return await session.run_sync(
+        get_reports_overview,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -151,7 +220,8 @@ def reports_overview(
 
 
 @router.get("/tests/tat-daily", response_model=TestsTATDailyResponse)
-def tests_tat_daily(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def tests_tat_daily(
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
     customer_id: Optional[int] = Query(None),
@@ -159,12 +229,12 @@ def tests_tat_daily(
     state: Optional[str] = Query(None),
     sla_hours: float = Query(48.0, ge=0),
     moving_average_window: int = Query(7, ge=1),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TestsTATDailyResponse:
     """Return daily TAT statistics including moving averages."""
 
-    return get_tests_tat_daily(
-        session,
+    return await session.run_sync(
+        get_tests_tat_daily,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -176,18 +246,19 @@ def tests_tat_daily(
 
 
 @router.get("/samples/overview", response_model=SamplesOverviewResponse)
-def samples_overview(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def samples_overview(
     date_from: Optional[datetime] = Query(None, description="Filter samples created after this datetime"),
     date_to: Optional[datetime] = Query(None, description="Filter samples created before this datetime"),
     customer_id: Optional[int] = Query(None),
     order_id: Optional[int] = Query(None),
     state: Optional[str] = Query(None),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> SamplesOverviewResponse:
     """Return aggregated metrics for samples."""
 
-    return get_samples_overview(
-        session,
+    return await session.run_sync(
+        get_samples_overview,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -197,19 +268,20 @@ def samples_overview(
 
 
 @router.get("/tests/overview", response_model=TestsOverviewResponse)
-def tests_overview(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def tests_overview(
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
     customer_id: Optional[int] = Query(None),
     order_id: Optional[int] = Query(None),
     state: Optional[str] = Query(None),
     batch_id: Optional[int] = Query(None),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TestsOverviewResponse:
     """Return aggregated metrics for tests."""
 
-    return get_tests_overview(
-        session,
+    return await session.run_sync(
+        get_tests_overview,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -220,23 +292,23 @@ def tests_overview(
 
 
 @router.get("/tests/tat", response_model=TestsTATResponse)
-def tests_tat(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def tests_tat(
     date_created_from: Optional[datetime] = Query(None),
     date_created_to: Optional[datetime] = Query(None),
     customer_id: Optional[int] = Query(None),
     order_id: Optional[int] = Query(None),
     state: Optional[str] = Query(None),
-    group_by: Optional[str] = Query(
+    group_by: Optional[Interval] = Query(
         None,
-        pattern="^(day|week)$",
         description="Optional grouping interval for time series data",
     ),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TestsTATResponse:
     """Return turnaround time metrics for tests."""
 
-    return get_tests_tat(
-        session,
+    return await session.run_sync(
+        get_tests_tat,
         date_created_from=date_created_from,
         date_created_to=date_created_to,
         customer_id=customer_id,
@@ -247,42 +319,45 @@ def tests_tat(
 
 
 @router.get("/tests/tat-breakdown", response_model=TestsTATBreakdownResponse)
-def tests_tat_breakdown(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def tests_tat_breakdown(
     date_created_from: Optional[datetime] = Query(None),
     date_created_to: Optional[datetime] = Query(None),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TestsTATBreakdownResponse:
     """Return TAT metrics broken down by label."""
 
-    return get_tests_tat_breakdown(
-        session,
+    return await session.run_sync(
+        get_tests_tat_breakdown,
         date_created_from=date_created_from,
         date_created_to=date_created_to,
     )
 
 
 @router.get("/common/filters", response_model=MetricsFiltersResponse)
-def metrics_filters(
-    session: Session = Depends(get_db_session),
+@cached_response("metrics", policy="long", version=qbench_data_version)
+async def metrics_filters(
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> MetricsFiltersResponse:
     """Return values for populating dashboard filters."""
 
-    return get_metrics_filters(session)
+    return await session.run_sync(get_metrics_filters)
 
 
 @router.get("/tests/label-distribution", response_model=TestsLabelDistributionResponse)
-def tests_label_distribution(
+@cached_response("metrics", policy="normal", version=qbench_data_version)
+async def tests_label_distribution(
     date_from: Optional[datetime] = Query(None),
     date_to: Optional[datetime] = Query(None),
     customer_id: Optional[int] = Query(None),
     order_id: Optional[int] = Query(None),
     state: Optional[str] = Query(None),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> TestsLabelDistributionResponse:
     """Return counts of predefined test labels for the selected creation range."""
 
-    return get_tests_label_distribution(
-        session,
+    return await session.run_sync(
+        get_tests_label_distribution,
         date_from=date_from,
         date_to=date_to,
         customer_id=customer_id,
@@ -292,13 +367,29 @@ def tests_label_distribution(
 
 
 @router.get("/sync/status", response_model=SyncStatusResponse)
-def sync_status(
+@cached_response("metrics", policy="long", version=qbench_data_version)
+async def sync_status(
     entity: str = Query(
         "tests",
         description="Entity name from sync_checkpoints table",
     ),
-    session: Session = Depends(get_db_session),
+    session: AsyncSession = Depends(get_async_db_session),
 ) -> SyncStatusResponse:
     """Return last sync timestamp for a given entity."""
 
-    return get_sync_status(session, entity=entity)
+    return await session.run_sync(get_sync_status, entity=entity)
+
+
+@router.get("/pool", response_model=PoolStatusResponse)
+async def pool_status(
+    engine: AsyncEngine = Depends(get_async_db_engine),
+) -> PoolStatusResponse:
+    """Return connection usage of the API's asyncpg pool, to spot saturation."""
+
+    pool = engine.pool
+    return PoolStatusResponse(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=pool.overflow(),
+    )
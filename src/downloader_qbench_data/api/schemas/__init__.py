@@ -4,6 +4,7 @@ from .metrics import (
     DailyActivityPoint,
     DailyActivityResponse,
     DailyTATPoint,
+    MetricsDashboardResponse,
     MetricsFiltersResponse,
     MetricsSummaryKPI,
     MetricsSummaryResponse,
@@ -28,6 +29,7 @@ from .metrics import (
     TopCustomerItem,
     TopCustomersResponse,
     SyncStatusResponse,
+    PoolStatusResponse,
 )
 from .analytics import (
     CustomerAlertItem,
@@ -42,6 +44,7 @@ from .analytics import (
     CustomerSummaryInfo,
     CustomerTopPendingMatrix,
     CustomerTopPendingTest,
+    MetrcSampleStatusItem,
     OrdersFunnelResponse,
     OrdersFunnelStage,
     OrdersSlowestResponse,
@@ -75,14 +78,20 @@ from .analytics import (
 )
 from .glims_tat import GlimsTatItem, GlimsTatResponse, GlimsTatStats
 from .entities import (
+    EntityCustomerInfo,
+    EntityOrderInfo,
     OrderDetailResponse,
+    OrderInfo,
     OrderSampleItem,
     OrderSampleTestItem,
     SampleBatchItem,
     SampleDetailResponse,
+    SampleInfo,
     SampleTestItem,
     TestBatchItem,
     TestDetailResponse,
+    TestInfo,
+    TestSampleInfo,
 )
 from .auth import AuthenticatedUser, LoginRequest, TokenResponse
 
@@ -91,6 +100,7 @@ __all__ = [
     "DailyActivityPoint",
     "DailyActivityResponse",
     "DailyTATPoint",
+    "MetricsDashboardResponse",
     "MetricsFiltersResponse",
     "MetricsSummaryKPI",
     "MetricsSummaryResponse",
@@ -115,6 +125,7 @@ __all__ = [
     "TopCustomerItem",
     "TopCustomersResponse",
     "SyncStatusResponse",
+    "PoolStatusResponse",
     # Analytics
     "CustomerAlertItem",
     "CustomerAlertsResponse",
@@ -128,6 +139,7 @@ __all__ = [
     "CustomerSummaryInfo",
     "CustomerTopPendingMatrix",
     "CustomerTopPendingTest",
+    "MetrcSampleStatusItem",
     "OrdersThroughputResponse",
     "OrdersThroughputPoint",
     "OrdersThroughputTotals",
@@ -163,14 +175,20 @@ __all__ = [
     "GlimsTatItem",
     "GlimsTatResponse",
     # Entities
+    "EntityCustomerInfo",
+    "EntityOrderInfo",
     "OrderDetailResponse",
+    "OrderInfo",
     "OrderSampleItem",
     "OrderSampleTestItem",
     "SampleBatchItem",
     "SampleDetailResponse",
+    "SampleInfo",
     "SampleTestItem",
     "TestBatchItem",
     "TestDetailResponse",
+    "TestInfo",
+    "TestSampleInfo",
     # Auth
     "LoginRequest",
     "TokenResponse",
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Optional
+from enum import Enum
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 
 
+class Interval(str, Enum):
+    """Aggregation granularity accepted by the analytics endpoints."""
+
+    day = "day"
+    week = "week"
+
+
+class MatchStrategy(str, Enum):
+    """How customer name lookups resolve matches."""
+
+    best = "best"
+    all = "all"
+
+
 class OrdersThroughputPoint(BaseModel):
     period_start: date = Field(..., description="Beginning of the aggregation interval")
     orders_created: int = Field(..., description="Orders created during the interval")
@@ -376,3 +391,92 @@ class OverdueOrdersResponse(BaseModel):
     state_breakdown: list[OverdueStateBreakdown]
     ready_to_report_samples: list[ReadyToReportSampleItem]
     metrc_samples: list[MetrcSampleStatusItem]
+
+
+class _AnalyticsFilters(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+
+class OrdersThroughputParams(_AnalyticsFilters):
+    customer_id: Optional[int] = None
+    interval: Interval = Interval.day
+
+
+class SamplesCycleTimeParams(_AnalyticsFilters):
+    customer_id: Optional[int] = None
+    order_id: Optional[int] = None
+    matrix_type: Optional[str] = None
+    state: Optional[str] = None
+    interval: Interval = Interval.day
+
+
+class OrdersFunnelParams(_AnalyticsFilters):
+    customer_id: Optional[int] = None
+
+
+class OrdersSlowestParams(_AnalyticsFilters):
+    customer_id: Optional[int] = None
+    state: Optional[str] = None
+    limit: int = Field(10, ge=1, le=100)
+
+
+class OverdueOrdersParams(_AnalyticsFilters):
+    interval: Interval = Interval.week
+    min_days_overdue: int = Field(30, ge=0)
+    warning_window_days: int = Field(5, ge=0)
+    sla_hours: float = Field(48.0, ge=0.0)
+    top_limit: int = Field(20, ge=1, le=200)
+    client_limit: int = Field(20, ge=1, le=200)
+    warning_limit: int = Field(20, ge=1, le=200)
+
+
+class CustomerAlertsParams(_AnalyticsFilters):
+    customer_id: Optional[int] = None
+    interval: Interval = Interval.week
+    sla_hours: float = Field(48.0, ge=0.0)
+    min_alert_percentage: float = Field(0.1, ge=0.0, le=1.0)
+
+
+class TestsStateDistributionParams(_AnalyticsFilters):
+    customer_id: Optional[int] = None
+    order_id: Optional[int] = None
+    interval: Interval = Interval.week
+
+
+class QualityKpisParams(_AnalyticsFilters):
+    customer_id: Optional[int] = None
+    order_id: Optional[int] = None
+    sla_hours: float = Field(48.0, ge=0.0)
+
+
+AnalyticsBatchName = Literal[
+    "throughput",
+    "cycle_time",
+    "funnel",
+    "slowest",
+    "overdue",
+    "customer_alerts",
+    "state_distribution",
+    "quality_kpis",
+]
+
+
+class AnalyticsBatchItem(BaseModel):
+    name: AnalyticsBatchName
+    params: dict[str, Any] = Field(default_factory=dict, description="Same parameters as the standalone endpoint")
+
+
+class AnalyticsBatchRequest(BaseModel):
+    requests: list[AnalyticsBatchItem] = Field(..., min_length=1, max_length=20)
+
+
+class AnalyticsBatchResult(BaseModel):
+    name: AnalyticsBatchName
+    data: Any
+
+
+class AnalyticsBatchResponse(BaseModel):
+    results: list[AnalyticsBatchResult] = Field(..., description="One entry per sub-request, in request order")
@@ -3,11 +3,37 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
 
+class EntityCustomerInfo(BaseModel):
+    id: int
+    name: Optional[str] = None
+
+
+class EntityOrderInfo(BaseModel):
+    id: int
+    state: Optional[str] = None
+    customer: Optional[EntityCustomerInfo] = None
+
+
+class OrderInfo(BaseModel):
+    id: int
+    custom_formatted_id: Optional[str] = None
+    state: Optional[str] = None
+    sla_status: str
+    sla_hours: float
+    age_hours: Optional[float] = None
+    date_created: Optional[datetime] = None
+    date_completed: Optional[datetime] = None
+    date_order_reported: Optional[datetime] = None
+    date_received: Optional[datetime] = None
+    pending_samples: int = 0
+    pending_tests: int = 0
+
+
 class OrderSampleTestItem(BaseModel):
     id: int
     label_abbr: Optional[str] = None
@@ -26,8 +52,8 @@ class OrderSampleItem(BaseModel):
 
 
 class OrderDetailResponse(BaseModel):
-    order: dict
-    customer: Optional[dict] = None
+    order: OrderInfo
+    customer: Optional[EntityCustomerInfo] = None
     samples: Optional[list[OrderSampleItem]] = None
 
 
@@ -44,9 +70,23 @@ class SampleBatchItem(BaseModel):
     display_name: Optional[str] = None
 
 
+class SampleInfo(BaseModel):
+    id: int
+    sample_name: Optional[str] = None
+    custom_formatted_id: Optional[str] = None
+    order_id: Optional[int] = None
+    state: Optional[str] = None
+    date_created: Optional[datetime] = None
+    start_date: Optional[datetime] = None
+    completed_date: Optional[datetime] = None
+    matrix_type: Optional[str] = None
+    sla_status: str
+    sla_hours: float
+
+
 class SampleDetailResponse(BaseModel):
-    sample: dict
-    order: Optional[dict] = None
+    sample: SampleInfo
+    order: Optional[EntityOrderInfo] = None
     tests: Optional[list[SampleTestItem]] = None
     batches: Optional[list[SampleBatchItem]] = None
 
@@ -56,8 +96,26 @@ class TestBatchItem(BaseModel):
     display_name: Optional[str] = Field(None, description="User-friendly batch name")
 
 
+class TestInfo(BaseModel):
+    id: int
+    label_abbr: Optional[str] = None
+    state: Optional[str] = None
+    has_report: bool = False
+    date_created: Optional[datetime] = None
+    report_completed_date: Optional[datetime] = None
+    sla_status: str
+    sla_hours: float
+    worksheet_raw: Optional[dict[str, Any]] = None
+
+
+class TestSampleInfo(BaseModel):
+    id: int
+    sample_name: Optional[str] = None
+    state: Optional[str] = None
+
+
 class TestDetailResponse(BaseModel):
-    test: dict
-    sample: Optional[dict] = None
-    order: Optional[dict] = None
+    test: TestInfo
+    sample: Optional[TestSampleInfo] = None
+    order: Optional[EntityOrderInfo] = None
     batches: Optional[list[TestBatchItem]] = None
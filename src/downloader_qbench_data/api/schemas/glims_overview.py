@@ -42,6 +42,11 @@ class ActivityResponse(BaseModel):
     points: List[ActivityPoint]
 
 
+class OverviewDashboardResponse(BaseModel):
+    summary: OverviewSummary
+    activity: ActivityResponse
+
+
 class NewCustomerItem(BaseModel):
     id: int
     name: str
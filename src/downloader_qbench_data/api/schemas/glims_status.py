@@ -3,49 +3,57 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator
 
 
-ALLOWED_STATUSES = {
-    "Sample Received",
-    "Generating",
-    "Needs Second Check",
-    "Second Check Done",
-    "Reported",
-    "Needs METRC Upload",
-}
+ALLOWED_STATUSES = frozenset(
+    {
+        "Sample Received",
+        "Generating",
+        "Needs Second Check",
+        "Second Check Done",
+        "Reported",
+        "Needs METRC Upload",
+    }
+)
 
+# Lower-cased, single-spaced spelling -> canonical status
+_CANONICAL_STATUSES = {status.lower(): status for status in ALLOWED_STATUSES}
+ALLOWED_STATUSES_MESSAGE = ", ".join(sorted(ALLOWED_STATUSES))
 
-def _normalize_status(value: str) -> str:
-    """Normalize status to title-case trimmed string."""
-    norm = value.strip()
-    return " ".join(part.capitalize() for part in norm.split())
+
+# Trimmed inside pydantic-core, before the length check
+_TrimmedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+
+def normalize_status(value: str) -> Optional[str]:
+    """Return the canonical status for ``value`` (case and spacing ignored), or ``None`` if not allowed."""
+    # Apps Script posts canonical or merely re-cased statuses; only odd spacing needs the split/join
+    if value in ALLOWED_STATUSES:
+        return value
+    canonical = _CANONICAL_STATUSES.get(value.strip().lower())
+    if canonical is not None:
+        return canonical
+    return _CANONICAL_STATUSES.get(" ".join(value.split()).lower())
 
 
 class StatusEventCreate(BaseModel):
-    sample_id: str = Field(..., min_length=1)
+    sample_id: _TrimmedStr = Field(..., min_length=1)
     status: str = Field(..., min_length=1)
     changed_at: Optional[datetime] = None
     metadata: Optional[dict[str, Any]] = None
-    source: str = Field(default="apps_script")
-
-    @validator("sample_id")
-    def _trim_sample_id(cls, value: str) -> str:
-        return value.strip()
+    source: _TrimmedStr = Field(default="apps_script")
 
-    @validator("status")
+    @field_validator("status")
+    @classmethod
     def _validate_status(cls, value: str) -> str:
-        normalized = _normalize_status(value)
-        if normalized not in ALLOWED_STATUSES:
-            raise ValueError(f"status must be one of: {', '.join(sorted(ALLOWED_STATUSES))}")
+        normalized = normalize_status(value)
+        if normalized is None:
+            raise ValueError(f"status must be one of: {ALLOWED_STATUSES_MESSAGE}")
         return normalized
 
-    @validator("source")
-    def _trim_source(cls, value: str) -> str:
-        return value.strip()
-
 
 class StatusEventResponse(BaseModel):
     id: int
@@ -57,14 +65,18 @@ class StatusEventResponse(BaseModel):
     metadata: Optional[dict[str, Any]] = None
 
 
+class StatusEventBatchResponse(BaseModel):
+    events: list[StatusEventResponse]
+    unknown_sample_ids: list[str] = Field(
+        default_factory=list,
+        description="Submitted sample ids not found in glims_samples; their events were skipped.",
+    )
+
+
 class DispensarySuggestRequest(BaseModel):
-    name: str = Field(..., min_length=1)
+    name: _TrimmedStr = Field(..., min_length=1)
     sheet_line_number: int = Field(..., ge=1)
 
-    @validator("name")
-    def _trim_name(cls, value: str) -> str:
-        return value.strip()
-
 
 class DispensarySuggestResponse(BaseModel):
     id: int
@@ -139,6 +139,13 @@ class SyncStatusResponse(BaseModel):
     updated_at: Optional[datetime]
 
 
+class PoolStatusResponse(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+
+
 class ReportsOverviewResponse(BaseModel):
     total_reports: int
     reports_within_sla: int
@@ -164,3 +171,15 @@ class TestsLabelCountItem(BaseModel):
 
 class TestsLabelDistributionResponse(BaseModel):
     labels: list[TestsLabelCountItem]
+
+
+class MetricsDashboardResponse(BaseModel):
+    """Everything the overview tab renders, for one set of filters."""
+
+    summary: MetricsSummaryResponse
+    reports: ReportsOverviewResponse
+    activity: DailyActivityResponse
+    new_customers: NewCustomersResponse
+    top_customers: TopCustomersResponse
+    label_distribution: TestsLabelDistributionResponse
+    tat_daily: TestsTATDailyResponse
@@ -696,11 +696,12 @@ def get_overdue_orders(
             order_id = int(info.order_id)
             key = (order_id, sample_id)
             label_dict = sample_tests_map.get(key, {})
+            # Leaf items are built from ints/strs already normalised above, so model_construct skips validation
             tests: list[OverdueTestDetail] = []
             for assay_key, entry in label_dict.items():
                 states_sorted = sorted(entry["states"], key=_state_priority)
                 tests.append(
-                    OverdueTestDetail(
+                    OverdueTestDetail.model_construct(
                         primary_test_id=int(entry["primary_id"]),
                         test_ids=sorted(entry["test_ids"]),
                         label_abbr=entry["label"],
@@ -836,7 +837,7 @@ def get_overdue_orders(
         .order_by(Customer.name, period_expr)
     )
     heatmap = [
-        OverdueHeatmapCell(
+        OverdueHeatmapCell.model_construct(
             customer_id=row.customer_id,
             customer_name=row.customer_name,
             period_start=_convert_period(row.period),
@@ -1178,6 +1179,7 @@ def get_customer_alerts(
     heatmap_stmt = heatmap_stmt.join(Order, Order.id == Sample.order_id)
     heatmap_stmt = heatmap_stmt.join(Customer, Customer.id == Order.customer_account_id)
 
+    # Heatmap cells get coerced ints/floats below, so model_construct skips validation
     heatmap_points: list[CustomerHeatmapPoint] = []
     aggregate_map: dict[int, dict[str, float]] = {}
 
@@ -1199,7 +1201,7 @@ def get_customer_alerts(
             sla_breach_ratio = sla_breach_tests / total_f
 
         heatmap_points.append(
-            CustomerHeatmapPoint(
+            CustomerHeatmapPoint.model_construct(
                 customer_id=row.customer_id,
                 customer_name=row.customer_name,
                 period_start=period,
@@ -1433,7 +1435,7 @@ def get_tests_state_distribution(
         for state_name in states:
             value = int(counts.get(state_name, 0))
             ratio = float(value) / float(total) if total else 0.0
-            buckets.append(TestStateBucket(state=state_name, count=value, ratio=ratio))
+            buckets.append(TestStateBucket.model_construct(state=state_name, count=value, ratio=ratio))
         return buckets, total
 
     series_points: list[TestStatePoint] = []
@@ -1454,7 +1456,7 @@ def get_tests_state_distribution(
         for state_name in states:
             value = int(totals_map.get(state_name, 0))
             ratio = float(value) / float(totals_total) if totals_total else 0.0
-            totals_buckets.append(TestStateBucket(state=state_name, count=value, ratio=ratio))
+            totals_buckets.append(TestStateBucket.model_construct(state=state_name, count=value, ratio=ratio))
 
     return TestsStateDistributionResponse(
         interval=interval_value,
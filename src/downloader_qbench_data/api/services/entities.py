@@ -11,14 +11,20 @@ from sqlalchemy.orm import Session
 from downloader_qbench_data.storage import Batch, Customer, Order, Sample, Test
 from downloader_qbench_data.bans import is_banned
 from ..schemas.entities import (
+    EntityCustomerInfo,
+    EntityOrderInfo,
     OrderDetailResponse,
+    OrderInfo,
     OrderSampleItem,
     OrderSampleTestItem,
     SampleBatchItem,
     SampleDetailResponse,
+    SampleInfo,
     SampleTestItem,
     TestBatchItem,
     TestDetailResponse,
+    TestInfo,
+    TestSampleInfo,
 )
 
 _WARNING_RATIO = 0.75
@@ -69,20 +75,20 @@ def get_order_detail(
         .where(Sample.order_id == order.id, Test.report_completed_date.is_(None))
     ).scalar_one_or_none() or 0
 
-    order_payload = {
-        "id": order.id,
-        "custom_formatted_id": order.custom_formatted_id,
-        "state": order.state,
-        "sla_status": _classify_sla(age_hours, sla_hours),
-        "sla_hours": sla_hours,
-        "age_hours": round(age_hours, 2),
-        "date_created": order.date_created,
-        "date_completed": order.date_completed,
-        "date_order_reported": order.date_order_reported,
-        "date_received": order.date_received,
-        "pending_samples": pending_samples,
-        "pending_tests": pending_tests,
-    }
+    order_payload = OrderInfo(
+        id=order.id,
+        custom_formatted_id=order.custom_formatted_id,
+        state=order.state,
+        sla_status=_classify_sla(age_hours, sla_hours),
+        sla_hours=sla_hours,
+        age_hours=round(age_hours, 2),
+        date_created=order.date_created,
+        date_completed=order.date_completed,
+        date_order_reported=order.date_order_reported,
+        date_received=order.date_received,
+        pending_samples=pending_samples,
+        pending_tests=pending_tests,
+    )
 
     samples_payload: list[OrderSampleItem] | None = None
     if include_samples:
@@ -143,10 +149,7 @@ def get_order_detail(
     if order.customer_account_id is not None:
         customer = session.get(Customer, order.customer_account_id)
         if customer:
-            customer_payload = {
-                "id": customer.id,
-                "name": customer.name,
-            }
+            customer_payload = EntityCustomerInfo(id=customer.id, name=customer.name)
 
     return OrderDetailResponse(
         order=order_payload,
@@ -174,19 +177,19 @@ def get_sample_detail(
     order = session.get(Order, sample.order_id)
     sla_value = sla_hours if sla_hours is not None else 48.0
     age_hours = _age_hours(sample.date_created)
-    sample_payload = {
-        "id": sample.id,
-        "sample_name": sample.sample_name,
-        "custom_formatted_id": sample.custom_formatted_id,
-        "order_id": sample.order_id,
-        "state": sample.state,
-        "date_created": sample.date_created,
-        "start_date": sample.start_date,
-        "completed_date": sample.completed_date,
-        "matrix_type": sample.matrix_type,
-        "sla_status": _classify_sla(age_hours, sla_value),
-        "sla_hours": sla_value,
-    }
+    sample_payload = SampleInfo(
+        id=sample.id,
+        sample_name=sample.sample_name,
+        custom_formatted_id=sample.custom_formatted_id,
+        order_id=sample.order_id,
+        state=sample.state,
+        date_created=sample.date_created,
+        start_date=sample.start_date,
+        completed_date=sample.completed_date,
+        matrix_type=sample.matrix_type,
+        sla_status=_classify_sla(age_hours, sla_value),
+        sla_hours=sla_value,
+    )
 
     tests_payload = None
     if include_tests:
@@ -216,12 +219,8 @@ def get_sample_detail(
         if order.customer_account_id:
             customer = session.get(Customer, order.customer_account_id)
             if customer:
-                customer_info = {"id": customer.id, "name": customer.name}
-        order_payload = {
-            "id": order.id,
-            "state": order.state,
-            "customer": customer_info,
-        }
+                customer_info = EntityCustomerInfo(id=customer.id, name=customer.name)
+        order_payload = EntityOrderInfo(id=order.id, state=order.state, customer=customer_info)
 
     return SampleDetailResponse(
         sample=sample_payload,
@@ -256,25 +255,21 @@ def get_test_detail(
             return None
 
     age_hours = _age_hours(test.date_created, test.report_completed_date)
-    test_payload = {
-        "id": test.id,
-        "label_abbr": test.label_abbr,
-        "state": test.state,
-        "has_report": test.has_report,
-        "date_created": test.date_created,
-        "report_completed_date": test.report_completed_date,
-        "sla_status": _classify_sla(age_hours, sla_hours),
-        "sla_hours": sla_hours,
-        "worksheet_raw": test.worksheet_raw,
-    }
+    test_payload = TestInfo(
+        id=test.id,
+        label_abbr=test.label_abbr,
+        state=test.state,
+        has_report=test.has_report,
+        date_created=test.date_created,
+        report_completed_date=test.report_completed_date,
+        sla_status=_classify_sla(age_hours, sla_hours),
+        sla_hours=sla_hours,
+        worksheet_raw=test.worksheet_raw,
+    )
 
     sample_payload = None
     if sample and include_sample:
-        sample_payload = {
-            "id": sample.id,
-            "sample_name": sample.sample_name,
-            "state": sample.state,
-        }
+        sample_payload = TestSampleInfo(id=sample.id, sample_name=sample.sample_name, state=sample.state)
 
     order_payload = None
     if order and include_order:
@@ -282,12 +277,8 @@ def get_test_detail(
         if order.customer_account_id:
             customer = session.get(Customer, order.customer_account_id)
             if customer:
-                customer_info = {"id": customer.id, "name": customer.name}
-        order_payload = {
-            "id": order.id,
-            "state": order.state,
-            "customer": customer_info,
-        }
+                customer_info = EntityCustomerInfo(id=customer.id, name=customer.name)
+        order_payload = EntityOrderInfo(id=order.id, state=order.state, customer=customer_info)
 
     batches_payload = None
     if include_batches and test.batch_ids:
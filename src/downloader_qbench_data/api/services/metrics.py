@@ -917,9 +917,9 @@ def get_tests_tat_daily(
     stmt = (
         select(
             period,
-            func.avg(tat_expr),
-            func.sum(within_case),
-            func.sum(beyond_case),
+            func.avg(tat_expr).label("avg_hours"),
+            func.sum(within_case).label("within_sla"),
+            func.sum(beyond_case).label("beyond_sla"),
         )
         .select_from(Test)
     )
@@ -927,24 +927,36 @@ def get_tests_tat_daily(
         stmt = stmt.join(Sample, Sample.id == Test.sample_id)
     if join_order:
         stmt = stmt.join(Order, Sample.order_id == Order.id)
-    stmt = stmt.where(*conditions).group_by(period).order_by(period)
+    daily = stmt.where(*conditions).group_by(period).subquery()
+
+    columns = [daily.c.period, daily.c.avg_hours, daily.c.within_sla, daily.c.beyond_sla]
+    with_moving_average = bool(moving_average_window and moving_average_window > 1)
+    if with_moving_average:
+        # Days without an average sit in their own partition, so each window spans the last
+        # N days that have one; the count tells whether the window is already full
+        window = {
+            "partition_by": daily.c.avg_hours.is_(None),
+            "order_by": daily.c.period,
+            "rows": (1 - moving_average_window, 0),
+        }
+        columns.append(func.avg(daily.c.avg_hours).over(**window).label("ma_hours"))
+        columns.append(func.count().over(**window).label("ma_days"))
 
     points: list[DailyTATPoint] = []
     averages: list[TimeSeriesPoint] = []
-    for day, avg_hours, within_sla_value, beyond_sla_value in session.execute(stmt):
-        point_date = day.date()
-        avg_value = float(avg_hours) if avg_hours is not None else None
+    for row in session.execute(select(*columns).order_by(daily.c.period)):
+        point_date = row.period.date()
+        avg_value = float(row.avg_hours) if row.avg_hours is not None else None
         points.append(
             DailyTATPoint(
                 date=point_date,
                 average_hours=avg_value,
-                within_sla=int(within_sla_value or 0),
-                beyond_sla=int(beyond_sla_value or 0),
+                within_sla=int(row.within_sla or 0),
+                beyond_sla=int(row.beyond_sla or 0),
             )
         )
-
-    if moving_average_window and moving_average_window > 1 and points:
-        averages = _calculate_moving_average(points, moving_average_window)
+        if with_moving_average and avg_value is not None and row.ma_days == moving_average_window:
+            averages.append(TimeSeriesPoint(period_start=point_date, value=float(row.ma_hours)))
 
     return TestsTATDailyResponse(points=points, moving_average_hours=averages or None)
 
@@ -1002,26 +1014,6 @@ def _calculate_previous_period(date_from: datetime, date_to: datetime) -> tuple[
     return prev_start, prev_end
 
 
-def _calculate_moving_average(points: list[DailyTATPoint], window: int) -> list[TimeSeriesPoint]:
-    averages: list[TimeSeriesPoint] = []
-    values: list[float] = []
-    dates: list[date] = []
-    for point in points:
-        if point.average_hours is None:
-            continue
-        values.append(point.average_hours)
-        dates.append(point.date)
-        if len(values) >= window:
-            window_values = values[-window:]
-            averages.append(
-                TimeSeriesPoint(
-                    period_start=dates[-1],
-                    value=sum(window_values) / len(window_values),
-                )
-            )
-    return averages
-
-
 def _compute_p95(values: list[float]) -> float | None:
     if not values:
         return None
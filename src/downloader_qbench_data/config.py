@@ -28,15 +28,22 @@ class DatabaseSettings(BaseModel):
     name: str
     user: str
     password: str
+    pool_size: int = 20
+    max_overflow: int = 10
 
-    def build_sqlalchemy_url(self) -> str:
+    def build_sqlalchemy_url(self, driver: str = "psycopg2") -> str:
         """Compose a SQLAlchemy connection URL."""
 
         return (
-            f"postgresql+psycopg2://{self.user}:{self.password}"
+            f"postgresql+{driver}://{self.user}:{self.password}"
             f"@{self.host}:{self.port}/{self.name}"
         )
 
+    def build_async_sqlalchemy_url(self) -> str:
+        """Compose a SQLAlchemy connection URL for the asyncpg driver."""
+
+        return self.build_sqlalchemy_url(driver="asyncpg")
+
 
 class AppSettings(BaseModel):
     """Aggregated application settings."""
@@ -46,6 +53,10 @@ class AppSettings(BaseModel):
     auth: "AuthSettings"
     page_size: int = 50
     sync_lookback_days: int = 7
+    redis_url: Optional[str] = None
+    glims_test_events_view: bool = False
+    glims_tests_by_sample_view: bool = False
+    glims_samples_is_excluded_column: bool = False
 
 
 class AuthSettings(BaseModel):
@@ -76,6 +87,8 @@ def _load_from_environment() -> AppSettings:
             name=os.environ["POSTGRES_DB"],
             user=os.environ["POSTGRES_USER"],
             password=os.environ["POSTGRES_PASSWORD"],
+            pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
         )
         auth = AuthSettings(
             secret_key=os.environ["AUTH_SECRET_KEY"],
@@ -96,6 +109,10 @@ def _load_from_environment() -> AppSettings:
         auth=auth,
         page_size=page_size,
         sync_lookback_days=sync_lookback_days,
+        redis_url=os.getenv("REDIS_URL") or None,
+        glims_test_events_view=os.getenv("GLIMS_TEST_EVENTS_VIEW", "").lower() in {"1", "true", "yes"},
+        glims_tests_by_sample_view=os.getenv("GLIMS_TESTS_BY_SAMPLE_VIEW", "").lower() in {"1", "true", "yes"},
+        glims_samples_is_excluded_column=os.getenv("GLIMS_SAMPLES_IS_EXCLUDED", "").lower() in {"1", "true", "yes"},
     )
 
 
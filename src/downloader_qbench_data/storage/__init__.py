@@ -1,6 +1,12 @@
 ﻿"""Storage package exports."""
 
-from .database import get_engine, get_session_factory, session_scope
+from .database import (
+    get_async_engine,
+    get_async_session_factory,
+    get_engine,
+    get_session_factory,
+    session_scope,
+)
 from .models import (
     Base,
     Batch,
@@ -25,6 +31,8 @@ __all__ = [
     "SyncCheckpoint",
     "BannedEntity",
     "UserAccount",
+    "get_async_engine",
+    "get_async_session_factory",
     "get_engine",
     "get_session_factory",
     "session_scope",
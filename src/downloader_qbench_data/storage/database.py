@@ -7,6 +7,7 @@ from typing import Iterator
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from downloader_qbench_data.config import AppSettings
@@ -14,6 +15,13 @@ from . import models
 
 _engine: Engine | None = None
 _session_factory: sessionmaker | None = None
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+# Session GUCs for API connections: the GLIMS assay UNION ALL aggregations hash-aggregate
+# across every result table and spill to disk at the 4MB default work_mem, and a runaway
+# dashboard query must not pin a pooled connection indefinitely.
+_API_SERVER_SETTINGS = {"work_mem": "64MB", "statement_timeout": "20000"}
 
 
 def get_engine(settings: AppSettings) -> Engine:
@@ -24,7 +32,11 @@ def get_engine(settings: AppSettings) -> Engine:
         _engine = create_engine(
             settings.database.build_sqlalchemy_url(),
             future=True,
+            pool_size=settings.database.pool_size,
+            max_overflow=settings.database.max_overflow,
+            pool_timeout=30,
             pool_pre_ping=True,
+            pool_recycle=1800,
         )
         models.Base.metadata.create_all(_engine)
     return _engine
@@ -45,6 +57,42 @@ def get_session_factory(settings: AppSettings) -> sessionmaker:
     return _session_factory
 
 
+def get_async_engine(settings: AppSettings) -> AsyncEngine:
+    """Initialise (or reuse) the global asyncpg-backed SQLAlchemy engine."""
+
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.database.build_async_sqlalchemy_url(),
+            # Per-connection prepared statement caches (asyncpg's own and SQLAlchemy's adapter
+            # cache, both 100 by default) sized to hold every filter variant the routers emit.
+            connect_args={
+                "statement_cache_size": 512,
+                "prepared_statement_cache_size": 512,
+                "server_settings": _API_SERVER_SETTINGS,
+            },
+            pool_size=settings.database.pool_size,
+            max_overflow=settings.database.max_overflow,
+            pool_timeout=30,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+        )
+    return _async_engine
+
+
+def get_async_session_factory(settings: AppSettings) -> async_sessionmaker[AsyncSession]:
+    """Return an async session factory bound to the asyncpg engine."""
+
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(settings),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
 @contextmanager
 def session_scope(settings: AppSettings) -> Iterator[Session]:
     """Provide a transactional scope."""
@@ -0,0 +1,138 @@
+"""Tests for shared API dependencies."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections import namedtuple
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.testclient import TestClient
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from downloader_qbench_data.api import dependencies, response_cache
+from downloader_qbench_data.auth.tokens import create_access_token
+from downloader_qbench_data.config import AuthSettings
+
+_UserRow = namedtuple("_UserRow", "id username is_active locked_until")
+
+
+class _FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def first(self):
+        return self.row
+
+
+class _CountingSession:
+    def __init__(self, row):
+        self.row = row
+        self.calls = 0
+
+    async def execute(self, stmt):
+        self.calls += 1
+        return _FakeResult(self.row)
+
+
+@pytest.fixture
+def auth_settings():
+    dependencies.clear_token_cache()
+    yield SimpleNamespace(auth=AuthSettings(secret_key="unit-test-secret", token_ttl_hours=1))
+    dependencies.clear_token_cache()
+
+
+def _require(settings, session, token):
+    request = SimpleNamespace(state=SimpleNamespace())
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    user = asyncio.run(dependencies.require_active_user(request, credentials, settings, session))
+    assert request.state.user == user.username
+    return user
+
+
+def test_require_active_user_caches_validated_token(auth_settings) -> None:
+    token, _ = create_access_token(auth_settings.auth, "tester")
+    session = _CountingSession(_UserRow(1, "tester", True, None))
+
+    first = _require(auth_settings, session, token)
+    second = _require(auth_settings, session, token)
+
+    assert first is second
+    assert session.calls == 1
+
+
+def test_require_active_user_rejects_malformed_token(auth_settings) -> None:
+    session = _CountingSession(None)
+    with pytest.raises(HTTPException) as excinfo:
+        _require(auth_settings, session, "not-a-jwt")
+    assert excinfo.value.status_code == 401
+    assert excinfo.value.detail == "token_invalid"
+    assert session.calls == 0
+
+
+def test_guard_and_route_share_one_session_per_request(auth_settings) -> None:
+    sessions: list[_CountingSession] = []
+
+    async def _session():
+        session = _CountingSession(_UserRow(1, "tester", True, None))
+        sessions.append(session)
+        yield session
+
+    app = FastAPI()
+
+    @app.get("/probe")
+    async def probe(
+        user=Depends(dependencies.require_active_user),
+        session=Depends(dependencies.get_async_db_session),
+    ):
+        return {"user": user.username, "lookups": session.calls}
+
+    app.dependency_overrides[dependencies.get_app_settings] = lambda: auth_settings
+    app.dependency_overrides[dependencies.get_async_db_session] = _session
+    token, _ = create_access_token(auth_settings.auth, "tester")
+
+    resp = TestClient(app).get("/probe", headers={"Authorization": f"Bearer {token}"})
+
+    assert resp.status_code == 200
+    assert resp.json() == {"user": "tester", "lookups": 1}
+    assert len(sessions) == 1
+
+
+def test_conditional_get_returns_304_until_data_changes(monkeypatch) -> None:
+    state = {"version": (None, 0, None)}
+
+    async def _sync_state():
+        return state["version"]
+
+    # The dependency reads the same memoised state as the /metrics response cache
+    monkeypatch.setattr(dependencies, "qbench_sync_state", _sync_state)
+    monkeypatch.setattr(response_cache, "qbench_sync_state", _sync_state)
+    app = FastAPI()
+
+    @app.get("/probe", dependencies=[Depends(dependencies.qbench_conditional_get)])
+    async def probe():
+        return {"ok": True}
+
+    client = TestClient(app)
+
+    first = client.get("/probe", params={"b": 2, "a": 1})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get("/probe", params={"a": 1, "b": 2}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    state["version"] = (None, 1, None)
+    changed = client.get("/probe", params={"a": 1, "b": 2}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
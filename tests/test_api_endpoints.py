@@ -5,7 +5,13 @@ from types import SimpleNamespace
 
 from fastapi.testclient import TestClient
 from downloader_qbench_data.api import create_app
-from downloader_qbench_data.api.dependencies import get_db_session, require_active_user
+from downloader_qbench_data.api.dependencies import (
+    get_async_db_engine,
+    get_async_db_session,
+    get_db_session,
+    qbench_conditional_get,
+    require_active_user,
+)
 from downloader_qbench_data.api.schemas import (
     CustomerAlertItem,
     CustomerAlertsResponse,
@@ -88,12 +94,29 @@ from downloader_qbench_data.api.schemas import (
 )
 
 
+class _DummyAsyncResult:
+    def one(self):
+        return (None, 0, None)
+
+
+class _DummyAsyncSession:
+    async def execute(self, stmt, params=None):
+        return _DummyAsyncResult()
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(object(), *args, **kwargs)
+
+
 def create_test_client(monkeypatch):
     app = create_app()
     def _dummy_session():
         yield object()
+    async def _dummy_async_session():
+        yield _DummyAsyncSession()
     app.dependency_overrides[get_db_session] = _dummy_session
+    app.dependency_overrides[get_async_db_session] = _dummy_async_session
     app.dependency_overrides[require_active_user] = lambda: SimpleNamespace(username="tester")
+    app.dependency_overrides[qbench_conditional_get] = lambda: None
     client = TestClient(app)
     return client
 
@@ -121,6 +144,53 @@ def test_metrics_summary_endpoint(monkeypatch):
     assert resp.json()["kpis"]["total_tests"] == 616
 
 
+def test_metrics_dashboard_endpoint_runs_each_panel_with_shared_filters(monkeypatch):
+    payloads = {
+        "get_metrics_summary": MetricsSummaryResponse(
+            kpis=MetricsSummaryKPI(
+                total_samples=205,
+                total_tests=616,
+                total_customers=4,
+                total_reports=74,
+                average_tat_hours=42.0,
+            ),
+            last_updated_at=None,
+            range_start=None,
+            range_end=None,
+        ),
+        "get_reports_overview": ReportsOverviewResponse(total_reports=74, reports_within_sla=70, reports_beyond_sla=4),
+        "get_daily_activity": DailyActivityResponse(current=[]),
+        "get_new_customers": NewCustomersResponse(customers=[]),
+        "get_top_customers_by_tests": TopCustomersResponse(customers=[]),
+        "get_tests_label_distribution": TestsLabelDistributionResponse(labels=[]),
+        "get_tests_tat_daily": TestsTATDailyResponse(points=[]),
+    }
+    calls = {}
+    sessions = set()
+
+    def _fake_service(name):
+        def _service(session, **params):
+            sessions.add(id(session))
+            calls[name] = params
+            return payloads[name]
+
+        return _service
+
+    for name in payloads:
+        monkeypatch.setattr(f"downloader_qbench_data.api.routers.metrics.{name}", _fake_service(name))
+    client = create_test_client(monkeypatch)
+    resp = client.get("/api/v1/metrics/dashboard?customer_id=7&limit=5&moving_average_window=14")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["summary"]["kpis"]["total_tests"] == 616
+    assert body["reports"]["reports_beyond_sla"] == 4
+    assert set(calls) == set(payloads)
+    assert len(sessions) == 1
+    assert calls["get_metrics_summary"]["customer_id"] == 7
+    assert calls["get_new_customers"] == {"date_from": None, "date_to": None, "limit": 5}
+    assert calls["get_tests_tat_daily"]["moving_average_window"] == 14
+
+
 def test_daily_activity_endpoint(monkeypatch):
     response_payload = DailyActivityResponse(
         current=[
@@ -191,7 +261,16 @@ def test_sync_status_endpoint(monkeypatch):
     assert resp.status_code == 200
     body = resp.json()
     assert body["entity"] == "tests"
-    assert body["updated_at"] == "2025-10-30T11:47:00+00:00"
+    assert datetime.fromisoformat(body["updated_at"]) == datetime(2025, 10, 30, 11, 47, tzinfo=timezone.utc)
+
+
+def test_metrics_pool_endpoint(monkeypatch):
+    pool = SimpleNamespace(size=lambda: 20, checkedin=lambda: 17, checkedout=lambda: 3, overflow=lambda: -17)
+    client = create_test_client(monkeypatch)
+    client.app.dependency_overrides[get_async_db_engine] = lambda: SimpleNamespace(pool=pool)
+    resp = client.get("/api/v1/metrics/pool")
+    assert resp.status_code == 200
+    assert resp.json() == {"size": 20, "checked_in": 17, "checked_out": 3, "overflow": -17}
 
 
 def test_reports_overview_endpoint(monkeypatch):
@@ -498,6 +577,43 @@ def test_orders_funnel_endpoint(monkeypatch):
     assert resp.json()["stages"][0]["stage"] == "created"
 
 
+def test_analytics_batch_endpoint(monkeypatch):
+    from downloader_qbench_data.api.routers import analytics as analytics_router
+
+    funnel_payload = OrdersFunnelResponse(
+        total_orders=3,
+        stages=[OrdersFunnelStage(stage="created", count=3)],
+    )
+    calls = []
+
+    def fake_funnel(session, **kwargs):
+        calls.append(kwargs)
+        return funnel_payload
+
+    monkeypatch.setitem(
+        analytics_router._BATCH_HANDLERS,
+        "funnel",
+        (fake_funnel, analytics_router._BATCH_HANDLERS["funnel"][1]),
+    )
+    client = create_test_client(monkeypatch)
+    resp = client.post(
+        "/api/v1/analytics/batch",
+        json={"requests": [{"name": "funnel", "params": {"customer_id": 7}}, {"name": "funnel"}]},
+    )
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [item["name"] for item in results] == ["funnel", "funnel"]
+    assert results[0]["data"]["total_orders"] == 3
+    assert calls[0]["customer_id"] == 7
+    assert calls[1]["customer_id"] is None
+
+    bad = client.post(
+        "/api/v1/analytics/batch",
+        json={"requests": [{"name": "funnel", "params": {"unknown": 1}}]},
+    )
+    assert bad.status_code == 422
+
+
 def test_orders_slowest_endpoint(monkeypatch):
     response_payload = OrdersSlowestResponse(
         items=[
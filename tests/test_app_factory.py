@@ -0,0 +1,58 @@
+"""Tests for route registration and dashboard static files in the FastAPI app."""
+
+from __future__ import annotations
+
+import sys
+import warnings
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from downloader_qbench_data.api import main
+
+
+def _client_with_dist(monkeypatch, tmp_path):
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "index.html").write_text("<html>spa</html>", encoding="utf-8")
+    (dist / "vite.svg").write_text("<svg/>", encoding="utf-8")
+    (tmp_path / "secret.txt").write_text("nope", encoding="utf-8")
+    monkeypatch.setattr(main, "_FRONTEND_DIST", dist.resolve())
+    monkeypatch.setattr(main, "_INDEX_PATH", dist.resolve() / "index.html")
+    return TestClient(main.create_app())
+
+
+def test_spa_fallback_serves_cached_index_with_etag(monkeypatch, tmp_path):
+    client = _client_with_dist(monkeypatch, tmp_path)
+
+    resp = client.get("/dashboard/orders/42")
+    assert resp.status_code == 200
+    assert resp.text == "<html>spa</html>"
+    etag = resp.headers["etag"]
+
+    cached = client.get("/dashboard", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_spa_serves_files_inside_dist_only(monkeypatch, tmp_path):
+    client = _client_with_dist(monkeypatch, tmp_path)
+
+    assert client.get("/dashboard/vite.svg").text == "<svg/>"
+    assert client.get("/dashboard/..%2Fsecret.txt").text == "<html>spa</html>"
+
+
+def test_create_app_registers_each_route_once(monkeypatch, tmp_path):
+    client = _client_with_dist(monkeypatch, tmp_path)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        schema = client.app.openapi()
+
+    assert not [w for w in caught if "Duplicate Operation ID" in str(w.message)]
+    assert "/api/v1/analytics/orders/throughput" in schema["paths"]
+    assert "/api/v2/glims/tat/slowest" in schema["paths"]
@@ -0,0 +1,84 @@
+"""Tests for the GLIMS overview summary/activity assembly."""
+
+from __future__ import annotations
+
+import sys
+from collections import namedtuple
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from downloader_qbench_data.api.routers import glims_overview
+
+_Sample = namedtuple("_Sample", "d adult_use_medical c c_active last_updated_at")
+_Reported = namedtuple("_Reported", "d adult_use_medical c tat_hours tat_count")
+_Count = namedtuple("_Count", "d adult_use_medical c")
+
+
+def _rows():
+    samples = [
+        _Sample(date(2025, 1, 1), "Adult Use", 3, 2, date(2025, 1, 2)),
+        _Sample(date(2025, 1, 2), "Medical", 1, 1, date(2025, 1, 3)),
+        _Sample(date(2025, 1, 2), "Adult Use", 1, 0, None),
+    ]
+    reported = [
+        _Reported(date(2025, 1, 2), "Adult Use", 2, 48.0, 2),
+        _Reported(date(2025, 1, 3), "Medical", 1, 72.0, 1),
+    ]
+    # Assay counts followed by the legacy requested_testing counts, as the tests statement returns them
+    tests = [
+        _Count(date(2025, 1, 1), "Adult Use", 5),
+        _Count(date(2025, 1, 2), "Medical", 2),
+        _Count(date(2025, 1, 2), "Unknown", 4),
+    ]
+    return samples, reported, tests
+
+
+def test_summary_and_activity_derive_from_the_same_rows():
+    rows = _rows()
+
+    summary = glims_overview._build_summary(rows, new_customers_count=1, last_sync_at=None)
+    assert summary.samples == 3
+    assert summary.samples_by_type == {"Adult Use": 2, "Medical": 1}
+    assert summary.reports == 3
+    assert summary.tat_by_type == {"Adult Use": 24.0, "Medical": 72.0}
+    assert summary.avg_tat_hours == (24.0 * 2 + 72.0) / 3
+    assert summary.tests == 11
+    assert summary.tests_by_type == {"Adult Use": 5, "Medical": 2, "Unknown": 4}
+    assert summary.last_updated_at == date(2025, 1, 3)
+
+    activity = glims_overview._build_activity(rows, date(2025, 1, 1), date(2025, 1, 3), "daily")
+    assert [point.date for point in activity.points] == [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)]
+    assert [point.samples for point in activity.points] == [3, 2, 0]
+    assert [point.tests for point in activity.points] == [5, 6, 0]
+    assert [point.samples_reported for point in activity.points] == [0, 2, 1]
+    assert activity.points[1].tests_breakdown == {"Medical": 2, "Unknown": 4}
+    assert sum(point.tests for point in activity.points) == summary.tests
+    assert '"tests_breakdown":{"Medical":2,"Unknown":4}' in activity.model_dump_json()
+
+
+def test_activity_points_iterator_matches_response_model():
+    rows = _rows()
+    start, end = date(2025, 1, 1), date(2025, 1, 3)
+
+    body = glims_overview.to_json({"points": glims_overview._iter_activity_points(rows, start, end, "daily")})
+    expected = glims_overview._build_activity(rows, start, end, "daily")
+    assert glims_overview.ActivityResponse.model_validate_json(body) == expected
+
+
+def test_test_events_source_follows_settings(monkeypatch):
+    monkeypatch.setattr(glims_overview, "get_settings", lambda: SimpleNamespace(glims_test_events_view=True))
+    assert "FROM glims_test_events" in glims_overview._test_events_sql()
+
+    monkeypatch.setattr(glims_overview, "get_settings", lambda: SimpleNamespace(glims_test_events_view=False))
+    assert glims_overview._test_events_sql() == glims_overview._ASSAY_UNION_SQL
+
+
+def test_overview_router_registers_each_path_once():
+    paths = [(route.path, tuple(sorted(route.methods))) for route in glims_overview.router.routes]
+    assert len(paths) == len(set(paths))
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from downloader_qbench_data.api.routers import glims_priority
+
+
+def test_excluded_sample_filter_follows_settings(monkeypatch):
+    monkeypatch.setattr(glims_priority, "get_settings", lambda: SimpleNamespace(glims_samples_is_excluded_column=True))
+    assert glims_priority._excluded_sample_sql() == "NOT s.is_excluded"
+
+    # Without the generated column the regex stays, so databases missing the DDL keep working
+    monkeypatch.setattr(glims_priority, "get_settings", lambda: SimpleNamespace(glims_samples_is_excluded_column=False))
+    assert glims_priority._excluded_sample_sql() == "s.sample_id !~ :exclude_pattern"
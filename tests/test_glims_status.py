@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from downloader_qbench_data.api import create_app
+from downloader_qbench_data.api.dependencies import get_async_db_session, require_active_user
+from downloader_qbench_data.api.routers.glims_status import MAX_STATUS_EVENTS_PER_BATCH
+from downloader_qbench_data.api.schemas.glims_status import StatusEventCreate, normalize_status
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    """Pretends only sample S1 exists: returns one inserted row per S1 event."""
+
+    def __init__(self):
+        self.executed = []
+        self.committed = False
+
+    async def execute(self, stmt, params=None):
+        self.executed.append(params)
+        now = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        rows = [
+            SimpleNamespace(
+                id=idx + 1,
+                sample_id=sample_id,
+                status=params["statuses"][idx],
+                changed_at=params["changed_ats"][idx] or now,
+                created_at=now,
+                source=params["sources"][idx],
+                metadata=None,
+            )
+            for idx, sample_id in enumerate(params["sample_ids"])
+            if sample_id == "S1"
+        ]
+        return _FakeResult(rows)
+
+    async def commit(self):
+        self.committed = True
+
+
+def _client(session):
+    app = create_app()
+
+    async def _dummy_session():
+        yield session
+
+    app.dependency_overrides[get_async_db_session] = _dummy_session
+    app.dependency_overrides[require_active_user] = lambda: SimpleNamespace(username="tester")
+    return TestClient(app)
+
+
+def test_normalize_status_ignores_case_and_spacing():
+    assert normalize_status("  sample   received ") == "Sample Received"
+    assert normalize_status("needs metrc upload") == "Needs METRC Upload"
+    assert normalize_status("Shipped") is None
+    assert normalize_status("Reported") == "Reported"
+    assert normalize_status(" GENERATING ") == "Generating"
+
+
+def test_status_event_rejects_unknown_status():
+    assert StatusEventCreate(sample_id=" S1 ", status="REPORTED").status == "Reported"
+    with pytest.raises(ValidationError):
+        StatusEventCreate(sample_id="S1", status="Shipped")
+    with pytest.raises(ValidationError):
+        StatusEventCreate(sample_id="   ", status="Reported")
+
+
+def test_status_events_batch_inserts_in_one_statement_and_reports_unknown_samples():
+    session = _FakeSession()
+    client = _client(session)
+
+    resp = client.post(
+        "/api/v2/glims/status-events/batch",
+        json=[
+            {"sample_id": " S1 ", "status": "reported"},
+            {"sample_id": "S9", "status": "Generating", "metadata": {"row": 4}},
+        ],
+    )
+
+    assert resp.status_code == 201
+    body = resp.json()
+    assert [event["sample_id"] for event in body["events"]] == ["S1"]
+    assert body["events"][0]["status"] == "Reported"
+    assert body["unknown_sample_ids"] == ["S9"]
+    assert len(session.executed) == 1
+    assert session.executed[0]["metadata"] == [None, '{"row": 4}']
+    assert session.committed
+
+
+def test_status_events_batch_is_bounded():
+    client = _client(_FakeSession())
+    events = [{"sample_id": "S1", "status": "Reported"}] * (MAX_STATUS_EVENTS_PER_BATCH + 1)
+    assert client.post("/api/v2/glims/status-events/batch", json=events).status_code == 422
+    assert client.post("/api/v2/glims/status-events/batch", json=[]).status_code == 422
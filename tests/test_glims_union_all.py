@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import inspect
+import re
+
+import pytest
+
+from downloader_qbench_data.api.routers import glims_overview, glims_priority, glims_tat, glims_tests
+
+# Assay rows never repeat across result tables, so a plain UNION would only add a sort/dedup pass
+_PLAIN_UNION = re.compile(r"\bUNION\b(?!\s+ALL\b)")
+
+
+@pytest.mark.parametrize("module", [glims_overview, glims_priority, glims_tat, glims_tests])
+def test_glims_routers_only_use_union_all(module):
+    source = inspect.getsource(module)
+    assert "UNION ALL" in source
+    assert _PLAIN_UNION.findall(source) == []
@@ -0,0 +1,115 @@
+"""Tests for the Redis-backed response cache decorator."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi import FastAPI, Query
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from downloader_qbench_data.api import response_cache
+
+
+class _Payload(BaseModel):
+    value: int
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+def _build_app(monkeypatch, client, version="v1"):
+    calls = []
+
+    async def _version():
+        return version
+
+    monkeypatch.setattr(response_cache, "get_settings", lambda: SimpleNamespace(redis_url="redis://test"))
+    monkeypatch.setattr(response_cache, "get_redis_client", lambda settings: client)
+
+    app = FastAPI()
+
+    @app.get("/probe", response_model=_Payload)
+    @response_cache.cached_response("test", version=_version)
+    def probe(value: int = Query(1)) -> _Payload:
+        calls.append(value)
+        return _Payload(value=value)
+
+    return TestClient(app), calls
+
+
+def test_cached_response_serves_repeat_requests_from_redis(monkeypatch):
+    redis = _FakeRedis()
+    client, calls = _build_app(monkeypatch, redis)
+
+    first = client.get("/probe", params={"value": 3})
+    second = client.get("/probe", params={"value": 3})
+    other = client.get("/probe", params={"value": 4})
+
+    assert first.json() == second.json() == {"value": 3}
+    assert other.json() == {"value": 4}
+    assert calls == [3, 4]
+    assert len(redis.store) == 2
+
+
+def test_cached_response_without_redis_calls_handler(monkeypatch):
+    client, calls = _build_app(monkeypatch, None)
+
+    assert client.get("/probe").json() == {"value": 1}
+    assert client.get("/probe").json() == {"value": 1}
+    assert calls == [1, 1]
+
+
+def test_cached_response_answers_304_until_data_version_changes(monkeypatch):
+    client, calls = _build_app(monkeypatch, None)
+
+    first = client.get("/probe")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"]
+
+    repeat = client.get("/probe", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert calls == [1]
+
+    client, calls = _build_app(monkeypatch, None, version="v2")
+    assert client.get("/probe", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_cached_response_keys_roll_over_with_the_utc_date(monkeypatch):
+    redis = _FakeRedis()
+    client, calls = _build_app(monkeypatch, redis)
+
+    monkeypatch.setattr(response_cache, "_utc_today", lambda: "2025-01-01")
+    etag = client.get("/probe").headers["ETag"]
+    monkeypatch.setattr(response_cache, "_utc_today", lambda: "2025-01-02")
+    assert client.get("/probe", headers={"If-None-Match": etag}).status_code == 200
+    assert calls == [1, 1]
+    assert len(redis.store) == 2
+
+
+def test_glims_hourly_version_appends_the_utc_hour(monkeypatch):
+    async def _version():
+        return "v1"
+
+    monkeypatch.setattr(response_cache, "glims_data_version", _version)
+    version = asyncio.run(response_cache.glims_hourly_version())
+
+    data_version, hour = version.split(":", 1)
+    assert data_version == "v1"
+    assert len(hour) == len("2025-01-01T13")